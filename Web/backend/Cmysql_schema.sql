@@ -44,9 +44,9 @@ CREATE TABLE `GENERATION` (
   `id` INT NOT NULL AUTO_INCREMENT,
   `plant_id` INT DEFAULT NULL,
   `timestamp` DATETIME DEFAULT NULL,
-  `actual_power_mwh` FLOAT DEFAULT NULL COMMENT '실제 발전량 (MWh)',
+  `actual_power` FLOAT DEFAULT NULL COMMENT '실제 발전량 (MWh)',
   PRIMARY KEY (`id`),
-  UNIQUE KEY `_gen_plant_timestamp_uc` (`plant_id`, `timestamp`),
+  UNIQUE KEY `_generation_uc` (`plant_id`, `timestamp`),
   KEY `ix_GENERATION_id` (`id`),
   KEY `ix_GENERATION_timestamp` (`timestamp`),
   CONSTRAINT `GENERATION_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
@@ -60,13 +60,13 @@ DROP TABLE IF EXISTS `FORECAST`;
 CREATE TABLE `FORECAST` (
   `id` INT NOT NULL AUTO_INCREMENT,
   `plant_id` INT DEFAULT NULL,
-  `timestamp` DATETIME DEFAULT NULL,
-  `predicted_power_mwh` FLOAT DEFAULT NULL COMMENT '예측 발전량 (MWh)',
+  `forecast_time` DATETIME DEFAULT NULL,
+  `predicted_power` FLOAT DEFAULT NULL COMMENT '예측 발전량 (MWh)',
   `model_version` VARCHAR(50) DEFAULT NULL COMMENT '모델 버전',
   PRIMARY KEY (`id`),
-  UNIQUE KEY `_fc_plant_ts_ver_uc` (`plant_id`, `timestamp`, `model_version`),
+  UNIQUE KEY `_forecast_uc` (`plant_id`, `forecast_time`, `model_version`),
   KEY `ix_FORECAST_id` (`id`),
-  KEY `ix_FORECAST_timestamp` (`timestamp`),
+  KEY `ix_FORECAST_forecast_time` (`forecast_time`),
   CONSTRAINT `FORECAST_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
@@ -78,12 +78,201 @@ DROP TABLE IF EXISTS `DAILY_FORECAST`;
 CREATE TABLE `DAILY_FORECAST` (
   `id` INT NOT NULL AUTO_INCREMENT,
   `plant_id` INT DEFAULT NULL,
-  `date` DATE DEFAULT NULL,
-  `total_predicted_power_mwh` FLOAT DEFAULT NULL COMMENT '하루 총 예측 발전량 (MWh)',
+  `forecast_date` DATE DEFAULT NULL,
+  `total_power` FLOAT DEFAULT NULL COMMENT '하루 총 예측 발전량 (MWh)',
   `model_version` VARCHAR(50) DEFAULT NULL,
   PRIMARY KEY (`id`),
-  UNIQUE KEY `_dfc_plant_date_ver_uc` (`plant_id`, `date`, `model_version`),
-  KEY `ix_DAILY_FORECAST_date` (`date`),
+  UNIQUE KEY `_daily_forecast_uc` (`plant_id`, `forecast_date`, `model_version`),
+  KEY `ix_DAILY_FORECAST_forecast_date` (`forecast_date`),
   KEY `ix_DAILY_FORECAST_id` (`id`),
   CONSTRAINT `DAILY_FORECAST_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- REALTIME_GENERATION (실시간 예측 + 당일 누적)
+-- ===============================
+DROP TABLE IF EXISTS `REALTIME_GENERATION`;
+CREATE TABLE `REALTIME_GENERATION` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `plant_id` INT DEFAULT NULL,
+  `timestamp` DATETIME DEFAULT NULL COMMENT '매 정시',
+  `predicted_power` FLOAT DEFAULT NULL COMMENT '해당 시간 예측',
+  `cumulative_power` FLOAT DEFAULT NULL COMMENT '당일 누적',
+  `model_version` VARCHAR(50) DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_realtime_generation_uc` (`plant_id`, `timestamp`, `model_version`),
+  KEY `ix_REALTIME_GENERATION_id` (`id`),
+  KEY `ix_REALTIME_GENERATION_timestamp` (`timestamp`),
+  CONSTRAINT `REALTIME_GENERATION_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- REALTIME_GENERATION_DAILY (보관 기간이 지난 실시간 기록의 일별 집계)
+-- ===============================
+DROP TABLE IF EXISTS `REALTIME_GENERATION_DAILY`;
+CREATE TABLE `REALTIME_GENERATION_DAILY` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `plant_id` INT DEFAULT NULL,
+  `date` DATE DEFAULT NULL,
+  `total_power` FLOAT DEFAULT NULL COMMENT '일 합계',
+  `peak_power` FLOAT DEFAULT NULL COMMENT '시간 최대',
+  `hours` INT DEFAULT NULL COMMENT '집계된 시간 행 수',
+  `model_version` VARCHAR(50) DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_realtime_generation_daily_uc` (`plant_id`, `date`, `model_version`),
+  KEY `ix_REALTIME_GENERATION_DAILY_id` (`id`),
+  KEY `ix_REALTIME_GENERATION_DAILY_date` (`date`),
+  CONSTRAINT `REALTIME_GENERATION_DAILY_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- REALTIME_GENERATION_MONTHLY (보관 기간이 지난 일별 집계의 월별 집계)
+-- ===============================
+DROP TABLE IF EXISTS `REALTIME_GENERATION_MONTHLY`;
+CREATE TABLE `REALTIME_GENERATION_MONTHLY` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `plant_id` INT DEFAULT NULL,
+  `month` DATE DEFAULT NULL COMMENT '해당 월 1일',
+  `total_power` FLOAT DEFAULT NULL,
+  `peak_power` FLOAT DEFAULT NULL,
+  `hours` INT DEFAULT NULL,
+  `model_version` VARCHAR(50) DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_realtime_generation_monthly_uc` (`plant_id`, `month`, `model_version`),
+  KEY `ix_REALTIME_GENERATION_MONTHLY_id` (`id`),
+  KEY `ix_REALTIME_GENERATION_MONTHLY_month` (`month`),
+  CONSTRAINT `REALTIME_GENERATION_MONTHLY_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- GENERATION_DAILY (실제 발전량 일별 집계)
+-- ===============================
+DROP TABLE IF EXISTS `GENERATION_DAILY`;
+CREATE TABLE `GENERATION_DAILY` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `plant_id` INT DEFAULT NULL,
+  `bucket_start` DATE DEFAULT NULL COMMENT '해당 일',
+  `total_power` FLOAT DEFAULT NULL,
+  `min_power` FLOAT DEFAULT NULL,
+  `max_power` FLOAT DEFAULT NULL,
+  `count` INT DEFAULT NULL COMMENT '집계된 GENERATION 행 수',
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_generation_daily_uc` (`plant_id`, `bucket_start`),
+  KEY `ix_GENERATION_DAILY_id` (`id`),
+  KEY `ix_GENERATION_DAILY_bucket_start` (`bucket_start`),
+  CONSTRAINT `GENERATION_DAILY_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- GENERATION_WEEKLY (실제 발전량 주별 집계)
+-- ===============================
+DROP TABLE IF EXISTS `GENERATION_WEEKLY`;
+CREATE TABLE `GENERATION_WEEKLY` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `plant_id` INT DEFAULT NULL,
+  `bucket_start` DATE DEFAULT NULL COMMENT '해당 주 월요일',
+  `total_power` FLOAT DEFAULT NULL,
+  `min_power` FLOAT DEFAULT NULL,
+  `max_power` FLOAT DEFAULT NULL,
+  `count` INT DEFAULT NULL COMMENT '집계된 GENERATION 행 수',
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_generation_weekly_uc` (`plant_id`, `bucket_start`),
+  KEY `ix_GENERATION_WEEKLY_id` (`id`),
+  KEY `ix_GENERATION_WEEKLY_bucket_start` (`bucket_start`),
+  CONSTRAINT `GENERATION_WEEKLY_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- GENERATION_MONTHLY (실제 발전량 월별 집계)
+-- ===============================
+DROP TABLE IF EXISTS `GENERATION_MONTHLY`;
+CREATE TABLE `GENERATION_MONTHLY` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `plant_id` INT DEFAULT NULL,
+  `bucket_start` DATE DEFAULT NULL COMMENT '해당 월 1일',
+  `total_power` FLOAT DEFAULT NULL,
+  `min_power` FLOAT DEFAULT NULL,
+  `max_power` FLOAT DEFAULT NULL,
+  `count` INT DEFAULT NULL COMMENT '집계된 GENERATION 행 수',
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_generation_monthly_uc` (`plant_id`, `bucket_start`),
+  KEY `ix_GENERATION_MONTHLY_id` (`id`),
+  KEY `ix_GENERATION_MONTHLY_bucket_start` (`bucket_start`),
+  CONSTRAINT `GENERATION_MONTHLY_ibfk_1` FOREIGN KEY (`plant_id`) REFERENCES `PLANT` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- WEATHER_INPUT (외부 API 관측/예보 원본 보관, 격자 단위)
+--   값은 조회한 단위 그대로 (kma_fcst cloud: 0~10 / kma_obs cloud: %)
+-- ===============================
+DROP TABLE IF EXISTS `WEATHER_INPUT`;
+CREATE TABLE `WEATHER_INPUT` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `source` VARCHAR(16) DEFAULT NULL COMMENT 'kma_fcst | kma_obs | kma_ufcst | openmeteo | openmeteo_now',
+  `grid` VARCHAR(32) DEFAULT NULL COMMENT '기상청 nx,ny / Open-Meteo lat,lon',
+  `base_time` DATETIME DEFAULT NULL COMMENT '발표 시각 (Open-Meteo 는 조회 시각)',
+  `forecast_time` DATETIME DEFAULT NULL COMMENT '대상 시각 (관측은 base_time 과 같음)',
+  `temperature` FLOAT DEFAULT NULL,
+  `humidity` FLOAT DEFAULT NULL,
+  `cloud` FLOAT DEFAULT NULL,
+  `insolation` FLOAT DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_weather_input_uc` (`source`, `grid`, `base_time`, `forecast_time`),
+  KEY `ix_WEATHER_INPUT_id` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- JOB_CHECKPOINT (스케줄러 Job 진행 상황)
+--   발전소 id 순 청크 커밋마다 마지막 발전소 기록 → 같은 회차 재실행 시 이어서 처리
+-- ===============================
+DROP TABLE IF EXISTS `JOB_CHECKPOINT`;
+CREATE TABLE `JOB_CHECKPOINT` (
+  `id` INT NOT NULL AUTO_INCREMENT,
+  `job` VARCHAR(32) DEFAULT NULL,
+  `run_key` VARCHAR(32) DEFAULT NULL COMMENT 'Job 회차 식별자 (3일 예측: 날짜)',
+  `last_plant_id` INT DEFAULT NULL COMMENT '마지막으로 커밋한 청크의 마지막 발전소',
+  `failed_plant_ids` TEXT DEFAULT NULL COMMENT '재개 시 다시 처리할 발전소 (쉼표 구분)',
+  `status` VARCHAR(16) DEFAULT NULL COMMENT 'running | partial | done',
+  `updated_at` DATETIME DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `_job_checkpoint_uc` (`job`, `run_key`),
+  KEY `ix_JOB_CHECKPOINT_id` (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+
+-- ===============================
+-- (선택) 월 단위 RANGE 파티션 — PARTITIONING_ENABLED=1 로 운영할 때만
+--   python create_tables.py --partition 과 같은 변환 (데이터가 있으면 그쪽을 권장: 가장 오래된 달부터 자동 생성)
+--   파티션 테이블은 FK 를 지원하지 않고, PK/UNIQUE 에 파티션 컬럼이 들어가야 함
+--   이후 월 파티션은 partition_maintenance_job 이 PARTITION_MONTHS_AHEAD 개월 앞까지 추가
+--   FORECAST / GENERATION 은 *_RETENTION_DAYS 를 설정해야만 지난 파티션을 삭제함 (기본: 삭제 안 함)
+--   아래 p202601 은 첫 달 예시 → 적용 시 시작 월로 바꿔서 실행
+-- ===============================
+-- ALTER TABLE `FORECAST` DROP FOREIGN KEY `FORECAST_ibfk_1`;
+-- ALTER TABLE `FORECAST` MODIFY `forecast_time` DATETIME NOT NULL, DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `forecast_time`);
+-- ALTER TABLE `FORECAST` PARTITION BY RANGE (TO_DAYS(`forecast_time`)) (
+--   PARTITION p202601 VALUES LESS THAN (TO_DAYS('2026-02-01')),
+--   PARTITION pmax VALUES LESS THAN MAXVALUE
+-- );
+--
+-- ALTER TABLE `REALTIME_GENERATION` DROP FOREIGN KEY `REALTIME_GENERATION_ibfk_1`;
+-- ALTER TABLE `REALTIME_GENERATION` MODIFY `timestamp` DATETIME NOT NULL, DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `timestamp`);
+-- ALTER TABLE `REALTIME_GENERATION` PARTITION BY RANGE (TO_DAYS(`timestamp`)) (
+--   PARTITION p202601 VALUES LESS THAN (TO_DAYS('2026-02-01')),
+--   PARTITION pmax VALUES LESS THAN MAXVALUE
+-- );
+--
+-- ALTER TABLE `GENERATION` DROP FOREIGN KEY `GENERATION_ibfk_1`;
+-- ALTER TABLE `GENERATION` MODIFY `timestamp` DATETIME NOT NULL, DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `timestamp`);
+-- ALTER TABLE `GENERATION` PARTITION BY RANGE (TO_DAYS(`timestamp`)) (
+--   PARTITION p202601 VALUES LESS THAN (TO_DAYS('2026-02-01')),
+--   PARTITION pmax VALUES LESS THAN MAXVALUE
+-- );
@@ -1,17 +1,26 @@
 ﻿from datetime import datetime, date, timedelta
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, func
 from sqlalchemy.exc import IntegrityError
 
 # models 파일 경로에 맞게 수정 (같은 폴더면 .models)
 from .models import (
     Plant,
     Weather,
+    WeatherInput,
+    Generation,
+    GenerationDaily,
+    GenerationWeekly,
+    GenerationMonthly,
     Forecast,
     DailyForecast,
     RealtimeGeneration,
+    RealtimeGenerationDaily,
+    RealtimeGenerationMonthly,
+    JobCheckpoint,
 )
+from .sevices.solar_position import hourly_daylight
 
 # ----------------------------------------------------
 # 🌱 PLANT CRUD
@@ -44,10 +53,43 @@ def get_weather_history(
     plant_id: int,
     start_time: datetime,
     end_time: datetime,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
 ) -> List[Weather]:
-    """특정 기간의 날씨 기록 조회"""
+    """
+    특정 기간의 날씨 기록 조회.
+    after/limit: (plant_id, timestamp) 키셋 페이지네이션 — after 이후 시각부터 limit 행
+    """
+    query = db.query(Weather).filter(
+        Weather.plant_id == plant_id,
+        Weather.timestamp >= start_time,
+        Weather.timestamp <= end_time,
+    )
+    if after is not None:
+        query = query.filter(Weather.timestamp > after)
+    query = query.order_by(Weather.timestamp.asc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def get_weather_series(
+    db: Session,
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+) -> list:
+    """다운샘플링용 경량 조회 (ORM 객체 대신 컬럼 튜플)"""
     return (
-        db.query(Weather)
+        db.query(
+            Weather.id,
+            Weather.plant_id,
+            Weather.timestamp,
+            Weather.temperature,
+            Weather.insolation,
+            Weather.humidity,
+            Weather.cloud_cover,
+        )
         .filter(
             Weather.plant_id == plant_id,
             Weather.timestamp >= start_time,
@@ -58,22 +100,205 @@ def get_weather_history(
     )
 
 
+def upsert_weather(
+    db: Session,
+    plant_id: int,
+    timestamp: datetime,
+    temperature: Optional[float],
+    insolation: Optional[float],
+    humidity: Optional[float],
+    cloud_cover: Optional[float],
+):
+    """발전소의 시간별 관측 날씨 저장 (같은 시각이 있으면 UPDATE)"""
+    existing = db.query(Weather).filter(
+        Weather.plant_id == plant_id,
+        Weather.timestamp == timestamp,
+    ).first()
+
+    if existing:
+        existing.temperature = temperature
+        existing.insolation = insolation
+        existing.humidity = humidity
+        existing.cloud_cover = cloud_cover
+    else:
+        db.add(Weather(
+            plant_id=plant_id,
+            timestamp=timestamp,
+            temperature=temperature,
+            insolation=insolation,
+            humidity=humidity,
+            cloud_cover=cloud_cover,
+        ))
+
+
+def upsert_weathers(db: Session, rows: List[dict]) -> int:
+    """WEATHER 다중 행 UPSERT (_weather_uc 기준, 실시간 Job 의 발전소 전체 저장용)"""
+    if not rows:
+        return 0
+    _upsert_rows(
+        db, Weather.__table__, rows, ["plant_id", "timestamp"],
+        ["temperature", "insolation", "humidity", "cloud_cover"],
+    )
+    return len(rows)
+
+
+def get_context_rows(db: Session, since: datetime, model_version: str = "realtime-nhits-v1"):
+    """
+    모델 컨텍스트 버퍼 초기화용: since 이후 모든 발전소의
+    (plant_id, timestamp, 발전량, 일사량, 기온, 운량, 습도) 튜플을 한 번에 조회
+    """
+    return (
+        db.query(
+            RealtimeGeneration.plant_id,
+            RealtimeGeneration.timestamp,
+            RealtimeGeneration.predicted_power,
+            Weather.insolation,
+            Weather.temperature,
+            Weather.cloud_cover,
+            Weather.humidity,
+        )
+        .outerjoin(
+            Weather,
+            (Weather.plant_id == RealtimeGeneration.plant_id)
+            & (Weather.timestamp == RealtimeGeneration.timestamp),
+        )
+        .filter(
+            RealtimeGeneration.timestamp >= since,
+            RealtimeGeneration.model_version == model_version,
+        )
+        .order_by(RealtimeGeneration.timestamp.asc())
+        .all()
+    )
+
+
+# ----------------------------------------------------
+# 🗃 WEATHER INPUT CRUD (외부 API 입력 보관)
+# ----------------------------------------------------
+WEATHER_INPUT_VALUES = ["temperature", "humidity", "cloud", "insolation"]
+
+
+def upsert_weather_inputs(db: Session, rows: List[dict]) -> int:
+    """조회한 관측/예보 입력을 (source, grid, base_time, forecast_time) 기준으로 일괄 UPSERT"""
+    if not rows:
+        return 0
+    _upsert_rows(
+        db, WeatherInput.__table__, rows,
+        ["source", "grid", "base_time", "forecast_time"],
+        WEATHER_INPUT_VALUES,
+    )
+    return len(rows)
+
+
+def get_weather_inputs(
+    db: Session,
+    source: str,
+    grid: str,
+    base_time: datetime,
+) -> List[WeatherInput]:
+    """특정 격자/발표 시각의 보관 입력 (대상 시각순)"""
+    return (
+        db.query(WeatherInput)
+        .filter(
+            WeatherInput.source == source,
+            WeatherInput.grid == grid,
+            WeatherInput.base_time == base_time,
+        )
+        .order_by(WeatherInput.forecast_time.asc())
+        .all()
+    )
+
+
+def get_latest_weather_input_base_time(
+    db: Session,
+    source: str,
+    grid: str,
+    at_or_before: datetime,
+) -> Optional[datetime]:
+    """at_or_before 시점에 사용할 수 있었던 가장 최근 발표 시각"""
+    return db.query(func.max(WeatherInput.base_time)).filter(
+        WeatherInput.source == source,
+        WeatherInput.grid == grid,
+        WeatherInput.base_time <= at_or_before,
+    ).scalar()
+
+
+def get_weather_inputs_between(
+    db: Session,
+    source: str,
+    grids: Iterable[str],
+    base_from: datetime,
+    base_to: datetime,
+) -> list:
+    """여러 격자의 발표 시각 범위 보관 입력 (백필용 일괄 조회, 컬럼 튜플)"""
+    return (
+        db.query(
+            WeatherInput.grid,
+            WeatherInput.base_time,
+            WeatherInput.forecast_time,
+            WeatherInput.temperature,
+            WeatherInput.humidity,
+            WeatherInput.cloud,
+            WeatherInput.insolation,
+        )
+        .filter(
+            WeatherInput.source == source,
+            WeatherInput.grid.in_(list(grids)),
+            WeatherInput.base_time >= base_from,
+            WeatherInput.base_time <= base_to,
+        )
+        .order_by(WeatherInput.grid, WeatherInput.base_time, WeatherInput.forecast_time)
+        .all()
+    )
+
+
+# ----------------------------------------------------
+# 🧭 JOB CHECKPOINT CRUD (스케줄러 Job 청크 진행 상황)
+# ----------------------------------------------------
+def get_job_checkpoint(db: Session, job: str, run_key: str) -> Optional[JobCheckpoint]:
+    return db.query(JobCheckpoint).filter(
+        JobCheckpoint.job == job,
+        JobCheckpoint.run_key == run_key,
+    ).first()
+
+
+def save_job_checkpoint(
+    db: Session,
+    job: str,
+    run_key: str,
+    last_plant_id: Optional[int],
+    status: str = "running",
+    failed_plant_ids: Iterable[int] = (),
+):
+    """Job 회차의 진행 상황 기록 (커밋은 청크 저장과 함께 호출하는 쪽에서 수행)"""
+    checkpoint = get_job_checkpoint(db, job, run_key)
+    if checkpoint is None:
+        checkpoint = JobCheckpoint(job=job, run_key=run_key)
+        db.add(checkpoint)
+    checkpoint.last_plant_id = last_plant_id
+    checkpoint.failed_plant_ids = ",".join(str(i) for i in sorted(failed_plant_ids)) or None
+    checkpoint.status = status
+    checkpoint.updated_at = datetime.now()
+
+
+def checkpoint_failed_ids(checkpoint: JobCheckpoint) -> set:
+    return {int(i) for i in (checkpoint.failed_plant_ids or "").split(",") if i}
+
+
 # ----------------------------------------------------
 # ⚡ REALTIME GENERATION CRUD
 # ----------------------------------------------------
 def get_latest_realtime_generation(
-    db: Session, plant_id: int
+    db: Session, plant_id: int, before: Optional[datetime] = None
 ) -> Optional[RealtimeGeneration]:
     """
     가장 최근에 저장된 실시간 발전량 데이터를 조회.
     (누적 발전량 계산 시 직전 데이터를 찾기 위해 사용)
+    before 지정 시 그 시각 이전 기록 중 가장 최근 것.
     """
-    return (
-        db.query(RealtimeGeneration)
-        .filter(RealtimeGeneration.plant_id == plant_id)
-        .order_by(RealtimeGeneration.timestamp.desc())
-        .first()
-    )
+    query = db.query(RealtimeGeneration).filter(RealtimeGeneration.plant_id == plant_id)
+    if before is not None:
+        query = query.filter(RealtimeGeneration.timestamp < before)
+    return query.order_by(RealtimeGeneration.timestamp.desc()).first()
 
 
 def insert_realtime_generation(
@@ -113,6 +338,377 @@ def insert_realtime_generation(
         db.add(new_obj)
 
 
+def get_today_cumulative(
+    db: Session,
+    plant_ids: List[int],
+    before: datetime,
+    model_version: str = "realtime-nhits-v1",
+) -> Dict[int, float]:
+    """
+    여러 발전소의 '오늘(before 가 속한 날) 0시 ~ before 미만' 마지막 누적 발전량을 한 번에 조회.
+    오늘 기록이 없는 발전소는 결과에 없음 (누적 0부터 시작).
+    """
+    if not plant_ids:
+        return {}
+
+    day_start = datetime.combine(before.date(), datetime.min.time())
+    latest = (
+        db.query(
+            RealtimeGeneration.plant_id.label("plant_id"),
+            func.max(RealtimeGeneration.timestamp).label("timestamp"),
+        )
+        .filter(
+            RealtimeGeneration.plant_id.in_(plant_ids),
+            RealtimeGeneration.model_version == model_version,
+            RealtimeGeneration.timestamp >= day_start,
+            RealtimeGeneration.timestamp < before,
+        )
+        .group_by(RealtimeGeneration.plant_id)
+        .subquery()
+    )
+    rows = (
+        db.query(RealtimeGeneration.plant_id, RealtimeGeneration.cumulative_power)
+        .join(
+            latest,
+            (RealtimeGeneration.plant_id == latest.c.plant_id)
+            & (RealtimeGeneration.timestamp == latest.c.timestamp),
+        )
+        .filter(RealtimeGeneration.model_version == model_version)
+        .all()
+    )
+    return {plant_id: cumulative for plant_id, cumulative in rows}
+
+
+def upsert_realtime_generations(db: Session, rows: List[dict]) -> int:
+    """REALTIME_GENERATION 다중 행 UPSERT (_realtime_generation_uc 기준, 재실행 시 덮어씀)"""
+    if not rows:
+        return 0
+    _upsert_rows(
+        db, RealtimeGeneration.__table__, rows, ["plant_id", "timestamp", "model_version"],
+        ["predicted_power", "cumulative_power"],
+    )
+    return len(rows)
+
+
+def fill_realtime_generations(
+    rows: List[RealtimeGeneration],
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    latitude: Optional[float],
+    longitude: Optional[float],
+    model_version: str = "realtime-nhits-v1",
+) -> List[dict]:
+    """
+    start_time ~ end_time(미포함) 시간별 목록으로 반환.
+    Job 이 건너뛴 밤 시각은 발전량 0, 누적은 직전 값 유지로 채우고
+    낮인데 기록이 없는 시각(실행 실패 등 데이터 누락)은 None 으로 둠
+    """
+    by_time = {r.timestamp: r for r in rows}
+    daylight = hourly_daylight(latitude, longitude, start_time, end_time)
+    filled = []
+    cumulative = 0.0
+    ts = start_time
+    for is_day in daylight:
+        r = by_time.get(ts)
+        if r:
+            cumulative = r.cumulative_power
+            power, cum = r.predicted_power, cumulative
+        elif is_day:
+            power, cum = None, None
+        else:
+            power, cum = 0.0, cumulative
+        filled.append({
+            "id": r.id if r else None,
+            "plant_id": plant_id,
+            "timestamp": ts,
+            "predicted_power": power,
+            "cumulative_power": cum,
+            "model_version": r.model_version if r else model_version,
+        })
+        ts += timedelta(hours=1)
+    return filled
+
+
+# ----------------------------------------------------
+# ⚡ GENERATION CRUD (실제 발전량 + 일/주/월 롤업)
+# ----------------------------------------------------
+GENERATION_ROLLUPS = {
+    "day": GenerationDaily,
+    "week": GenerationWeekly,
+    "month": GenerationMonthly,
+}
+
+
+def get_latest_generation(db: Session, plant_id: int) -> Optional[Generation]:
+    """특정 발전소의 가장 최근 실제 발전량 조회"""
+    return (
+        db.query(Generation)
+        .filter(Generation.plant_id == plant_id)
+        .order_by(Generation.timestamp.desc())
+        .first()
+    )
+
+
+def get_generation_history(
+    db: Session,
+    plant_id: int,
+    start: datetime,
+    end: datetime,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> List[Generation]:
+    """
+    특정 발전소의 기간별 실제 발전량 조회.
+    after/limit: (plant_id, timestamp) 키셋 페이지네이션 — after 이후 시각부터 limit 행
+    """
+    query = db.query(Generation).filter(
+        Generation.plant_id == plant_id,
+        Generation.timestamp >= start,
+        Generation.timestamp <= end,
+    )
+    if after is not None:
+        query = query.filter(Generation.timestamp > after)
+    query = query.order_by(Generation.timestamp.asc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
+def get_generation_series(
+    db: Session,
+    plant_id: int,
+    start: datetime,
+    end: datetime,
+) -> list:
+    """다운샘플링용 경량 조회 (ORM 객체 대신 컬럼 튜플)"""
+    return (
+        db.query(
+            Generation.id,
+            Generation.plant_id,
+            Generation.timestamp,
+            Generation.actual_power,
+        )
+        .filter(
+            Generation.plant_id == plant_id,
+            Generation.timestamp >= start,
+            Generation.timestamp <= end,
+        )
+        .order_by(Generation.timestamp.asc())
+        .all()
+    )
+
+
+def lock_plants(db: Session, plant_ids: Iterable[int]):
+    """
+    발전소 행을 id 순으로 잠금 (SELECT ... FOR UPDATE, 커밋/롤백 시 해제).
+    같은 발전소의 GENERATION 을 고치고 롤업을 재계산하는 트랜잭션끼리 순서대로 실행되게 함
+    """
+    db.query(Plant.id).filter(Plant.id.in_(set(plant_ids))).order_by(Plant.id.asc()).with_for_update().all()
+
+
+def get_generation_values(
+    db: Session,
+    keys: Iterable[Tuple[int, datetime]],
+    locked: bool = False,
+) -> Dict[Tuple[int, datetime], Optional[float]]:
+    """
+    (plant_id, timestamp) 키 중 이미 저장된 행의 발전량 (한 번의 범위 조회).
+    locked=True: 잠금 읽기 (트랜잭션 스냅샷이 아니라 최신 커밋 값)
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+
+    plant_ids = {k[0] for k in keys}
+    times = [k[1] for k in keys]
+    rows = db.query(
+        Generation.plant_id, Generation.timestamp, Generation.actual_power
+    ).filter(
+        Generation.plant_id.in_(plant_ids),
+        Generation.timestamp >= min(times),
+        Generation.timestamp <= max(times),
+    )
+    if locked:
+        rows = rows.with_for_update(read=True)
+    return {
+        (plant_id, ts): power
+        for plant_id, ts, power in rows
+        if (plant_id, ts) in keys
+    }
+
+
+def _upsert_rows(db: Session, table, rows: List[dict], keys: List[str], update_columns: List[str]):
+    """
+    다중 행 UPSERT (키 충돌 시 update_columns 갱신).
+    MySQL: INSERT ... ON DUPLICATE KEY UPDATE / SQLite·PostgreSQL: ON CONFLICT DO UPDATE
+    """
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(table)
+        stmt = stmt.on_duplicate_key_update({c: stmt.inserted[c] for c in update_columns})
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=keys,
+            set_={c: stmt.excluded[c] for c in update_columns},
+        )
+
+    db.execute(stmt, rows)
+
+
+def upsert_generations(db: Session, rows: List[dict]) -> int:
+    """GENERATION 다중 행 UPSERT (_generation_uc 기준, 있으면 actual_power 갱신)"""
+    if not rows:
+        return 0
+    _upsert_rows(db, Generation.__table__, rows, ["plant_id", "timestamp"], ["actual_power"])
+    return len(rows)
+
+
+def bucket_start(bucket: str, day: date) -> date:
+    """날짜가 속한 롤업 구간의 시작일 (주: 월요일, 월: 1일)"""
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _next_bucket(bucket: str, start: date) -> date:
+    if bucket == "week":
+        return start + timedelta(days=7)
+    if bucket == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def apply_generation_rollups(
+    db: Session,
+    rows: Iterable[Tuple[int, datetime, float]],
+    buckets: Iterable[str] = tuple(GENERATION_ROLLUPS),
+) -> int:
+    """
+    새로 들어온 발전량 행 (plant_id, timestamp, actual_power) 을 일/주/월 롤업에 누적.
+    - 배치 안에서 먼저 구간별로 합친 뒤, 구간마다 기존 롤업 행을 한 번에 읽어 병합
+    - 이미 집계된 행을 다시 넘기면 중복 집계되므로 신규 행만 넘길 것
+      (기존 값이 바뀐 경우는 rebuild_generation_rollups 로 재계산)
+    반환: 갱신/생성된 롤업 행 수
+    """
+    batch: Dict[str, Dict[Tuple[int, date], List[float]]] = {b: {} for b in buckets}
+    for plant_id, ts, power in rows:
+        if power is None:
+            continue
+        day = ts.date()
+        for bucket, acc in batch.items():
+            key = (plant_id, bucket_start(bucket, day))
+            agg = acc.get(key)
+            if agg is None:
+                acc[key] = [power, power, power, 1]
+            else:
+                agg[0] += power
+                agg[1] = min(agg[1], power)
+                agg[2] = max(agg[2], power)
+                agg[3] += 1
+
+    touched = 0
+    for bucket, acc in batch.items():
+        if not acc:
+            continue
+        model = GENERATION_ROLLUPS[bucket]
+        plant_ids = {k[0] for k in acc}
+        starts = {k[1] for k in acc}
+
+        existing = {
+            (r.plant_id, r.bucket_start): r
+            for r in db.query(model).filter(
+                model.plant_id.in_(plant_ids),
+                model.bucket_start.in_(starts),
+            )
+        }
+
+        for (plant_id, start), (total, low, high, count) in acc.items():
+            row = existing.get((plant_id, start))
+            if row:
+                row.total_power = (row.total_power or 0.0) + total
+                row.min_power = low if row.min_power is None else min(row.min_power, low)
+                row.max_power = high if row.max_power is None else max(row.max_power, high)
+                row.count = (row.count or 0) + count
+            else:
+                db.add(model(
+                    plant_id=plant_id,
+                    bucket_start=start,
+                    total_power=total,
+                    min_power=low,
+                    max_power=high,
+                    count=count,
+                ))
+            touched += 1
+
+    return touched
+
+
+def rebuild_generation_rollups(db: Session, plant_ids: Iterable[int], start: date, end: date) -> int:
+    """
+    [start, end] 날짜를 포함하는 모든 롤업 구간을 원본 GENERATION 에서 다시 계산.
+    수집(ingest)이 건드린 구간, 기존 값이 수정된 경우(min/max 는 증분으로 되돌릴 수 없음), 최초 백필에 사용.
+    원본은 잠금 읽기로 읽어 다른 트랜잭션이 방금 커밋한 행까지 포함 (결과는 몇 번을 실행해도 같음)
+    """
+    plant_ids = list(plant_ids)
+    if not plant_ids:
+        return 0
+
+    touched = 0
+    for bucket, model in GENERATION_ROLLUPS.items():
+        first = bucket_start(bucket, start)
+        last = _next_bucket(bucket, bucket_start(bucket, end))
+
+        db.query(model).filter(
+            model.plant_id.in_(plant_ids),
+            model.bucket_start >= first,
+            model.bucket_start < last,
+        ).delete(synchronize_session=False)
+
+        raw = db.query(
+            Generation.plant_id, Generation.timestamp, Generation.actual_power
+        ).filter(
+            Generation.plant_id.in_(plant_ids),
+            Generation.timestamp >= datetime.combine(first, datetime.min.time()),
+            Generation.timestamp < datetime.combine(last, datetime.min.time()),
+        ).with_for_update(read=True)
+
+        db.flush()
+        touched += apply_generation_rollups(db, raw, buckets=(bucket,))
+
+    return touched
+
+
+def get_generation_aggregates(
+    db: Session,
+    plant_id: int,
+    bucket: str,
+    start: date,
+    end: date
+) -> list:
+    """롤업 테이블에서 기간별 집계 조회 (start 가 속한 구간부터 end 까지)"""
+    model = GENERATION_ROLLUPS[bucket]
+    return (
+        db.query(model)
+        .filter(
+            model.plant_id == plant_id,
+            model.bucket_start >= bucket_start(bucket, start),
+            model.bucket_start <= end,
+        )
+        .order_by(model.bucket_start.asc())
+        .all()
+    )
+
+
 # ----------------------------------------------------
 # 🔮 FORECAST CRUD (시간별 예측 - 3일치)
 # ----------------------------------------------------
@@ -136,6 +732,28 @@ def get_forecasts(
     return query.order_by(Forecast.forecast_time.asc()).all()
 
 
+def get_forecast_values(
+    db: Session,
+    plant_ids: List[int],
+    start_time: datetime,
+    end_time: datetime,
+    model_version: str = "nhits-v1",
+) -> list:
+    """여러 발전소의 기간 내 시간별 예측 (plant_id, forecast_time, predicted_power) 튜플 (나우캐스트 기준선 복원용)"""
+    if not plant_ids:
+        return []
+    return (
+        db.query(Forecast.plant_id, Forecast.forecast_time, Forecast.predicted_power)
+        .filter(
+            Forecast.plant_id.in_(plant_ids),
+            Forecast.forecast_time >= start_time,
+            Forecast.forecast_time <= end_time,
+            Forecast.model_version == model_version,
+        )
+        .all()
+    )
+
+
 def insert_hourly_forecast(
     db: Session,
     plant_id: int,
@@ -154,6 +772,33 @@ def insert_hourly_forecast(
     )
 
 
+def bulk_insert_hourly_forecasts(
+    db: Session,
+    plant_id: int,
+    forecast_times,
+    predicted_powers,
+    model_version: str,
+):
+    """시간별 예측 여러 건을 한 번의 INSERT(executemany)로 저장 (컬럼 배열 입력)"""
+    if not len(forecast_times):
+        return
+
+    times = forecast_times.astype("datetime64[us]").tolist()
+    powers = predicted_powers.tolist()
+    db.execute(
+        Forecast.__table__.insert(),
+        [
+            {
+                "plant_id": plant_id,
+                "forecast_time": t,
+                "predicted_power": p,
+                "model_version": model_version,
+            }
+            for t, p in zip(times, powers)
+        ],
+    )
+
+
 def delete_future_forecasts(
     db: Session,
     plant_id: int,
@@ -191,6 +836,36 @@ def delete_forecasts_by_date_range(
     ).delete(synchronize_session=False)
 
 
+def fill_hourly_forecasts(
+    rows: List[Forecast],
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    model_version: str,
+    latitude: Optional[float],
+    longitude: Optional[float],
+) -> List[dict]:
+    """
+    start_time ~ end_time(미포함) 전체 시간별 목록으로 반환.
+    저장하지 않은 밤 시각은 예측 0, 낮인데 예측이 없는 시각(예측 시작 전 등)은 None
+    """
+    by_time = {r.forecast_time: r for r in rows}
+    daylight = hourly_daylight(latitude, longitude, start_time, end_time)
+    filled = []
+    ts = start_time
+    for is_day in daylight:
+        r = by_time.get(ts)
+        filled.append({
+            "id": r.id if r else None,
+            "plant_id": plant_id,
+            "forecast_time": ts,
+            "predicted_power": r.predicted_power if r else (None if is_day else 0.0),
+            "model_version": model_version,
+        })
+        ts += timedelta(hours=1)
+    return filled
+
+
 # ----------------------------------------------------
 # 📅 DAILY FORECAST CRUD (일별 예측 - 3일치)
 # ----------------------------------------------------
@@ -268,4 +943,177 @@ def rebuild_daily_forecast(
             forecast_date=d,
             total_power=total,
             model_version=model_version,
-        ))
\ No newline at end of file
+        ))
+
+
+# ----------------------------------------------------
+# 🗄 RETENTION / ROLLUP CRUD (실시간 기록 보관 정책)
+# ----------------------------------------------------
+def get_chunk_ids(db: Session, model, *criteria, chunk_size: int = 5000) -> List[int]:
+    """조건에 맞는 행 id 를 오래된 id 순으로 최대 chunk_size 건"""
+    return [
+        row[0]
+        for row in db.query(model.id).filter(*criteria).order_by(model.id.asc()).limit(chunk_size).all()
+    ]
+
+
+def delete_by_ids(db: Session, model, ids: List[int]) -> int:
+    """id 목록의 행 삭제 (커밋은 호출한 Job 이 청크마다 수행)"""
+    if not ids:
+        return 0
+    return db.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+
+
+def get_oldest_realtime_timestamp(db: Session) -> Optional[datetime]:
+    return db.query(func.min(RealtimeGeneration.timestamp)).scalar()
+
+
+def get_oldest_realtime_daily_date(db: Session) -> Optional[date]:
+    return db.query(func.min(RealtimeGenerationDaily.date)).scalar()
+
+
+def get_unrolled_realtime_days(db: Session, before: date) -> List[date]:
+    """
+    before 이전 날짜 중 시간별 행 수와 일별 집계의 hours 합이 다른 날 (날짜순).
+    아직 집계하지 않은 날과 집계 후 늦게 들어온 행이 있는 날 (파티션 테이블용: 행은 월 파티션째 삭제)
+    """
+    day_col = func.date(RealtimeGeneration.timestamp)
+    hourly = (
+        db.query(day_col, func.count(RealtimeGeneration.id))
+        .filter(RealtimeGeneration.timestamp < datetime.combine(before, datetime.min.time()))
+        .group_by(day_col)
+        .all()
+    )
+    rolled = dict(
+        db.query(RealtimeGenerationDaily.date, func.sum(RealtimeGenerationDaily.hours))
+        .filter(RealtimeGenerationDaily.date < before)
+        .group_by(RealtimeGenerationDaily.date)
+        .all()
+    )
+
+    days = []
+    for day, count in hourly:
+        # SQLite 의 DATE() 는 문자열을 돌려줌
+        day = day if isinstance(day, date) else date.fromisoformat(day)
+        if rolled.get(day) != count:
+            days.append(day)
+    return sorted(days)
+
+
+def rollup_realtime_day(db: Session, day: date) -> int:
+    """하루치 시간별 실시간 기록을 발전소/모델별 일별 집계로 저장 (있으면 UPDATE)"""
+    start = datetime.combine(day, datetime.min.time())
+    end = start + timedelta(days=1)
+
+    rows = db.query(
+        RealtimeGeneration.plant_id,
+        RealtimeGeneration.model_version,
+        func.sum(RealtimeGeneration.predicted_power),
+        func.max(RealtimeGeneration.predicted_power),
+        func.count(RealtimeGeneration.id),
+    ).filter(
+        RealtimeGeneration.timestamp >= start,
+        RealtimeGeneration.timestamp < end,
+    ).group_by(
+        RealtimeGeneration.plant_id,
+        RealtimeGeneration.model_version,
+    ).all()
+
+    for plant_id, model_version, total, peak, hours in rows:
+        existing = db.query(RealtimeGenerationDaily).filter(
+            RealtimeGenerationDaily.plant_id == plant_id,
+            RealtimeGenerationDaily.date == day,
+            RealtimeGenerationDaily.model_version == model_version,
+        ).first()
+
+        if existing:
+            existing.total_power = total
+            existing.peak_power = peak
+            existing.hours = hours
+        else:
+            db.add(RealtimeGenerationDaily(
+                plant_id=plant_id,
+                date=day,
+                total_power=total,
+                peak_power=peak,
+                hours=hours,
+                model_version=model_version,
+            ))
+
+    return len(rows)
+
+
+def _merge_rollup(db: Session, model, period_column: str, totals: Dict[Tuple, Tuple]):
+    """(plant_id, 기간, model_version) → (합계, 최대, 시간 수) 를 집계 테이블 행에 더함 (없으면 추가)"""
+    for (plant_id, period, model_version), (total, peak, hours) in totals.items():
+        existing = db.query(model).filter(
+            model.plant_id == plant_id,
+            getattr(model, period_column) == period,
+            model.model_version == model_version,
+        ).first()
+
+        if existing:
+            existing.total_power = (existing.total_power or 0.0) + total
+            if peak is not None:
+                existing.peak_power = peak if existing.peak_power is None else max(existing.peak_power, peak)
+            existing.hours = (existing.hours or 0) + hours
+        else:
+            db.add(model(
+                plant_id=plant_id,
+                total_power=total,
+                peak_power=peak,
+                hours=hours,
+                model_version=model_version,
+                **{period_column: period},
+            ))
+
+
+def _accumulate(totals: Dict[Tuple, Tuple], key: Tuple, total: Optional[float], peak: Optional[float], hours: int):
+    """SUM / MAX / COUNT 와 같게 NULL 값은 합계·최대에서 제외"""
+    acc_total, acc_peak, acc_hours = totals.get(key, (0.0, None, 0))
+    if total is not None:
+        acc_total += total
+    if peak is not None:
+        acc_peak = peak if acc_peak is None else max(acc_peak, peak)
+    totals[key] = (acc_total, acc_peak, acc_hours + hours)
+
+
+def merge_realtime_daily(db: Session, ids: List[int]) -> int:
+    """
+    시간별 실시간 행(id 목록)을 일별 집계에 더함.
+    같은 청크를 지우는 트랜잭션 안에서 호출 → 중단되거나 늦게 들어온 행도 정확히 한 번만 집계
+    """
+    totals: Dict[Tuple, Tuple] = {}
+    for plant_id, model_version, timestamp, power in db.query(
+        RealtimeGeneration.plant_id,
+        RealtimeGeneration.model_version,
+        RealtimeGeneration.timestamp,
+        RealtimeGeneration.predicted_power,
+    ).filter(RealtimeGeneration.id.in_(ids)):
+        _accumulate(totals, (plant_id, timestamp.date(), model_version), power, power, 1)
+
+    _merge_rollup(db, RealtimeGenerationDaily, "date", totals)
+    return len(totals)
+
+
+def merge_realtime_monthly(db: Session, ids: List[int]) -> int:
+    """일별 집계 행(id 목록)을 월별 집계에 더함 (merge_realtime_daily 와 같은 방식)"""
+    totals: Dict[Tuple, Tuple] = {}
+    for plant_id, model_version, day, total, peak, hours in db.query(
+        RealtimeGenerationDaily.plant_id,
+        RealtimeGenerationDaily.model_version,
+        RealtimeGenerationDaily.date,
+        RealtimeGenerationDaily.total_power,
+        RealtimeGenerationDaily.peak_power,
+        RealtimeGenerationDaily.hours,
+    ).filter(RealtimeGenerationDaily.id.in_(ids)):
+        _accumulate(totals, (plant_id, day.replace(day=1), model_version), total, peak, hours or 0)
+
+    _merge_rollup(db, RealtimeGenerationMonthly, "month", totals)
+    return len(totals)
+
+
+# CRUD 함수별 DB 시간 계측 (/metrics 의 solar_db_call_seconds)
+from .metrics import instrument_db_functions  # noqa: E402
+
+instrument_db_functions(globals(), __name__)
@@ -0,0 +1,321 @@
+# ============================================================
+# crud_async.py - 비동기 읽기 CRUD (API 엔드포인트용)
+#   - crud.py 의 조회 함수와 같은 조건/정렬, AsyncSession + select() 사용
+#   - 쓰기/대량 처리(Job, 수집, 내보내기)는 동기 crud.py 를 그대로 사용
+# ============================================================
+from datetime import datetime, date
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import (
+    Plant,
+    Weather,
+    Generation,
+    Forecast,
+    DailyForecast,
+    RealtimeGeneration,
+)
+from .crud import GENERATION_ROLLUPS, bucket_start
+
+# 다운샘플링 스트리밍 청크 크기
+STREAM_CHUNK_ROWS = 10000
+
+
+async def _all(db: AsyncSession, stmt) -> list:
+    return list((await db.execute(stmt)).scalars().all())
+
+
+async def _first(db: AsyncSession, stmt):
+    return (await db.execute(stmt.limit(1))).scalars().first()
+
+
+async def count_rows(db: AsyncSession, stmt) -> int:
+    """조회문의 행 수"""
+    return (await db.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))).scalar_one()
+
+
+async def stream_rows(db: AsyncSession, stmt, chunk_rows: Optional[int] = None) -> AsyncIterator[list]:
+    """조회 결과를 chunk_rows(기본 STREAM_CHUNK_ROWS) 행씩 스트리밍 (서버 사이드 커서, 전체를 메모리에 올리지 않음)"""
+    result = await db.stream(stmt.execution_options(yield_per=chunk_rows or STREAM_CHUNK_ROWS))
+    async for chunk in result.partitions():
+        yield chunk
+
+
+# ----------------------------------------------------
+# 🌱 PLANT
+# ----------------------------------------------------
+async def get_all_plants(db: AsyncSession) -> List[Plant]:
+    """모든 발전소 정보 조회"""
+    return await _all(db, select(Plant).order_by(Plant.id.asc()))
+
+
+async def get_plant_by_id(db: AsyncSession, plant_id: int) -> Optional[Plant]:
+    """특정 발전소 정보 조회"""
+    return await db.get(Plant, plant_id)
+
+
+# ----------------------------------------------------
+# ☀️ WEATHER
+# ----------------------------------------------------
+async def get_latest_weather(db: AsyncSession, plant_id: int) -> Optional[Weather]:
+    """특정 발전소의 가장 최근 날씨 조회"""
+    return await _first(db, (
+        select(Weather)
+        .where(Weather.plant_id == plant_id)
+        .order_by(Weather.timestamp.desc())
+    ))
+
+
+async def get_weather_history(
+    db: AsyncSession,
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> List[Weather]:
+    """특정 기간의 날씨 기록 조회 (after/limit: 키셋 페이지네이션)"""
+    stmt = select(Weather).where(
+        Weather.plant_id == plant_id,
+        Weather.timestamp >= start_time,
+        Weather.timestamp <= end_time,
+    )
+    if after is not None:
+        stmt = stmt.where(Weather.timestamp > after)
+    stmt = stmt.order_by(Weather.timestamp.asc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return await _all(db, stmt)
+
+
+def weather_series_query(plant_id: int, start_time: datetime, end_time: datetime):
+    """다운샘플링용 경량 조회문 (ORM 객체 대신 컬럼 튜플, stream_rows 로 읽음)"""
+    return (
+        select(
+            Weather.id,
+            Weather.plant_id,
+            Weather.timestamp,
+            Weather.temperature,
+            Weather.insolation,
+            Weather.humidity,
+            Weather.cloud_cover,
+        )
+        .where(
+            Weather.plant_id == plant_id,
+            Weather.timestamp >= start_time,
+            Weather.timestamp <= end_time,
+        )
+        .order_by(Weather.timestamp.asc())
+    )
+
+
+# ----------------------------------------------------
+# ⚡ GENERATION
+# ----------------------------------------------------
+async def get_latest_generation(db: AsyncSession, plant_id: int) -> Optional[Generation]:
+    """특정 발전소의 가장 최근 실제 발전량 조회"""
+    return await _first(db, (
+        select(Generation)
+        .where(Generation.plant_id == plant_id)
+        .order_by(Generation.timestamp.desc())
+    ))
+
+
+async def get_generation_history(
+    db: AsyncSession,
+    plant_id: int,
+    start: datetime,
+    end: datetime,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> List[Generation]:
+    """특정 발전소의 기간별 실제 발전량 조회 (after/limit: 키셋 페이지네이션)"""
+    stmt = select(Generation).where(
+        Generation.plant_id == plant_id,
+        Generation.timestamp >= start,
+        Generation.timestamp <= end,
+    )
+    if after is not None:
+        stmt = stmt.where(Generation.timestamp > after)
+    stmt = stmt.order_by(Generation.timestamp.asc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return await _all(db, stmt)
+
+
+def generation_columns_query(plant_id: int, start: datetime, end: datetime, after: Optional[datetime] = None):
+    """컬럼형 응답용 (timestamp, actual_power) 조회문 (after: 키셋 페이지네이션)"""
+    stmt = select(Generation.timestamp, Generation.actual_power).where(
+        Generation.plant_id == plant_id,
+        Generation.timestamp >= start,
+        Generation.timestamp <= end,
+    )
+    if after is not None:
+        stmt = stmt.where(Generation.timestamp > after)
+    return stmt.order_by(Generation.timestamp.asc())
+
+
+async def get_generation_columns(
+    db: AsyncSession,
+    plant_id: int,
+    start: datetime,
+    end: datetime,
+    after: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> list:
+    """컬럼형 응답용 (timestamp, actual_power) 튜플 (after/limit: 키셋 페이지네이션)"""
+    stmt = generation_columns_query(plant_id, start, end, after)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return list((await db.execute(stmt)).all())
+
+
+def generation_series_query(plant_id: int, start: datetime, end: datetime):
+    """다운샘플링용 경량 조회문 (ORM 객체 대신 컬럼 튜플, stream_rows 로 읽음)"""
+    return (
+        select(
+            Generation.id,
+            Generation.plant_id,
+            Generation.timestamp,
+            Generation.actual_power,
+        )
+        .where(
+            Generation.plant_id == plant_id,
+            Generation.timestamp >= start,
+            Generation.timestamp <= end,
+        )
+        .order_by(Generation.timestamp.asc())
+    )
+
+
+async def get_generation_aggregates(
+    db: AsyncSession,
+    plant_id: int,
+    bucket: str,
+    start: date,
+    end: date,
+) -> list:
+    """롤업 테이블에서 기간별 집계 조회 (start 가 속한 구간부터 end 까지)"""
+    model = GENERATION_ROLLUPS[bucket]
+    return await _all(db, (
+        select(model)
+        .where(
+            model.plant_id == plant_id,
+            model.bucket_start >= bucket_start(bucket, start),
+            model.bucket_start <= end,
+        )
+        .order_by(model.bucket_start.asc())
+    ))
+
+
+# ----------------------------------------------------
+# 🔮 FORECAST / REALTIME
+# ----------------------------------------------------
+async def get_forecasts_between(
+    db: AsyncSession,
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    model_version: str,
+) -> List[Forecast]:
+    """[start_time, end_time) 시간별 예측 조회"""
+    return await _all(db, (
+        select(Forecast)
+        .where(
+            Forecast.plant_id == plant_id,
+            Forecast.forecast_time >= start_time,
+            Forecast.forecast_time < end_time,
+            Forecast.model_version == model_version,
+        )
+        .order_by(Forecast.forecast_time.asc())
+    ))
+
+
+async def get_forecast_columns(
+    db: AsyncSession,
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    model_version: str,
+) -> list:
+    """컬럼형 응답용 [start_time, end_time) (forecast_time, predicted_power) 튜플"""
+    result = await db.execute(
+        select(Forecast.forecast_time, Forecast.predicted_power)
+        .where(
+            Forecast.plant_id == plant_id,
+            Forecast.forecast_time >= start_time,
+            Forecast.forecast_time < end_time,
+            Forecast.model_version == model_version,
+        )
+        .order_by(Forecast.forecast_time.asc())
+    )
+    return list(result.all())
+
+
+async def get_daily_forecasts_between(
+    db: AsyncSession,
+    plant_id: int,
+    start_date: date,
+    end_date: date,
+    model_version: str,
+) -> List[DailyForecast]:
+    """[start_date, end_date) 일별 예측 조회"""
+    return await _all(db, (
+        select(DailyForecast)
+        .where(
+            DailyForecast.plant_id == plant_id,
+            DailyForecast.forecast_date >= start_date,
+            DailyForecast.forecast_date < end_date,
+            DailyForecast.model_version == model_version,
+        )
+        .order_by(DailyForecast.forecast_date.asc())
+    ))
+
+
+async def get_realtime_generations_between(
+    db: AsyncSession,
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+) -> List[RealtimeGeneration]:
+    """[start_time, end_time) 실시간 예측 기록 조회"""
+    return await _all(db, (
+        select(RealtimeGeneration)
+        .where(
+            RealtimeGeneration.plant_id == plant_id,
+            RealtimeGeneration.timestamp >= start_time,
+            RealtimeGeneration.timestamp < end_time,
+        )
+        .order_by(RealtimeGeneration.timestamp.asc())
+    ))
+
+
+async def get_realtime_generation_columns(
+    db: AsyncSession,
+    plant_id: int,
+    start_time: datetime,
+    end_time: datetime,
+) -> list:
+    """컬럼형 응답용 [start_time, end_time) (timestamp, predicted_power, cumulative_power) 튜플"""
+    result = await db.execute(
+        select(
+            RealtimeGeneration.timestamp,
+            RealtimeGeneration.predicted_power,
+            RealtimeGeneration.cumulative_power,
+        )
+        .where(
+            RealtimeGeneration.plant_id == plant_id,
+            RealtimeGeneration.timestamp >= start_time,
+            RealtimeGeneration.timestamp < end_time,
+        )
+        .order_by(RealtimeGeneration.timestamp.asc())
+    )
+    return list(result.all())
+
+
+# CRUD 함수별 DB 시간 계측 (/metrics 의 solar_db_call_seconds)
+from .metrics import instrument_db_functions  # noqa: E402
+
+instrument_db_functions(globals(), __name__)
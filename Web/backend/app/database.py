@@ -1,29 +1,129 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from dotenv import load_dotenv
 import os
 
+from .pool_metrics import POOL_METRICS, PoolMetrics, InstrumentedQueuePool, InstrumentedAsyncQueuePool
+
 # .env 파일 로드
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-# Engine 생성
-engine = create_engine(
-    DATABASE_URL, 
-    pool_recycle=3600
-)
+if not DATABASE_URL:
+    raise ValueError("DATABASE_URL 환경 변수가 설정되어 있지 않습니다.")
+
+# ============================================================
+# Engine 팩토리
+#   - API 요청과 백그라운드 Job 이 서로 다른 풀을 사용
+#     → Job 이 연결을 모두 잡고 있어도 API 요청은 자기 풀에서 바로 연결을 얻음
+#   - 풀 크기/오버플로/대기 시간은 환경 변수로 조정
+#   - 체크아웃 대기, 포화도, 연결 생성/종료 횟수는 pool_metrics 에서 집계
+# ============================================================
+POOL_SETTINGS = {
+    "api": {
+        "pool_size": int(os.getenv("API_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("API_MAX_OVERFLOW", "5")),
+    },
+    "job": {
+        "pool_size": int(os.getenv("JOB_POOL_SIZE", "3")),
+        "max_overflow": int(os.getenv("JOB_MAX_OVERFLOW", "2")),
+    },
+}
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+
+
+def _pool_kwargs(url: str, role: str, poolclass) -> dict:
+    parsed = make_url(url)
+    # 메모리 SQLite 는 연결마다 DB 가 달라지므로 SQLAlchemy 기본 풀 유지
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_timeout": POOL_TIMEOUT,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_pre_ping": True,
+        **POOL_SETTINGS[role],
+    }
+
 
-# Session Local 생성
+def create_db_engine(role: str, url: str = DATABASE_URL):
+    """role: "api" | "job" (풀 설정과 메트릭 이름에 사용)"""
+    engine = create_engine(url, **_pool_kwargs(url, role, InstrumentedQueuePool))
+    metrics = POOL_METRICS.setdefault(role, PoolMetrics(role))
+    metrics.attach(engine)
+    return engine
+
+
+# Job / CLI 용 (스케줄러, 백필, 수집 CLI, create_tables)
+engine = create_db_engine("job")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# API 요청 용 (동기 경로: 수집 업로드, 내보내기 등)
+api_engine = create_db_engine("api")
+ApiSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=api_engine)
+
 # 모든 모델의 기반 클래스
 Base = declarative_base()
 
-# Dependency Injection을 위한 DB 세션 함수
+# Dependency Injection을 위한 DB 세션 함수 (API 풀 사용)
 def get_db():
-    db = SessionLocal()
+    db = ApiSessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# ============================================================
+# 비동기 Engine / Session (API 읽기 경로)
+#   - 동기 드라이버 URL을 비동기 드라이버로 바꿔 사용 (ASYNC_DATABASE_URL 로 직접 지정 가능)
+#     mysql+pymysql → mysql+aiomysql / sqlite → sqlite+aiosqlite
+#   - 드라이버 import 는 첫 사용 시점에 일어나므로, 비동기 드라이버가 없어도 Job/CLI 는 동작
+#   - 풀 크기는 API 풀과 같은 설정 사용
+# ============================================================
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+_async_engine = None
+_async_sessionmaker = None
+
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        url = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+        # API 읽기 경로이므로 API 풀 설정을 따르되, 별도 풀(api_async)로 집계
+        _async_engine = create_async_engine(url, **_pool_kwargs(url, "api", InstrumentedAsyncQueuePool))
+        metrics = POOL_METRICS.setdefault("api_async", PoolMetrics("api_async"))
+        metrics.attach(_async_engine.sync_engine)
+    return _async_engine
+
+
+def AsyncSessionLocal():
+    """비동기 세션 생성 (async with AsyncSessionLocal() as db: ...)"""
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        # 세션을 닫은 뒤에도 읽은 객체를 응답에 쓰므로 커밋 시 만료하지 않음
+        _async_sessionmaker = async_sessionmaker(get_async_engine(), expire_on_commit=False)
+    return _async_sessionmaker()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,17 +1,37 @@
-from fastapi import FastAPI, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, date
 from typing import List, Optional
 import logging
+import os
+import codecs
+import asyncio
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
+import numpy as np
+import pandas as pd
+import requests
+from zoneinfo import ZoneInfo
 from apscheduler.schedulers.background import BackgroundScheduler
-from .sevices.prediction import predict_72h_power
-from .scheduler.jobs import realtime_job, forecast_3day_job, reset_daily_realtime_job
+from .sevices.prediction import predict_batch, build_forecast_inputs
+from .sevices.batcher import AsyncMicroBatcher
+from .sevices.context_buffer import context_store
+from .sevices.downsample import StreamingLTTB
+from .sevices.export import EXPORT_TABLES, EXPORT_FORMATS, arrow_available, export_stream
+from .sevices.ingest import GenerationIngestor, INGEST_CHUNK_ROWS
+from .sevices.broadcast import broadcaster, plant_topic, FLEET_TOPIC
+from .sevices.columnar import FastJSONResponse, to_columns, fill_hourly
+from .scheduler.jobs import realtime_job, forecast_3day_job, retention_job, partition_maintenance_job
 
 
 # Custom modules
-from . import schemas, crud
-from .models import Base, Plant, Forecast, DailyForecast, RealtimeGeneration
+from . import schemas, crud, crud_async
+from .database import SessionLocal, ApiSessionLocal, AsyncSessionLocal, get_async_db
+from .pool_metrics import pool_metrics_snapshot
+from .metrics import render as render_metrics
+from .request_timing import ServerTimingMiddleware, TimedJSONResponse, phase
 from .weather_service import get_current_weather, get_weather_forecast_3days
 from .solar_service import get_current_irradiance, get_3day_irradiance_forecast
 
@@ -19,36 +39,13 @@ from .solar_service import get_current_irradiance, get_3day_irradiance_forecast
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# DB 설정
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL 환경 변수가 설정되어 있지 않습니다.")
-
-engine = create_engine(DATABASE_URL, pool_recycle=3600)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def get_db():
-    """요청마다 DB 세션 생성 및 종료"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 
 # FastAPI 앱
 app = FastAPI(
     title="신재생 에너지 발전량 예측 플랫폼 API",
     description="태양광 발전소의 실시간 데이터 및 예측을 제공합니다.",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=TimedJSONResponse,  # JSON 렌더링 시간을 Server-Timing 에 기록
 )
 # CORS 설정
 origins = [
@@ -62,18 +59,40 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],       # GET, POST, OPTIONS 등 모두 허용
     allow_headers=["*"],       # 모든 헤더 허용
+    expose_headers=["X-Next-Cursor"],  # 키셋 페이지네이션 커서
 )
+# 응답 압축 (Accept-Encoding: gzip, 작은 응답과 SSE 는 제외)
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv("GZIP_MIN_BYTES", "1024")))
+# 요청별 단계 시간(Server-Timing 헤더) + 느린 요청 로그 + ?profile=1 프로파일링 (가장 바깥)
+app.add_middleware(ServerTimingMiddleware, allowed_origins=origins)
 scheduler = BackgroundScheduler(timezone="Asia/Seoul")
 
+# 온디맨드 예측 요청을 짧은 시간 단위로 모아 한 번에 추론
+predict_batcher = AsyncMicroBatcher(
+    predict_batch,
+    max_batch=int(os.getenv("PREDICT_MAX_BATCH", "16")),
+    max_wait_ms=float(os.getenv("PREDICT_MAX_WAIT_MS", "5")),
+)
+
 # ============================================================
 # API 엔드포인트
 # ============================================================
 @app.on_event("startup")
 def startup():
     # 1. 스케줄러 등록 (기존 로직 유지)
-    scheduler.add_job(realtime_job, "cron", minute=0)  # 매시 정각
+    scheduler.add_job(realtime_job, "cron", minute=0)  # 매시 정각 (밤인 발전소는 Job 에서 생략)
     scheduler.add_job(forecast_3day_job, "cron", hour=0, minute=5) # 매일 00:05
-    scheduler.add_job(reset_daily_realtime_job, "cron", hour=0, minute=1) # 매일 00:01
+    scheduler.add_job(retention_job, "cron", hour=0, minute=1) # 매일 00:01
+    scheduler.add_job(partition_maintenance_job, "cron", hour=0, minute=3) # 매일 00:03
+
+    # 0. 모델 컨텍스트 링 버퍼를 DB에서 1회 로드
+    db = SessionLocal()
+    try:
+        context_store.load_from_db(db)
+    except Exception as e:
+        logger.error(f"❌ Context buffer load failed: {e}")
+    finally:
+        db.close()
 
     scheduler.start()
     logger.info("🚀 Scheduler Started")
@@ -81,15 +100,12 @@ def startup():
     # ==========================================================
     # [추가] 서버 시작 시 테스트를 위해 즉시 1회 실행!
     # ==========================================================
-    logger.info("⚡ Executing jobs immediately for testing...")
-    
-    # 여기서 바로 함수를 호출해서 DB에 들어가는지 확인합니다.
-    # (스케줄러와 별개로 메인 스레드에서 한 번 실행됨)
-    try:
-        realtime_job()       # 실시간 발전량 저장 테스트
-        forecast_3day_job() # 필요하면 3일치 예보도 주석 해제해서 테스트
-    except Exception as e:
-        logger.error(f"❌ Initial execution failed: {e}")
+    # 메인 스레드에서 직접 돌리면 기동/요청 처리가 막히므로
+    # 스케줄러 스레드에 1회성 작업으로 넘깁니다.
+    logger.info("⚡ Scheduling initial job run for testing...")
+    scheduler.add_job(realtime_job)       # 실시간 발전량 저장 테스트
+    scheduler.add_job(forecast_3day_job)  # 3일치 예보 테스트
+    scheduler.add_job(partition_maintenance_job)  # 다가올 월 파티션 확보
 
 @app.get("/", tags=["Health"])
 def health_check():
@@ -102,17 +118,47 @@ def health_check():
     }
 
 
+@app.get("/health/db-pools", tags=["Health"])
+def db_pool_status():
+    """DB 커넥션 풀 상태 (API/Job 풀별 사용 중 연결, 포화도, 체크아웃 대기, 연결 교체 횟수)"""
+    return pool_metrics_snapshot()
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+def metrics():
+    """Prometheus 텍스트 형식 메트릭 (Job/단계, 외부 API, 추론, CRUD 함수별 DB 시간, 커넥션 풀)"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # ---------------- 발전소 정보 ----------------
 @app.get("/plants", response_model=List[schemas.Plant], tags=["발전소"])
-def read_plants(db: Session = Depends(get_db)):
+async def read_plants(db: AsyncSession = Depends(get_async_db)):
     """모든 발전소 정보 조회"""
-    return crud.get_all_plants(db)
+    return await crud_async.get_all_plants(db)
 
 
 @app.get("/plants/{plant_id}", response_model=schemas.Plant, tags=["발전소"])
-def read_plant(plant_id: int, db: Session = Depends(get_db)):
+async def read_plant(plant_id: int, db: AsyncSession = Depends(get_async_db)):
     """특정 발전소 정보 조회"""
-    plant = crud.get_plant_by_id(db, plant_id)
+    plant = await crud_async.get_plant_by_id(db, plant_id)
+    if not plant:
+        raise HTTPException(status_code=404, detail="Plant not found")
+    return plant
+
+
+async def _plant_coords(db: AsyncSession, plant_id: int):
+    """시간별 채움(밤 0 / 낮 누락 None) 판단용 발전소 위경도"""
+    plant = await crud_async.get_plant_by_id(db, plant_id)
+    return (plant.latitude, plant.longitude) if plant else (None, None)
+
+
+async def get_plant_or_404(plant_id: int):
+    """
+    외부 API 를 기다리는 엔드포인트용 발전소 조회.
+    짧은 세션으로 읽고 바로 반납해 외부 호출 동안 DB 연결을 잡고 있지 않음
+    """
+    async with AsyncSessionLocal() as db:
+        plant = await crud_async.get_plant_by_id(db, plant_id)
     if not plant:
         raise HTTPException(status_code=404, detail="Plant not found")
     return plant
@@ -120,16 +166,14 @@ def read_plant(plant_id: int, db: Session = Depends(get_db)):
 
 # ---------------- 실시간 날씨 ----------------
 @app.get("/weather/current/{plant_id}", tags=["날씨"])
-def get_plant_current_weather(plant_id: int, db: Session = Depends(get_db)):
+async def get_plant_current_weather(plant_id: int):
     """특정 발전소의 실시간 날씨 조회"""
-    plant = crud.get_plant_by_id(db, plant_id)
-    if not plant:
-        raise HTTPException(status_code=404, detail="Plant not found")
-    
+    plant = await get_plant_or_404(plant_id)
+
     lat = float(plant.latitude)
     lon = float(plant.longitude)
-    
-    weather = get_current_weather(lat, lon)
+
+    weather = await run_in_threadpool(get_current_weather, lat, lon)
     if weather.get("error"):
         raise HTTPException(status_code=503, detail=weather.get("message"))
     
@@ -142,16 +186,14 @@ def get_plant_current_weather(plant_id: int, db: Session = Depends(get_db)):
 
 # ---------------- 3일 예보 (DB 저장 없이 바로 반환) ----------------
 @app.get("/weather/forecast/{plant_id}", tags=["날씨"])
-def get_plant_forecast(plant_id: int, db: Session = Depends(get_db)):
+async def get_plant_forecast(plant_id: int):
     """특정 발전소의 3일 예보 조회: 외부 API에서 직접 가져와 반환합니다."""
-    plant = crud.get_plant_by_id(db, plant_id)
-    if not plant:
-        raise HTTPException(status_code=404, detail="Plant not found")
+    plant = await get_plant_or_404(plant_id)
 
     lat = float(plant.latitude)
     lon = float(plant.longitude)
 
-    forecast_resp = get_weather_forecast_3days(lat, lon)
+    forecast_resp = await run_in_threadpool(get_weather_forecast_3days, lat, lon)
     if forecast_resp.get("error"):
         raise HTTPException(status_code=503, detail=forecast_resp.get("message"))
 
@@ -163,41 +205,35 @@ def get_plant_forecast(plant_id: int, db: Session = Depends(get_db)):
     }
 #---------------- 일사량 조회 ------------------
 @app.get("/solar/realtime/{plant_id}", tags=["일사량"])
-def api_get_realtime_solar(plant_id: int, db: Session = Depends(get_db)):
-    plant = crud.get_plant_by_id(db, plant_id)
-    if not plant:
-        raise HTTPException(status_code=404, detail="Plant not found")
+async def api_get_realtime_solar(plant_id: int):
+    plant = await get_plant_or_404(plant_id)
 
     lat = float(plant.latitude)
     lon = float(plant.longitude)
 
-    return get_current_irradiance(lat, lon)
+    return await run_in_threadpool(get_current_irradiance, lat, lon)
 
 @app.get("/solar/forecast/{plant_id}", tags=["일사량"])
-def api_get_solar_forecast(plant_id: int, db: Session = Depends(get_db)):
-    plant = crud.get_plant_by_id(db, plant_id)
-    if not plant:
-        raise HTTPException(status_code=404, detail="Plant not found")
+async def api_get_solar_forecast(plant_id: int):
+    plant = await get_plant_or_404(plant_id)
 
     lat = float(plant.latitude)
     lon = float(plant.longitude)
 
-    return get_3day_irradiance_forecast(lat, lon)
+    return await run_in_threadpool(get_3day_irradiance_forecast, lat, lon)
 
 
 # ---------------- 모델 입력 데이터 (72시간 예보) ----------------
 @app.get("/model-input/{plant_id}", tags=["모델 입력"])
-def get_model_input(plant_id: int, db: Session = Depends(get_db)):
+async def get_model_input(plant_id: int):
     """모델에 넣을 72시간 단기예보 INPUT 데이터 반환"""
-    plant = crud.get_plant_by_id(db, plant_id)
-    if not plant:
-        raise HTTPException(status_code=404, detail="Plant not found")
+    plant = await get_plant_or_404(plant_id)
 
     lat = float(plant.latitude)
     lon = float(plant.longitude)
 
     # 3일치 forecast 가져오기
-    forecast_resp = get_weather_forecast_3days(lat, lon)
+    forecast_resp = await run_in_threadpool(get_weather_forecast_3days, lat, lon)
     if forecast_resp.get("error"):
         raise HTTPException(status_code=503, detail=forecast_resp.get("message"))
 
@@ -226,54 +262,274 @@ def get_model_input(plant_id: int, db: Session = Depends(get_db)):
 
 # ---------------- 발전량(실제) 조회 ----------------
 @app.get("/generation/latest/{plant_id}", response_model=schemas.Generation, tags=["발전량"])
-def api_get_latest_generation(plant_id: int, db: Session = Depends(get_db)):
+async def api_get_latest_generation(plant_id: int, db: AsyncSession = Depends(get_async_db)):
     """특정 발전소의 가장 최근 실제 발전량 조회"""
-    gen = crud.get_latest_generation(db, plant_id)
+    gen = await crud_async.get_latest_generation(db, plant_id)
     if not gen:
         raise HTTPException(status_code=404, detail="Generation not found")
     return gen
 
 
+# 기간 조회 공통 옵션
+HISTORY_PAGE_DEFAULT = 1000
+HISTORY_PAGE_MAX = 10000
+MAX_POINTS_LIMIT = 10000
+# rows: 행 객체 목록 (기존) / columns: {"timestamp": [...], 값: [...]} 평행 배열 (고속 경로)
+SHAPE_QUERY = Query("rows", pattern="^(rows|columns)$", description="응답 형태 (columns: 컬럼형 배열)")
+
+
+def _paginate(response: Response, rows: list, limit: Optional[int]) -> list:
+    """limit+1 행을 읽어 다음 페이지가 있으면 X-Next-Cursor(마지막 행 시각) 헤더 설정 (limit 없음: 전체)"""
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = rows[-1].timestamp.isoformat()
+    return rows
+
+
+def _page_limit(cursor: Optional[datetime], limit: Optional[int]) -> Optional[int]:
+    """limit/cursor 를 모두 생략하면 기존처럼 전체 기간 (None), cursor 만 주면 기본 페이지 크기"""
+    if limit is None and cursor is not None:
+        return HISTORY_PAGE_DEFAULT
+    return limit
+
+
+async def _downsample(db: AsyncSession, stmt, y_attr: str, max_points: int) -> list:
+    """조회문 결과를 LTTB 로 max_points 개로 줄임. 기간 전체를 올리지 않고 청크 단위로 두 번 스트리밍"""
+    n = await crud_async.count_rows(db, stmt)
+    if n <= max_points:
+        return list((await db.execute(stmt)).all())
+
+    lttb = StreamingLTTB(n, max_points, "timestamp", y_attr)
+    for feed in (lttb.feed_means, lttb.feed_select):
+        async for chunk in crud_async.stream_rows(db, stmt):
+            await run_in_threadpool(feed, chunk)
+    return lttb.finish()
+
+
 @app.get("/generation/history/{plant_id}", response_model=List[schemas.Generation], tags=["발전량"])
-def api_get_generation_history(
+async def api_get_generation_history(
     plant_id: int,
+    response: Response,
     start: datetime = Query(..., description="시작 시각 (ISO format)"),
     end: datetime = Query(..., description="종료 시각 (ISO format)"),
-    db: Session = Depends(get_db),
+    max_points: Optional[int] = Query(None, ge=3, le=MAX_POINTS_LIMIT, description="지정 시 LTTB 다운샘플링 (페이지네이션 없음)"),
+    cursor: Optional[datetime] = Query(None, description="직전 응답의 X-Next-Cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=HISTORY_PAGE_MAX, description=f"페이지 크기 (cursor 만 주면 {HISTORY_PAGE_DEFAULT}, 둘 다 생략하면 전체 기간)"),
+    shape: str = SHAPE_QUERY,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """특정 발전소의 기간별 실제 발전량 기록 조회"""
     if start > end:
         raise HTTPException(status_code=400, detail="start must be before end")
-    return crud.get_generation_history(db, plant_id, start, end)
+
+    limit = _page_limit(cursor, limit)
+    fetch = limit + 1 if limit is not None else None
+
+    if shape == "columns":
+        if max_points:
+            stmt = crud_async.generation_columns_query(plant_id, start, end)
+            rows = await _downsample(db, stmt, "actual_power", max_points)
+        else:
+            rows = await crud_async.get_generation_columns(db, plant_id, start, end, after=cursor, limit=fetch)
+            rows = _paginate(response, rows, limit)
+        # Response 를 직접 반환하면 주입된 response 의 헤더는 합쳐지지 않으므로 커서만 옮김
+        next_cursor = response.headers.get("X-Next-Cursor")
+        return FastJSONResponse(
+            {"plant_id": plant_id, "count": len(rows), **to_columns(rows, ["timestamp", "actual_power"])},
+            headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
+        )
+
+    if max_points:
+        stmt = crud_async.generation_series_query(plant_id, start, end)
+        return await _downsample(db, stmt, "actual_power", max_points)
+
+    rows = await crud_async.get_generation_history(db, plant_id, start, end, after=cursor, limit=fetch)
+    return _paginate(response, rows, limit)
+
+
+@app.get("/weather/history/{plant_id}", response_model=List[schemas.Weather], tags=["날씨"])
+async def api_get_weather_history(
+    plant_id: int,
+    response: Response,
+    start: datetime = Query(..., description="시작 시각 (ISO format)"),
+    end: datetime = Query(..., description="종료 시각 (ISO format)"),
+    max_points: Optional[int] = Query(None, ge=3, le=MAX_POINTS_LIMIT, description="지정 시 LTTB 다운샘플링 (페이지네이션 없음)"),
+    field: str = Query("insolation", pattern="^(temperature|insolation|humidity|cloud_cover)$", description="다운샘플링 기준 컬럼"),
+    cursor: Optional[datetime] = Query(None, description="직전 응답의 X-Next-Cursor"),
+    limit: Optional[int] = Query(None, ge=1, le=HISTORY_PAGE_MAX, description=f"페이지 크기 (cursor 만 주면 {HISTORY_PAGE_DEFAULT}, 둘 다 생략하면 전체 기간)"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """저장된 날씨 기록 조회 (다운샘플링 또는 키셋 페이지네이션)"""
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    if max_points:
+        stmt = crud_async.weather_series_query(plant_id, start, end)
+        return await _downsample(db, stmt, field, max_points)
+
+    limit = _page_limit(cursor, limit)
+    rows = await crud_async.get_weather_history(
+        db, plant_id, start, end, after=cursor, limit=limit + 1 if limit is not None else None,
+    )
+    return _paginate(response, rows, limit)
+
+
+@app.post("/ingest/generation", tags=["발전량"])
+async def api_ingest_generation(
+    request: Request,
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="요청 본문 형식 (csv 는 헤더 필수)"),
+):
+    """
+    실측 발전량 대량 수집. 본문을 스트리밍으로 읽어 INGEST_CHUNK_ROWS 행 단위로 검증/UPSERT/커밋.
+    컬럼: plant_id, timestamp(ISO, 시간대 없으면 KST), actual_power
+    """
+    db = ApiSessionLocal()
+    try:
+        ingestor = await run_in_threadpool(GenerationIngestor, db, format)
+
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        buffer = ""
+        lines: List[str] = []
+        async for chunk in request.stream():
+            buffer += decoder.decode(chunk)
+            *complete, buffer = buffer.split("\n")
+            lines.extend(complete)
+            if len(lines) >= INGEST_CHUNK_ROWS:
+                await run_in_threadpool(ingestor.feed_lines, lines)
+                lines = []
+
+        lines.append(buffer + decoder.decode(b"", final=True))
+        await run_in_threadpool(ingestor.feed_lines, lines)
+        return await run_in_threadpool(ingestor.finish)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        db.close()
+
+
+# bucket=auto 일 때 기간 길이로 tier 선택 (대략 수백 행 이내가 되도록)
+AUTO_BUCKET_MAX_DAYS = {"day": 92, "week": 730}
+
+
+@app.get("/generation/aggregate/{plant_id}", response_model=schemas.GenerationAggregateResponse, tags=["발전량"])
+async def api_get_generation_aggregate(
+    plant_id: int,
+    bucket: str = Query("auto", pattern="^(auto|day|week|month)$", description="집계 단위"),
+    start: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """일/주/월 롤업 테이블에서 실제 발전량 집계 조회 (장기간 차트용)"""
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    if bucket == "auto":
+        days = (end - start).days + 1
+        bucket = next(
+            (b for b, max_days in AUTO_BUCKET_MAX_DAYS.items() if days <= max_days),
+            "month",
+        )
+
+    items = await crud_async.get_generation_aggregates(db, plant_id, bucket, start, end)
+    return {"plant_id": plant_id, "bucket": bucket, "items": items}
+
+
+# ---------------- 대용량 내보내기 ----------------
+@app.get("/export/{table}", tags=["내보내기"])
+def api_export(
+    table: str,
+    format: str = Query("csv", pattern="^(csv|ndjson|arrow)$", description="csv | ndjson | arrow (Arrow IPC 스트림)"),
+    plant_ids: Optional[List[int]] = Query(None, description="발전소 ID (반복 지정, 생략 시 전체)"),
+    start: Optional[datetime] = Query(None, description="시작 시각 (ISO format)"),
+    end: Optional[datetime] = Query(None, description="종료 시각 (ISO format)"),
+):
+    """여러 발전소/기간의 데이터를 서버측 커서로 읽어 청크 단위 스트리밍"""
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"Unknown table: {table} (available: {', '.join(EXPORT_TABLES)})")
+    if format == "arrow" and not arrow_available():
+        raise HTTPException(status_code=400, detail="arrow format requires pyarrow")
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    media_type, ext = EXPORT_FORMATS[format]
+    # 스트림은 요청 의존성 세션보다 오래 살아있으므로 자체 세션을 엶
+    stream = export_stream(ApiSessionLocal, table, format, plant_ids, start, end)
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{table}.{ext}"'},
+    )
+
+
+# ---------------- 실시간 푸시 (SSE) ----------------
+@app.get("/stream/updates", tags=["예측"])
+async def stream_updates(
+    plant_id: Optional[int] = Query(None, description="생략 시 전체 발전소(fleet) 토픽"),
+):
+    """
+    Job 커밋 직후 갱신 이벤트를 Server-Sent Events 로 전달 (폴링 대체).
+    event: realtime (발전량/누적 값 포함) / forecast (갱신 구간, 값은 조회 API 로 재조회)
+    """
+    if plant_id is not None:
+        await get_plant_or_404(plant_id)
+    topic = plant_topic(plant_id) if plant_id is not None else FLEET_TOPIC
+
+    return StreamingResponse(
+        broadcaster.stream(topic),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 해제
+        },
+    )
 
 
 # ---------------- 시간별 예측 조회 ----------------
 @app.get("/prediction/realtime/{plant_id}", tags=["예측"])
-def get_realtime_prediction_today(
+async def get_realtime_prediction_today(
     plant_id: int,
-    db: Session = Depends(get_db)
+    shape: str = SHAPE_QUERY,
+    db: AsyncSession = Depends(get_async_db)
 ):
     today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     today_end = today_start + timedelta(days=1)
 
-    rows = db.query(RealtimeGeneration).filter(
-        RealtimeGeneration.plant_id == plant_id,
-        RealtimeGeneration.timestamp >= today_start,
-        RealtimeGeneration.timestamp < today_end
-    ).order_by(RealtimeGeneration.timestamp.asc()).all()
+    if shape == "columns":
+        rows = await crud_async.get_realtime_generation_columns(db, plant_id, today_start, today_end)
+        columns = fill_hourly(
+            rows, ["timestamp", "predicted_power", "cumulative_power"],
+            today_start, rows[-1][0] + timedelta(hours=1),
+            *(await _plant_coords(db, plant_id)),
+            carry_forward=["cumulative_power"],
+        ) if rows else to_columns([], ["timestamp", "predicted_power", "cumulative_power"])
+        return FastJSONResponse({
+            "plant_id": plant_id,
+            "date": today_start.date(),
+            "count": len(columns["timestamp"]),
+            **columns,
+        })
+
+    rows = await crud_async.get_realtime_generations_between(db, plant_id, today_start, today_end)
+
+    # 밤 시간대는 저장하지 않으므로 마지막 기록 시각까지 0으로 채움 (낮 누락은 null, 기록이 없으면 빈 목록)
+    data = crud.fill_realtime_generations(
+        rows, plant_id, today_start, rows[-1].timestamp + timedelta(hours=1),
+        *(await _plant_coords(db, plant_id)),
+    ) if rows else []
 
     return {
         "plant_id": plant_id,
         "date": today_start.date(),
-        "count": len(rows),
-        "data": rows
+        "count": len(data),
+        "data": data
     }
 
 
 @app.get("/prediction/hourly/today/{plant_id}", tags=["예측"])
-def get_today_hourly_forecast(
+async def get_today_hourly_forecast(
     plant_id: int,
-    db: Session = Depends(get_db)
+    shape: str = SHAPE_QUERY,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """오늘 하루(00:00 ~ 23:00)의 시간별 예측 데이터 조회"""
     # 오늘 00:00 시작
@@ -281,33 +537,106 @@ def get_today_hourly_forecast(
     # 내일 00:00 전까지 (오늘 23:59까지 포함)
     today_end = today_start + timedelta(days=1)
 
-    rows = db.query(Forecast).filter(
-        Forecast.plant_id == plant_id,
-        Forecast.forecast_time >= today_start,
-        Forecast.forecast_time < today_end,
-        Forecast.model_version == "nhits-v1"
-    ).order_by(Forecast.forecast_time.asc()).all()
+    if shape == "columns":
+        rows = await crud_async.get_forecast_columns(db, plant_id, today_start, today_end, "nhits-v1")
+        names = ["forecast_time", "predicted_power"]
+        columns = fill_hourly(
+            rows, names, today_start, today_end, *(await _plant_coords(db, plant_id))
+        ) if rows else to_columns([], names)
+        return FastJSONResponse({
+            "plant_id": plant_id,
+            "count": len(columns["forecast_time"]),
+            **columns,
+        })
+
+    rows = await crud_async.get_forecasts_between(db, plant_id, today_start, today_end, "nhits-v1")
+
+    # 밤 시간대는 저장하지 않으므로 0으로 채움 (낮 누락은 null, 예측이 아예 없으면 빈 목록)
+    data = crud.fill_hourly_forecasts(
+        rows, plant_id, today_start, today_end, "nhits-v1", *(await _plant_coords(db, plant_id))
+    ) if rows else []
 
     return {
         "plant_id": plant_id,
-        "count": len(rows),
-        "data": rows
+        "count": len(data),
+        "data": data
+    }
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+def _to_kst_naive(ts: datetime) -> datetime:
+    """모델 입력은 KST naive. 시간대가 있으면 KST 로 변환, 없으면 KST 로 간주"""
+    if ts.tzinfo is not None:
+        return ts.astimezone(KST).replace(tzinfo=None)
+    return ts
+
+
+@app.post("/predict", response_model=schemas.PredictResponse, tags=["예측"])
+async def predict_on_demand(req: schemas.PredictRequest):
+    """
+    온디맨드 예측.
+    - weather 지정 시: 주어진 시간별 날씨(what-if)로 예측
+    - weather 미지정 시: plant_id 발전소의 3일 예보를 받아 예측
+    동시에 들어온 요청은 마이크로 배치로 묶여 한 번에 추론됩니다.
+    """
+    if req.weather:
+        hours = sorted(req.weather, key=lambda h: _to_kst_naive(h.datetime))
+        inputs = {
+            "ds": np.array([_to_kst_naive(h.datetime) for h in hours], dtype="datetime64[ns]"),
+            "insolation": np.array([h.irradiance or 0.0 for h in hours], dtype=np.float64),
+            "temp": np.array([h.temperature or 0.0 for h in hours], dtype=np.float64),
+            "cloud": np.array([h.cloud_cover or 0.0 for h in hours], dtype=np.float64),
+            "humidity": np.array([h.humidity or 0.0 for h in hours], dtype=np.float64),
+        }
+    else:
+        if req.plant_id is None:
+            raise HTTPException(status_code=400, detail="plant_id or weather is required")
+
+        plant = await get_plant_or_404(req.plant_id)
+
+        lat = float(plant.latitude)
+        lon = float(plant.longitude)
+        # 두 외부 API 를 동시에 호출 (Open-Meteo 는 예외를 그대로 올리므로 여기서 503 처리)
+        try:
+            wf, sf = await asyncio.gather(
+                run_in_threadpool(get_weather_forecast_3days, lat, lon),
+                run_in_threadpool(get_3day_irradiance_forecast, lat, lon),
+            )
+        except (requests.RequestException, KeyError, ValueError) as e:
+            logger.warning(f"⚠️ Forecast input fetch failed for plant {req.plant_id}: {e}")
+            raise HTTPException(status_code=503, detail="Forecast input unavailable")
+        if wf.get("error"):
+            raise HTTPException(status_code=503, detail=wf.get("message"))
+
+        inputs = build_forecast_inputs(wf.get("forecast", []), sf.get("forecast", []))
+        if inputs is None:
+            raise HTTPException(status_code=503, detail="No forecast input available")
+
+    history = None
+    if req.plant_id is not None:
+        history = context_store.history(req.plant_id, pd.Timestamp(inputs["ds"][0]) - timedelta(hours=1))
+
+    with phase("inference"):
+        preds = await predict_batcher.submit((inputs, history))
+
+    return {
+        "plant_id": req.plant_id,
+        "count": len(preds["ds"]),
+        "datetime": preds["ds"].astype("datetime64[us]").tolist(),
+        "predicted_power": preds["predicted_power"].tolist(),
     }
 
+
 @app.get("/prediction/daily/3days/{plant_id}", tags=["예측"])
-def get_3day_daily_forecast(
+async def get_3day_daily_forecast(
     plant_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     today = date.today()
     end = today + timedelta(days=30)
 
-    rows = db.query(DailyForecast).filter(
-        DailyForecast.plant_id == plant_id,
-        DailyForecast.forecast_date >= today,
-        DailyForecast.forecast_date < end,
-        DailyForecast.model_version == "nhits-v1"
-    ).order_by(DailyForecast.forecast_date.asc()).all()
+    rows = await crud_async.get_daily_forecasts_between(db, plant_id, today, end, "nhits-v1")
 
     return {
         "plant_id": plant_id,
@@ -0,0 +1,218 @@
+# ============================================================
+# metrics.py - Prometheus 텍스트 형식 메트릭 (GET /metrics)
+#   - 외부 의존성 없이 Counter / Histogram 만 구현 (프로세스 내 집계)
+#   - 스케줄러 Job(전체/단계), 외부 API 호출, 모델 추론, CRUD 함수별 DB 시간
+#   - DB 커넥션 풀 상태는 pool_metrics 에서 읽어 함께 출력
+# ============================================================
+import asyncio
+import bisect
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .pool_metrics import pool_metrics_snapshot
+from . import request_timing
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(labels.get(n, "") for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, help_text, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> [구간별 개수..., 합계, 개수]
+        self._values: Dict[Tuple, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            if i < len(self.buckets):
+                state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = self.header()
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = _format_labels(self.labelnames, key, f'le="{_format_value(float(bound))}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            inf = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {state[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state[-1]}")
+        return lines
+
+
+REGISTRY: List[_Metric] = []
+
+
+# ============================================================
+# 메트릭 정의
+# ============================================================
+JOB_RUNS = Counter("solar_job_runs_total", "Scheduler job runs by result", ["job", "status"])
+JOB_SECONDS = Histogram("solar_job_duration_seconds", "Scheduler job wall time", ["job"])
+JOB_PHASE_SECONDS = Histogram("solar_job_phase_seconds", "Scheduler job phase wall time", ["job", "phase"])
+
+UPSTREAM_SECONDS = Histogram("solar_upstream_request_seconds", "External API request latency", ["upstream"])
+UPSTREAM_ERRORS = Counter("solar_upstream_errors_total", "External API failures", ["upstream", "reason"])
+
+INFERENCE_SECONDS = Histogram("solar_inference_seconds", "Model inference latency per batch call", ["backend"])
+INFERENCE_BATCH = Histogram("solar_inference_batch_size", "Requests per inference batch call", ["backend"], BATCH_BUCKETS)
+
+DB_CALL_SECONDS = Histogram("solar_db_call_seconds", "Wall time per CRUD function call", ["function"])
+
+
+# ============================================================
+# CRUD 함수 계측
+# ============================================================
+def instrument_db_functions(namespace: Dict, module_name: str):
+    """
+    모듈에 정의된 공개 함수 중 첫 인자가 db 인 함수를 DB_CALL_SECONDS 로 감쌈.
+    모듈 끝에서 instrument_db_functions(globals(), __name__) 으로 호출
+    """
+    for name, fn in list(namespace.items()):
+        if name.startswith("_") or not inspect.isfunction(fn) or fn.__module__ != module_name:
+            continue
+        params = list(inspect.signature(fn).parameters)
+        if not params or params[0] != "db":
+            continue
+        namespace[name] = _timed_db_call(fn, f"{module_name.rsplit('.', 1)[-1]}.{name}")
+
+
+def _timed_db_call(fn: Callable, label: str) -> Callable:
+    if asyncio.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                DB_CALL_SECONDS.observe(elapsed, function=label)
+                request_timing.record("db", elapsed)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            DB_CALL_SECONDS.observe(elapsed, function=label)
+            request_timing.record("db", elapsed)
+    return wrapper
+
+
+# ============================================================
+# 출력
+# ============================================================
+# pool_metrics 스냅샷 필드 -> (메트릭 이름, 타입, 설명)
+POOL_FIELDS = (
+    ("checked_out", "solar_db_pool_checked_out", "gauge", "Connections currently checked out"),
+    ("saturation", "solar_db_pool_saturation", "gauge", "Checked-out connections / (pool_size + max_overflow)"),
+    ("checkouts", "solar_db_pool_checkouts_total", "counter", "Connection checkouts"),
+    ("wait_seconds_sum", "solar_db_pool_wait_seconds_total", "counter", "Total time spent waiting for a connection"),
+    ("wait_seconds_max", "solar_db_pool_wait_seconds_max", "gauge", "Longest wait for a connection"),
+    ("slow_checkouts", "solar_db_pool_slow_checkouts_total", "counter", "Checkouts that waited longer than the slow threshold"),
+    ("timeouts", "solar_db_pool_timeouts_total", "counter", "Checkouts that timed out"),
+    ("connects", "solar_db_pool_connects_total", "counter", "New DBAPI connections opened"),
+    ("closes", "solar_db_pool_closes_total", "counter", "DBAPI connections closed"),
+    ("invalidations", "solar_db_pool_invalidations_total", "counter", "Connections invalidated"),
+)
+
+
+def _render_pools() -> List[str]:
+    pools = pool_metrics_snapshot()
+    lines = []
+    for field, name, kind, help_text in POOL_FIELDS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for pool, stats in sorted(pools.items()):
+            if stats.get(field) is not None:
+                lines.append(f'{name}{{pool="{_escape(pool)}"}} {_format_value(float(stats[field]))}')
+    return lines
+
+
+def render() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines += metric.render()
+    lines += _render_pools()
+    return "\n".join(lines) + "\n"
@@ -1,5 +1,5 @@
 from sqlalchemy import (
-    Column, Integer, Float, String, Date, DateTime,
+    Column, Integer, Float, String, Text, Date, DateTime,
     ForeignKey, UniqueConstraint, Numeric
 )
 from sqlalchemy.orm import relationship
@@ -139,3 +139,154 @@ class RealtimeGeneration(Base):
     )
 
     plant = relationship("Plant", back_populates="realtime_generations")
+
+
+# ============================================================
+# 7. REALTIME_GENERATION_DAILY (보관 기간이 지난 실시간 기록의 일별 집계)
+# ============================================================
+class RealtimeGenerationDaily(Base):
+    __tablename__ = "REALTIME_GENERATION_DAILY"
+
+    id = Column(Integer, primary_key=True, index=True)
+    plant_id = Column(Integer, ForeignKey("PLANT.id"), index=True)
+
+    date = Column(Date, index=True)
+    total_power = Column(Float)                       # 일 합계 (= 당일 최종 누적)
+    peak_power = Column(Float)                        # 시간 최대
+    hours = Column(Integer)                           # 집계된 시간 행 수
+    model_version = Column(String(50))
+
+    __table_args__ = (
+        UniqueConstraint(
+            "plant_id", "date", "model_version",
+            name="_realtime_generation_daily_uc"
+        ),
+    )
+
+
+# ============================================================
+# 8. REALTIME_GENERATION_MONTHLY (보관 기간이 지난 일별 집계의 월별 집계)
+# ============================================================
+class RealtimeGenerationMonthly(Base):
+    __tablename__ = "REALTIME_GENERATION_MONTHLY"
+
+    id = Column(Integer, primary_key=True, index=True)
+    plant_id = Column(Integer, ForeignKey("PLANT.id"), index=True)
+
+    month = Column(Date, index=True)                  # 해당 월 1일
+    total_power = Column(Float)
+    peak_power = Column(Float)
+    hours = Column(Integer)
+    model_version = Column(String(50))
+
+    __table_args__ = (
+        UniqueConstraint(
+            "plant_id", "month", "model_version",
+            name="_realtime_generation_monthly_uc"
+        ),
+    )
+
+
+# ============================================================
+# 9~11. GENERATION 롤업 (실제 발전량 일/주/월 집계, 수집 시 증분 갱신)
+# ============================================================
+class GenerationDaily(Base):
+    __tablename__ = "GENERATION_DAILY"
+
+    id = Column(Integer, primary_key=True, index=True)
+    plant_id = Column(Integer, ForeignKey("PLANT.id"), index=True)
+
+    bucket_start = Column(Date, index=True)           # 해당 일
+    total_power = Column(Float)
+    min_power = Column(Float)
+    max_power = Column(Float)
+    count = Column(Integer)
+
+    __table_args__ = (
+        UniqueConstraint("plant_id", "bucket_start", name="_generation_daily_uc"),
+    )
+
+
+class GenerationWeekly(Base):
+    __tablename__ = "GENERATION_WEEKLY"
+
+    id = Column(Integer, primary_key=True, index=True)
+    plant_id = Column(Integer, ForeignKey("PLANT.id"), index=True)
+
+    bucket_start = Column(Date, index=True)           # 해당 주 월요일
+    total_power = Column(Float)
+    min_power = Column(Float)
+    max_power = Column(Float)
+    count = Column(Integer)
+
+    __table_args__ = (
+        UniqueConstraint("plant_id", "bucket_start", name="_generation_weekly_uc"),
+    )
+
+
+class GenerationMonthly(Base):
+    __tablename__ = "GENERATION_MONTHLY"
+
+    id = Column(Integer, primary_key=True, index=True)
+    plant_id = Column(Integer, ForeignKey("PLANT.id"), index=True)
+
+    bucket_start = Column(Date, index=True)           # 해당 월 1일
+    total_power = Column(Float)
+    min_power = Column(Float)
+    max_power = Column(Float)
+    count = Column(Integer)
+
+    __table_args__ = (
+        UniqueConstraint("plant_id", "bucket_start", name="_generation_monthly_uc"),
+    )
+
+
+# ============================================================
+# 12. WEATHER_INPUT (외부 API 관측/예보 원본 보관, 격자 단위)
+#   - 백필/재학습/재현 시 외부 API 대신 이 테이블을 읽음
+#   - 값은 조회한 단위 그대로 저장 (kma_fcst cloud: 0~10 / kma_obs cloud: %)
+# ============================================================
+class WeatherInput(Base):
+    __tablename__ = "WEATHER_INPUT"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    source = Column(String(16))          # kma_fcst | kma_obs | kma_ufcst | openmeteo | openmeteo_now
+    grid = Column(String(32))            # 기상청 "nx,ny" / Open-Meteo "lat,lon"
+    base_time = Column(DateTime)         # 발표 시각 (Open-Meteo 는 조회 시각)
+    forecast_time = Column(DateTime)     # 대상 시각 (관측은 base_time 과 같음)
+
+    temperature = Column(Float, nullable=True)
+    humidity = Column(Float, nullable=True)
+    cloud = Column(Float, nullable=True)
+    insolation = Column(Float, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "source", "grid", "base_time", "forecast_time",
+            name="_weather_input_uc"
+        ),
+    )
+
+
+# ============================================================
+# 13. JOB_CHECKPOINT (스케줄러 Job 진행 상황)
+#   - Job 은 발전소 id 순으로 JOB_CHUNK_PLANTS 개씩 저장/커밋하고
+#     청크마다 마지막 발전소 id 를 기록 → 같은 회차를 다시 실행하면 그 다음부터 이어서 처리
+#   - run_key: Job 회차 식별자 (3일 예측: 날짜)
+# ============================================================
+class JobCheckpoint(Base):
+    __tablename__ = "JOB_CHECKPOINT"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    job = Column(String(32))
+    run_key = Column(String(32))
+    last_plant_id = Column(Integer, nullable=True)   # 마지막으로 커밋한 청크의 마지막 발전소
+    failed_plant_ids = Column(Text, nullable=True)   # 조회/추론에 실패해 재개 시 다시 처리할 발전소 (쉼표 구분)
+    status = Column(String(16))                      # running | partial(실패 발전소 남음) | done
+    updated_at = Column(DateTime)
+
+    __table_args__ = (
+        UniqueConstraint("job", "run_key", name="_job_checkpoint_uc"),
+    )
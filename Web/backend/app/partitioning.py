@@ -0,0 +1,209 @@
+# ============================================================
+# partitioning.py - 시계열 테이블 월 단위 RANGE 파티션 관리
+#   - MySQL: PARTITION BY RANGE (TO_DAYS(시각 컬럼)), 파티션 이름 pYYYYMM
+#   - SQLite(로컬 테스트): _PARTITIONS 레지스트리 테이블로 파티션을 흉내내고
+#     파티션 삭제는 해당 월 범위 행 삭제로 대체
+#
+# 최초 1회 변환:  python create_tables.py --partition
+# 이후 생성/회전:  partition_maintenance_job (매일) + retention_job
+# ============================================================
+import os
+from datetime import date, datetime
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+PARTITIONING_ENABLED = os.getenv("PARTITIONING_ENABLED", "0") == "1"
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+
+# 테이블 → 파티션 기준 시각 컬럼
+PARTITIONED_TABLES: Dict[str, str] = {
+    "FORECAST": "forecast_time",
+    "REALTIME_GENERATION": "timestamp",
+    "GENERATION": "timestamp",
+}
+
+MAX_PARTITION = "pmax"
+
+
+# ============================================================
+# 월 계산 유틸
+# ============================================================
+def month_start(d: date) -> date:
+    return date(d.year, d.month, 1)
+
+
+def add_months(d: date, n: int) -> date:
+    y, m = divmod(d.year * 12 + (d.month - 1) + n, 12)
+    return date(y, m + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def partition_month(name: str) -> date:
+    return date(int(name[1:5]), int(name[5:7]), 1)
+
+
+def _is_mysql(engine: Engine) -> bool:
+    return engine.dialect.name in ("mysql", "mariadb")
+
+
+def _q(engine: Engine, name: str) -> str:
+    return engine.dialect.identifier_preparer.quote(name)
+
+
+# ============================================================
+# 파티션 조회
+# ============================================================
+def list_partitions(engine: Engine, table: str) -> List[date]:
+    """월 파티션 목록 (각 파티션의 시작 월, 오름차순)"""
+    with engine.connect() as conn:
+        if _is_mysql(engine):
+            rows = conn.execute(text(
+                "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND PARTITION_NAME IS NOT NULL"
+            ), {"t": table}).all()
+        else:
+            _ensure_registry(conn)
+            rows = conn.execute(text(
+                "SELECT partition_name FROM _PARTITIONS WHERE table_name = :t"
+            ), {"t": table}).all()
+
+    return sorted(partition_month(r[0]) for r in rows if r[0] != MAX_PARTITION)
+
+
+def _ensure_registry(conn):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS _PARTITIONS ("
+        " table_name VARCHAR(64) NOT NULL,"
+        " partition_name VARCHAR(16) NOT NULL,"
+        " PRIMARY KEY (table_name, partition_name))"
+    ))
+
+
+# ============================================================
+# 최초 변환 (MySQL: FK 제거 + PK에 시각 컬럼 포함 + 파티셔닝)
+# ============================================================
+def convert_to_partitioned(engine: Engine, table: str, months_ahead: int = PARTITION_MONTHS_AHEAD):
+    """
+    MySQL 파티션 테이블 제약:
+      - 모든 UNIQUE/PK 키에 파티션 컬럼이 포함되어야 함 → PK (id, 시각)
+      - 외래키 미지원 → FK 제거 (관계는 ORM 메타데이터에만 유지)
+    """
+    column = PARTITIONED_TABLES[table]
+    today = month_start(date.today())
+
+    with engine.begin() as conn:
+        oldest = conn.execute(text(f"SELECT MIN({_q(engine, column)}) FROM {_q(engine, table)}")).scalar()
+        if isinstance(oldest, str):
+            oldest = datetime.fromisoformat(oldest)
+        first = month_start(oldest.date()) if oldest else today
+
+        months = []
+        m = first
+        while m <= add_months(today, months_ahead):
+            months.append(m)
+            m = add_months(m, 1)
+
+        if not _is_mysql(engine):
+            _ensure_registry(conn)
+            for m in months:
+                conn.execute(text(
+                    "INSERT OR IGNORE INTO _PARTITIONS (table_name, partition_name) VALUES (:t, :p)"
+                ), {"t": table, "p": partition_name(m)})
+            return
+
+        fks = conn.execute(text(
+            "SELECT CONSTRAINT_NAME FROM information_schema.REFERENTIAL_CONSTRAINTS "
+            "WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = :t"
+        ), {"t": table}).all()
+        for (fk,) in fks:
+            conn.execute(text(f"ALTER TABLE `{table}` DROP FOREIGN KEY `{fk}`"))
+
+        conn.execute(text(
+            f"ALTER TABLE `{table}` MODIFY `{column}` DATETIME NOT NULL, "
+            f"DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `{column}`)"
+        ))
+
+        defs = ", ".join(
+            f"PARTITION {partition_name(m)} VALUES LESS THAN (TO_DAYS('{add_months(m, 1)}'))"
+            for m in months
+        )
+        conn.execute(text(
+            f"ALTER TABLE `{table}` PARTITION BY RANGE (TO_DAYS(`{column}`)) "
+            f"({defs}, PARTITION {MAX_PARTITION} VALUES LESS THAN MAXVALUE)"
+        ))
+
+    print(f"🧱 {table} partitioned by month ({len(months)} partitions)")
+
+
+# ============================================================
+# 회전: 앞으로 쓸 파티션 미리 생성 / 오래된 파티션 삭제
+# ============================================================
+def ensure_partitions(engine: Engine, months_ahead: int = PARTITION_MONTHS_AHEAD):
+    """모든 파티션 테이블에 이번 달 ~ months_ahead 개월 뒤까지 파티션이 있도록 보장"""
+    today = month_start(date.today())
+    wanted = [add_months(today, i) for i in range(months_ahead + 1)]
+
+    for table in PARTITIONED_TABLES:
+        existing = set(list_partitions(engine, table))
+        if not existing:
+            continue  # 아직 변환되지 않은 테이블
+
+        missing = [m for m in wanted if m not in existing and m > max(existing)]
+        if not missing:
+            continue
+
+        with engine.begin() as conn:
+            if _is_mysql(engine):
+                defs = ", ".join(
+                    f"PARTITION {partition_name(m)} VALUES LESS THAN (TO_DAYS('{add_months(m, 1)}'))"
+                    for m in missing
+                )
+                conn.execute(text(
+                    f"ALTER TABLE `{table}` REORGANIZE PARTITION {MAX_PARTITION} INTO "
+                    f"({defs}, PARTITION {MAX_PARTITION} VALUES LESS THAN MAXVALUE)"
+                ))
+            else:
+                for m in missing:
+                    conn.execute(text(
+                        "INSERT OR IGNORE INTO _PARTITIONS (table_name, partition_name) VALUES (:t, :p)"
+                    ), {"t": table, "p": partition_name(m)})
+
+        print(f"🧱 {table}: added partitions {', '.join(partition_name(m) for m in missing)}")
+
+
+def drop_partitions_before(engine: Engine, table: str, cutoff: date) -> List[str]:
+    """
+    cutoff 이전에 완전히 끝나는 월 파티션 삭제.
+    MySQL: DROP PARTITION (메타데이터 작업, 행 수와 무관)
+    SQLite: 해당 월 범위 행 삭제 + 레지스트리에서 제거
+    """
+    column = PARTITIONED_TABLES[table]
+    dropped = [m for m in list_partitions(engine, table) if add_months(m, 1) <= cutoff]
+    if not dropped:
+        return []
+
+    names = [partition_name(m) for m in dropped]
+    with engine.begin() as conn:
+        if _is_mysql(engine):
+            conn.execute(text(f"ALTER TABLE `{table}` DROP PARTITION {', '.join(names)}"))
+        else:
+            for m, name in zip(dropped, names):
+                conn.execute(text(
+                    f"DELETE FROM {_q(engine, table)} WHERE {_q(engine, column)} >= :s AND {_q(engine, column)} < :e"
+                ), {"s": datetime.combine(m, datetime.min.time()),
+                    "e": datetime.combine(add_months(m, 1), datetime.min.time())})
+                conn.execute(text(
+                    "DELETE FROM _PARTITIONS WHERE table_name = :t AND partition_name = :p"
+                ), {"t": table, "p": name})
+
+    print(f"🧹 {table}: dropped partitions {', '.join(names)}")
+    return names
+
+
+def is_partitioned(engine: Engine, table: str) -> bool:
+    return PARTITIONING_ENABLED and bool(list_partitions(engine, table))
@@ -0,0 +1,139 @@
+# ============================================================
+# pool_metrics.py - DB 커넥션 풀 계측
+#   - 체크아웃 대기 시간(합계/최대/느린 대기 횟수), 타임아웃
+#   - 현재 사용 중 연결 수와 포화도 (사용 중 / (pool_size + max_overflow))
+#   - 연결 생성/종료/무효화 횟수 (연결 교체가 잦은지 확인)
+# ============================================================
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 이 시간 이상 기다린 체크아웃은 느린 대기로 집계
+SLOW_CHECKOUT_SECONDS = 0.1
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.pool = None
+
+        self.checkouts = 0
+        self.checked_out = 0
+        self.wait_seconds_sum = 0.0
+        self.wait_seconds_max = 0.0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+
+    def observe_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_seconds_sum += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if seconds >= SLOW_CHECKOUT_SECONDS:
+                self.slow_checkouts += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def _inc(self, attr: str, n: int = 1):
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + n)
+
+    def attach(self, engine):
+        """엔진의 풀에 이벤트 리스너 등록"""
+        self.pool = engine.pool
+        if isinstance(self.pool, _InstrumentedPoolMixin):
+            self.pool.metrics = self
+
+        @event.listens_for(engine, "connect")
+        def _connect(dbapi_conn, record):
+            self._inc("connects")
+
+        @event.listens_for(engine, "close")
+        def _close(dbapi_conn, record):
+            self._inc("closes")
+
+        @event.listens_for(engine, "invalidate")
+        def _invalidate(dbapi_conn, record, exc):
+            self._inc("invalidations")
+
+        @event.listens_for(engine, "checkout")
+        def _checkout(dbapi_conn, record, proxy):
+            with self._lock:
+                self.checkouts += 1
+                self.checked_out += 1
+
+        @event.listens_for(engine, "checkin")
+        def _checkin(dbapi_conn, record):
+            self._inc("checked_out", -1)
+
+    def snapshot(self) -> Dict:
+        pool = self.pool
+        size = pool.size() if hasattr(pool, "size") else None
+        max_overflow = getattr(pool, "_max_overflow", None)
+        capacity = size + max(max_overflow, 0) if size is not None and max_overflow is not None else None
+
+        with self._lock:
+            return {
+                "pool": self.name,
+                "size": size,
+                "max_overflow": max_overflow,
+                "checked_out": self.checked_out,
+                "saturation": round(self.checked_out / capacity, 3) if capacity else None,
+                "checkouts": self.checkouts,
+                "wait_seconds_sum": round(self.wait_seconds_sum, 6),
+                "wait_seconds_avg": round(self.wait_seconds_sum / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "closes": self.closes,
+                "invalidations": self.invalidations,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """풀에서 연결을 꺼내는 데 걸린 시간(대기 포함) 측정"""
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics:
+                self.metrics.observe_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.metrics:
+            self.metrics.observe_wait(time.perf_counter() - started)
+        return conn
+
+    def recreate(self):
+        # dispose/재생성 시에도 계측 유지 (사용 중 연결 수/포화도는 새 풀 기준)
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+# 풀 이름 -> 계측 객체
+POOL_METRICS: Dict[str, PoolMetrics] = {}
+
+
+def pool_metrics_snapshot() -> Dict[str, Dict]:
+    return {name: m.snapshot() for name, m in POOL_METRICS.items()}
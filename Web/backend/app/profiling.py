@@ -0,0 +1,56 @@
+# ============================================================
+# profiling.py - 디버그용 프로파일 저장 (기본 비활성)
+#   - PROFILING_ENABLED=true 일 때만 동작
+#     · API: ?profile=1 을 붙인 요청 (request_timing 미들웨어)
+#     · Job: PROFILE_JOBS=realtime,forecast_3day 처럼 지정한 Job 실행 (tracing.traced_job)
+#   - pyinstrument 가 설치되어 있으면 샘플링 프로파일을 HTML(플레임 그래프)로,
+#     없으면 cProfile 결과(.prof, snakeviz 등으로 확인)를 PROFILE_DIR 에 저장
+#   - cProfile 은 스레드 단위라 비동기 요청 중에는 같은 이벤트 루프의 다른 요청도 함께 잡힘
+# ============================================================
+import cProfile
+import os
+import re
+from datetime import datetime
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # 선택 의존성
+    Profiler = None
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_JOBS = {j.strip() for j in os.getenv("PROFILE_JOBS", "").split(",") if j.strip()}
+
+
+class Profile:
+    def __init__(self, async_mode: bool = False):
+        if Profiler is not None:
+            self._profiler = Profiler(async_mode="enabled" if async_mode else "disabled")
+        else:
+            self._profiler = cProfile.Profile()
+
+    def start(self):
+        if Profiler is not None:
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+
+    def stop(self, name: str) -> str:
+        """프로파일 종료 후 파일로 저장하고 경로 반환"""
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stem = f"{datetime.now():%Y%m%d_%H%M%S_%f}_{re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')}"
+
+        if Profiler is not None:
+            self._profiler.stop()
+            path = os.path.join(PROFILE_DIR, stem + ".html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self._profiler.output_html())
+        else:
+            self._profiler.disable()
+            path = os.path.join(PROFILE_DIR, stem + ".prof")
+            self._profiler.dump_stats(path)
+        return path
+
+
+def should_profile_job(job: str) -> bool:
+    return PROFILING_ENABLED and job in PROFILE_JOBS
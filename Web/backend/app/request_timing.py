@@ -0,0 +1,131 @@
+# ============================================================
+# request_timing.py - 요청별 단계 시간 (Server-Timing 헤더 + 느린 요청 로그)
+#   - 단계: db(CRUD 함수) / upstream(외부 API) / inference(모델) / serialize(JSON 직렬화)
+#   - 각 단계 코드가 record() 로 시간을 더하고, 미들웨어가 응답 헤더에 붙임
+#     (run_in_threadpool 로 넘긴 작업도 컨텍스트가 복사되므로 같은 요청에 합산)
+#   - 스트리밍 응답은 헤더 시점까지의 값만 헤더에 들어가고, 로그에는 전체 시간이 기록됨
+#   - SLOW_REQUEST_MS 이상 걸린 요청은 단계별 시간과 함께 WARNING 로그
+#   - PROFILING_ENABLED=true 이면 ?profile=1 요청을 프로파일링해서 PROFILE_DIR 에 저장
+# ============================================================
+import contextvars
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qs
+
+from fastapi.responses import JSONResponse
+
+from .profiling import PROFILING_ENABLED, Profile
+
+logger = logging.getLogger(__name__)
+
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "1000"))
+PHASES = ("db", "upstream", "inference", "serialize")
+
+
+class RequestTimings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.seconds: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, phase: str, seconds: float):
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def header(self) -> str:
+        parts = []
+        for phase in PHASES:
+            if phase in self.seconds:
+                parts.append(f'{phase};dur={self.seconds[phase] * 1000:.1f};desc="{self.counts[phase]} calls"')
+        parts.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(parts)
+
+    def summary(self) -> str:
+        return " ".join(f"{p}={self.seconds[p] * 1000:.0f}ms" for p in PHASES if p in self.seconds)
+
+
+_current: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar("request_timings", default=None)
+
+
+def record(phase: str, seconds: float):
+    """요청 처리 중이면 단계 시간 합산 (Job 등 요청 밖에서는 무시)"""
+    timings = _current.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+@contextmanager
+def phase(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - started)
+
+
+class TimedJSONResponse(JSONResponse):
+    """기본 응답 클래스: JSON 렌더링 시간을 serialize 단계로 기록"""
+
+    def render(self, content) -> bytes:
+        with phase("serialize"):
+            return super().render(content)
+
+
+class ServerTimingMiddleware:
+    """순수 ASGI 미들웨어 (스트리밍 응답을 버퍼링하지 않음)"""
+
+    def __init__(self, app, allowed_origins: Iterable[str] = ()):
+        self.app = app
+        self.allowed_origins = {o.encode("latin-1") for o in allowed_origins}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status = {"code": 0}
+
+        profile = None
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if PROFILING_ENABLED and query.get("profile") == ["1"]:
+            profile = Profile(async_mode=True)
+            try:
+                profile.start()
+            except (RuntimeError, ValueError) as e:  # 다른 요청이 이미 프로파일링 중
+                logger.warning(f"⚠️ Profile skipped: {e}")
+                profile = None
+
+        origin = dict(scope.get("headers") or []).get(b"origin")
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.header().encode("latin-1")))
+                # 교차 출처 대시보드에서도 PerformanceResourceTiming 으로 읽을 수 있도록
+                if origin in self.allowed_origins:
+                    headers.append((b"timing-allow-origin", origin))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            elapsed_ms = timings.elapsed() * 1000
+            if profile is not None:
+                path = profile.stop(f"request_{scope['method']}_{scope['path']}")
+                logger.info(f"🔬 Profile saved: {path}")
+            if elapsed_ms >= SLOW_REQUEST_MS:
+                logger.warning(
+                    f"🐢 Slow request {scope['method']} {scope['path']} "
+                    f"-> {status['code']} {elapsed_ms:.0f}ms {timings.summary()}"
+                )
@@ -0,0 +1,242 @@
+# ============================================================
+# 🔁 과거 예측 재생성 (Forecast / DailyForecast 백필)
+#   - 매일 00:05 forecast_3day_job 이 했을 일을 과거 날짜에 대해 재현
+#   - 입력은 WEATHER_INPUT 에 보관된 기상청/Open-Meteo 예보 (발표 시점 기준 최신본)
+#   - 여러 날짜 × 발전소를 묶어 프로세스 풀에서 배치 추론
+#   - 날짜순으로 저장/커밋하고 체크포인트 파일에 진행 상황 기록 → 중단 후 재개
+#   - 새 모델로 재생성: --models-dir 로 체크포인트 폴더를 지정하면 워커 프로세스가 그 모델을 로드
+#     (--model-version 라벨은 로드한 모델의 best_model_info.json 과 일치해야 함)
+#   - FORECAST_RETENTION_DAYS 를 설정했다면 보관 기간 안의 날짜만 허용 (지난 날짜는 다음 정리 때 삭제됨)
+#
+# python -m app.scheduler.backfill --start 2024-01-01 --end 2024-12-31 \
+#        [--plants 1,2,3] [--models-dir ../../Model/Models_v2 --model-version nhits-v2] \
+#        [--workers 4] [--days-per-batch 7]
+# ============================================================
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.database import SessionLocal, engine
+from app import crud
+from app.partitioning import is_partitioned
+from app.sevices.input_archive import archived_forecast_inputs, group_by_grid, kma_grid, latest_issue, open_meteo_grid
+from app.sevices.prediction import (
+    FEATURES, MODEL_VERSION, MODELS_DIR, load_model_info, predict_batch, predict_batch_local,
+)
+from app.scheduler.jobs import partition_retention_cutoff, store_forecast
+
+# 실제 Job 실행 시각 (이 시점에 발표되어 있던 예보만 사용)
+ISSUE_HOUR, ISSUE_MINUTE = 0, 5
+# 기상청 단기예보는 3시간 간격 발표 → 직전 발표는 최대 하루 전(전날 23시)까지 거슬러감
+KMA_LOOKBACK = timedelta(days=1)
+
+
+# ============================================================
+# 입력 구성 (보관 입력 → 모델 입력)
+# ============================================================
+def load_batch_inputs(db, plants, days: List[date]) -> List[Tuple[date, object, dict]]:
+    """날짜 묶음의 (날짜, 발전소, 입력) 목록. 보관 입력이 없는 조합은 제외"""
+    first = datetime.combine(days[0], datetime.min.time())
+    last = datetime.combine(days[-1], datetime.min.time()).replace(hour=ISSUE_HOUR, minute=ISSUE_MINUTE)
+
+    kma_grids = {p.id: kma_grid(float(p.latitude), float(p.longitude)) for p in plants}
+    irr_grids = {p.id: open_meteo_grid(float(p.latitude), float(p.longitude)) for p in plants}
+
+    kma = group_by_grid(crud.get_weather_inputs_between(
+        db, "kma_fcst", set(kma_grids.values()), first - KMA_LOOKBACK, last))
+    irr = group_by_grid(crud.get_weather_inputs_between(
+        db, "openmeteo", set(irr_grids.values()), first - KMA_LOOKBACK, last))
+
+    work = []
+    for day in days:
+        issue = datetime.combine(day, datetime.min.time()).replace(hour=ISSUE_HOUR, minute=ISSUE_MINUTE)
+        for plant in plants:
+            kma_rows = latest_issue(kma.get(kma_grids[plant.id], {}), issue)
+            irr_rows = latest_issue(irr.get(irr_grids[plant.id], {}), issue)
+            if not kma_rows or not irr_rows:
+                continue
+            inputs = archived_forecast_inputs(kma_rows, irr_rows, issue)
+            if inputs is not None:
+                work.append((day, plant, inputs))
+    return work
+
+
+# ============================================================
+# 모델 / 버전 확인
+# ============================================================
+def resolve_model_version(model_version: Optional[str], models_dir: Optional[str]) -> str:
+    """
+    저장 라벨이 실제로 추론할 모델과 맞는지 확인하고 라벨 반환.
+    - models_dir 미지정: MODELS_DIR 모델 → 라벨은 그 모델 버전(MODEL_VERSION)이어야 함
+    - models_dir 지정: 정보 파일에 model_version 이 있으면 일치해야 하고, 없으면 라벨 필수
+    """
+    info = load_model_info(Path(models_dir) if models_dir else MODELS_DIR)
+    if info["features"] != FEATURES:
+        raise ValueError(f"Model in {models_dir} expects features {info['features']}, inputs provide {FEATURES}")
+
+    loaded = info.get("model_version") or (None if models_dir else MODEL_VERSION)
+    if model_version is None:
+        if loaded is None:
+            raise ValueError(f"{models_dir}/best_model_info.json has no model_version; pass --model-version")
+        return loaded
+    if loaded is not None and loaded != model_version:
+        source = models_dir or f"MODELS_DIR ({MODELS_DIR})"
+        raise ValueError(
+            f"--model-version {model_version} does not match the model in {source} ({loaded}); "
+            f"point --models-dir at the {model_version} checkpoint"
+        )
+    return model_version
+
+
+def check_retention(start: date):
+    """보관 기간이 지나 바로 삭제될 날짜부터 재생성하려 하면 ValueError"""
+    cutoff = partition_retention_cutoff("FORECAST")
+    if cutoff is not None and start < cutoff and is_partitioned(engine, "FORECAST"):
+        raise ValueError(
+            f"--start {start} is older than FORECAST_RETENTION_DAYS allows ({cutoff}); "
+            f"those partitions would be dropped by the next retention run"
+        )
+
+
+# ============================================================
+# 체크포인트
+# ============================================================
+def _load_checkpoint(path: str, params: dict) -> Optional[date]:
+    """같은 조건으로 실행한 기록이 있으면 마지막으로 완료한 날짜"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    if saved.get("params") != params:
+        print(f"⚠️ Checkpoint {path} was written for different parameters. Starting over.")
+        return None
+    return date.fromisoformat(saved["last_done"])
+
+
+def _save_checkpoint(path: str, params: dict, last_done: date):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"params": params, "last_done": last_done.isoformat()}, f)
+    os.replace(tmp, path)
+
+
+# ============================================================
+# 실행
+# ============================================================
+def run_backfill(
+    start: date,
+    end: date,
+    plant_ids: Optional[List[int]] = None,
+    model_version: Optional[str] = None,
+    workers: int = 1,
+    days_per_batch: int = 7,
+    checkpoint: str = "backfill_checkpoint.json",
+    models_dir: Optional[str] = None,
+):
+    model_version = resolve_model_version(model_version, models_dir)
+    check_retention(start)
+    params = {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "plants": sorted(plant_ids) if plant_ids else None,
+        "model_version": model_version,
+        "models_dir": models_dir,
+    }
+    last_done = _load_checkpoint(checkpoint, params)
+    if last_done is not None:
+        print(f"⏩ Resuming after {last_done}")
+        start = max(start, last_done + timedelta(days=1))
+
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    batches = [days[i:i + days_per_batch] for i in range(0, len(days), days_per_batch)]
+    if not batches:
+        print("✅ Nothing to backfill")
+        return
+
+    db = SessionLocal()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        plants = [
+            p for p in crud.get_all_plants(db)
+            if (not plant_ids or p.id in plant_ids) and p.latitude is not None and p.longitude is not None
+        ]
+        print(f"🔥 [Backfill] {len(days)} days × {len(plants)} plants → {model_version}")
+
+        # 입력 구성(메인) → 추론(풀, 최대 workers 개 배치를 동시에) → 저장(메인, 날짜순)
+        pending = []
+        for batch_days in batches:
+            work = load_batch_inputs(db, plants, batch_days)
+            requests = [(inputs, None) for _, _, inputs in work]
+            future = pool.submit(predict_batch_local, requests, models_dir) if pool else None
+            pending.append((batch_days, work, future, requests))
+
+            if len(pending) < max(workers, 1):
+                continue
+            _store_batch(db, *pending.pop(0), model_version, models_dir, checkpoint, params)
+
+        while pending:
+            _store_batch(db, *pending.pop(0), model_version, models_dir, checkpoint, params)
+
+        print("✅ Backfill finished")
+    finally:
+        if pool:
+            pool.shutdown()
+        db.close()
+
+
+def _store_batch(db, batch_days, work, future, requests, model_version, models_dir, checkpoint, params):
+    if future:
+        all_preds = future.result()
+    elif models_dir:
+        # 추론 워커는 기본 모델을 올리고 있으므로 지정한 모델은 이 프로세스에서 추론
+        all_preds = predict_batch_local(requests, models_dir)
+    else:
+        all_preds = predict_batch(requests)
+
+    # 날짜순으로 덮어쓰므로 겹치는 시간대는 실제 Job 처럼 가장 최근 발표 예측이 남음
+    by_day: Dict[date, list] = {}
+    for (day, plant, _), preds in zip(work, all_preds):
+        by_day.setdefault(day, []).append((plant, preds))
+
+    for day in batch_days:
+        stored = 0
+        for plant, preds in by_day.get(day, []):
+            if not len(preds["ds"]):
+                continue
+            store_forecast(db, plant, preds, model_version=model_version)
+            stored += 1
+        db.commit()
+        _save_checkpoint(checkpoint, params, day)
+        print(f"📅 {day} | plants: {stored}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="보관 입력으로 과거 Forecast/DailyForecast 재생성")
+    parser.add_argument("--start", type=date.fromisoformat, required=True)
+    parser.add_argument("--end", type=date.fromisoformat, required=True)
+    parser.add_argument("--plants", type=lambda s: [int(x) for x in s.split(",")], default=None)
+    parser.add_argument("--model-version", default=None,
+                        help="저장 라벨 (기본: 로드한 모델의 model_version, MODELS_DIR 모델은 nhits-v1)")
+    parser.add_argument("--models-dir", default=None,
+                        help="추론에 쓸 모델 체크포인트 폴더 (기본: MODELS_DIR)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--days-per-batch", type=int, default=7)
+    parser.add_argument("--checkpoint", default="backfill_checkpoint.json")
+    args = parser.parse_args()
+
+    if args.start > args.end:
+        parser.error("--start must be before --end")
+    try:
+        resolve_model_version(args.model_version, args.models_dir)
+        check_retention(args.start)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    run_backfill(
+        args.start, args.end, args.plants, args.model_version,
+        args.workers, args.days_per_batch, args.checkpoint, args.models_dir,
+    )
@@ -1,81 +1,271 @@
+import os
 from datetime import datetime, timedelta, date
-from app.database import SessionLocal
+from typing import Optional
+import numpy as np
+import pandas as pd
+from app.database import SessionLocal, engine
+from app.partitioning import is_partitioned, drop_partitions_before, ensure_partitions, PARTITIONING_ENABLED
 from app import crud
-from app.models import RealtimeGeneration
+from app.models import RealtimeGeneration, RealtimeGenerationDaily
+
+# 서비스 함수 임포트 (외부 API 조회는 격자 단위 캐시 + 원본 보관을 거침)
+from app.sevices.input_archive import (
+    InputArchive, archived_forecast_inputs, group_by_grid, kma_grid, latest_issue, open_meteo_grid,
+)
+from app.sevices.prediction import predict_72h_power, predict_batch, build_forecast_inputs, observation_inputs
+from app.sevices.nowcast import nowcast, lookup_baselines, register_baseline
+from app.sevices.context_buffer import cloud_amount, context_store
+from app.sevices.regional import align_inputs, regional_inputs, disaggregate
+from app.sevices.solar_position import daylight_mask, is_daylight
+from app.sevices.broadcast import publish_realtime, publish_forecast
+from app.tracing import traced_job, mark_job_failed, JobPhases
+
+# 실시간 모드: nowcast(3일 예측 기준선 보정) / model(매시 모델 실행)
+REALTIME_MODE = os.getenv("REALTIME_MODE", "nowcast")
+
+# 3일 예측 모드: plant(발전소별 추론) / region(지역 1회 추론 후 용량·일사량 비율로 분배)
+PREDICTION_MODE = os.getenv("PREDICTION_MODE", "plant")
+
+# 실시간 기록 보관 정책 (시간별 보관 기간은 모델 컨텍스트 30일보다 길어야 함)
+HOURLY_RETENTION_DAYS = int(os.getenv("HOURLY_RETENTION_DAYS", "35"))
+DAILY_RETENTION_DAYS = int(os.getenv("DAILY_RETENTION_DAYS", "400"))
+RETENTION_MAX_DAYS_PER_RUN = int(os.getenv("RETENTION_MAX_DAYS_PER_RUN", "3"))
+RETENTION_DELETE_CHUNK = int(os.getenv("RETENTION_DELETE_CHUNK", "2000"))
+
+# 롤업 이관 없이 기간만 지나면 월 파티션째 삭제하는 파티션 테이블
+#   기본 0: 삭제하지 않음. 보관 기간을 설정한 테이블만 삭제 (opt-in)
+#   - FORECAST: 지난 예측 (일별 추세는 DAILY_FORECAST 에 남음). 백필은 보관 기간 안의 날짜만 허용
+#   - GENERATION: 실측 원본 (일/주/월 롤업은 수집 시 이미 누적되어 남음)
+PARTITION_RETENTION_DAYS = {
+    "FORECAST": int(os.getenv("FORECAST_RETENTION_DAYS", "0")),
+    "GENERATION": int(os.getenv("GENERATION_RETENTION_DAYS", "0")),
+}
+
+# 나우캐스트 기준선 복원 시 거슬러 볼 보관 예보 범위
+#   (3일 예측 Job 은 매일 00시 실행, 기상청 발표는 그 전날 23시까지 거슬러감 + 하루 실패 여유)
+BASELINE_LOOKBACK = timedelta(days=2)
+
+# 실시간/3일 예측 Job 의 커밋 단위 (발전소 수). 청크마다 커밋 + 진행 상황 기록
+JOB_CHUNK_PLANTS = int(os.getenv("JOB_CHUNK_PLANTS", "50"))
 
-# 서비스 함수 임포트 (경로 확인 필요)
-from app.weather_service import get_current_weather, get_weather_forecast_3days
-from app.solar_service import get_current_irradiance, get_3day_irradiance_forecast
-from app.sevices.prediction import predict_72h_power
+
+# ============================================================
+# 🧭 청크 커밋 / 재개
+#   - 외부 API 조회와 추론은 쓰기 전에 끝내고, 저장은 발전소 id 순 청크 단위로 커밋
+#     → 행 잠금은 청크 하나를 쓰는 동안만 유지
+#   - 3일 예측은 청크마다 JOB_CHECKPOINT 에 마지막 발전소 id 와 실패한 발전소 목록 기록
+#     → 같은 날 다시 실행하면 다음 발전소부터 + 조회/추론에 실패했던 발전소를 다시 처리
+# ============================================================
+def _resume_state(db, job: str, run_key: str):
+    """
+    같은 회차를 다시 실행할 때 이어서 처리할 범위.
+    반환: (마지막으로 커밋한 발전소 id, 다시 시도할 발전소 id 집합). 처음/완료된 회차면 (None, 빈 집합)
+    """
+    checkpoint = crud.get_job_checkpoint(db, job, run_key)
+    if checkpoint is None or checkpoint.status == "done":
+        return None, set()
+    retry = crud.checkpoint_failed_ids(checkpoint)
+    print(f"⏩ [{job}] Resuming {run_key} after plant {checkpoint.last_plant_id} (retrying {len(retry)} failed)")
+    return checkpoint.last_plant_id, retry
+
+
+def _is_pending(plant_id: int, resume_after, retry) -> bool:
+    """이번 실행에서 저장해야 하는 발전소인지 (재개 시 이미 커밋한 발전소는 제외)"""
+    return resume_after is None or plant_id > resume_after or plant_id in retry
+
+
+def _chunks(n: int, size: int = JOB_CHUNK_PLANTS):
+    """0..n 을 size 개씩 자른 slice 목록"""
+    return [slice(i, min(i + size, n)) for i in range(0, n, max(size, 1))]
+
+
+# ============================================================
+# 🌱 나우캐스트 기준선 복원
+#   - 기준선은 3일 예측 Job 이 같은 프로세스에서 돌 때만 메모리에 쌓임
+#   - 재시작 / 다른 워커 / 재개로 건너뛴 발전소는 실시간 Job 이 필요할 때 DB 에서 복원
+# ============================================================
+def _seed_baselines(db, plants, now: datetime, model_version: str = "nhits-v1"):
+    """
+    메모리에 기준선이 없는 발전소의 나우캐스트 기준선을 DB 에서 복원.
+    예측은 FORECAST(3일 예측 Job 저장분), 입력은 그 Job 이 보관한 WEATHER_INPUT 예보(now 시점 최신 발표).
+    밤 시간대는 저장하지 않으므로 0, 저장되지 않은 낮 시각은 NaN (→ 모델 재실행)
+    """
+    kma_grids = {p.id: kma_grid(float(p.latitude), float(p.longitude)) for p in plants}
+    irr_grids = {p.id: open_meteo_grid(float(p.latitude), float(p.longitude)) for p in plants}
+    kma = group_by_grid(crud.get_weather_inputs_between(
+        db, "kma_fcst", set(kma_grids.values()), now - BASELINE_LOOKBACK, now))
+    irr = group_by_grid(crud.get_weather_inputs_between(
+        db, "openmeteo", set(irr_grids.values()), now - BASELINE_LOOKBACK, now))
+
+    stored = {}
+    for plant_id, ts, power in crud.get_forecast_values(
+        db, [p.id for p in plants], now, now + timedelta(hours=72), model_version
+    ):
+        stored.setdefault(plant_id, {})[np.datetime64(ts, "ns")] = power
+
+    seeded = 0
+    for plant in plants:
+        kma_rows = latest_issue(kma.get(kma_grids[plant.id], {}), now)
+        irr_rows = latest_issue(irr.get(irr_grids[plant.id], {}), now)
+        if plant.id not in stored or not kma_rows or not irr_rows:
+            continue
+        inputs = archived_forecast_inputs(kma_rows, irr_rows, now)
+        if inputs is None:
+            continue
+
+        daylight = daylight_mask(float(plant.latitude), float(plant.longitude), inputs["ds"])
+        power = np.array([stored[plant.id].get(ts, np.nan) for ts in inputs["ds"]], dtype=np.float64)
+        register_baseline(plant.id, inputs, {"ds": inputs["ds"], "predicted_power": np.where(daylight, power, 0.0)})
+        seeded += 1
+
+    if seeded:
+        print(f"🌱 Seeded {seeded} nowcast baselines from stored forecasts")
 
 
 # ============================================================
-# ⏱ 실시간 예측 Job (매 1시간 마다 실행)
+# ⏱ 실시간 예측 Job (매시 정각 실행)
 # ============================================================
+@traced_job("realtime")
 def realtime_job():
+    """
+    같은 시간대에 여러 번 실행되면 해당 시각 행을 덮어씀.
+    JOB_CHUNK_PLANTS 단위로 커밋하되 재개 기록은 남기지 않음
+    (매 실행이 그 시각의 관측으로 새로 계산하므로, 실패한 발전소는 다음 갱신에서 다시 처리됨)
+    """
     print(f"🔥 [Realtime Job] Started at {datetime.now()}")
     db = SessionLocal()
+    archive = InputArchive()
+    phases = JobPhases("realtime")
 
     try:
         # 현재 시간 (분, 초 0으로 맞춤)
         now = datetime.now().replace(minute=0, second=0, microsecond=0)
 
+
+        # 1. 날씨 및 일사량 조회 (발전소별 관측값 수집)
+        #    해가 지지 않은 발전소만 대상 (밤에는 발전량 0 → 조회/추론/저장 생략)
+        plants, observations = [], []
+        night_count = 0
         for plant in crud.get_all_plants(db):
-            # 1. 날씨 및 일사량 조회
+            if not is_daylight(float(plant.latitude), float(plant.longitude), now):
+                night_count += 1
+                continue
             try:
-                weather = get_current_weather(float(plant.latitude), float(plant.longitude))
-                solar = get_current_irradiance(float(plant.latitude), float(plant.longitude))
+                weather, solar = archive.current(float(plant.latitude), float(plant.longitude))
             except Exception as e:
                 print(f"⚠️ API Error for plant {plant.id}: {e}")
                 continue
+            plants.append(plant)
+            observations.append((weather, solar))
 
-            # 2. 모델 입력 데이터 구성
-            weather_fc = [{
-                "datetime": now,
-                "temperature": weather.get("temperature", 0),
-                "cloud_cover": weather.get("cloud", 0),
-                "humidity": weather.get("humidity", 0)
-            }]
-            solar_fc = [{"irradiance": solar.get("ghi", 0)}]
-
-            # 3. 예측 수행
-            preds = predict_72h_power(weather_fc, solar_fc)
-            if not preds:
-                continue
+        if night_count:
+            print(f"🌙 Skipped {night_count} plants (night)")
 
-            predicted_power = preds[0]["predicted_power"]
-
-            # 4. 누적 발전량 계산 (핵심 로직)
-            last_gen = crud.get_latest_realtime_generation(db, plant.id)
-            
-            cumulative_power = predicted_power  # 기본값 (오늘 첫 데이터일 경우)
-
-            if last_gen:
-                # 마지막 기록이 '오늘' 것인지 확인
-                if last_gen.timestamp.date() == now.date():
-                    # 같은 날짜면 누적
-                    cumulative_power = last_gen.cumulative_power + predicted_power
-                else:
-                    # 날짜가 바뀌었으면(어제 데이터면) 리셋 후 현재 값만 사용
-                    print(f"🔄 Date changed for plant {plant.id}. Resetting cumulative power.")
-                    cumulative_power = predicted_power
-
-            # 5. DB 저장 (Upsert)
-            crud.insert_realtime_generation(
-                db=db,
-                plant_id=plant.id,
-                timestamp=now,
-                predicted_power=predicted_power,
-                cumulative_power=cumulative_power,
-                model_version="realtime-nhits-v1"
-            )
+        # 조회한 입력 원본은 추론 전에 먼저 저장
+        archive.flush(db)
+        db.commit()
+        phases.mark("fetch", plants=len(plants), api_calls=archive.calls)
+
+        if not plants:
+            return
+
+        # 2. 3일 예측 기준선 + 현재 관측으로 보정 (벡터 연산)
+        n = len(plants)
+        if REALTIME_MODE == "nowcast":
+            base = lookup_baselines([p.id for p in plants], now)
+            missing = np.flatnonzero(np.isnan(base[:, 0]))
+            if len(missing):
+                # 재시작/다른 워커/재개로 건너뛴 발전소는 저장된 예측으로 기준선 복원
+                missing_plants = [plants[i] for i in missing]
+                _seed_baselines(db, missing_plants, now)
+                base[missing] = lookup_baselines([p.id for p in missing_plants], now)
+        else:
+            base = np.full((n, 3), np.nan)
+        obs_ghi = np.array([s.get("ghi") for _, s in observations], dtype=np.float64)
+        obs_cloud = np.array([w.get("cloud") for w, _ in observations], dtype=np.float64)
+
+        powers, rerun = nowcast(base[:, 0], base[:, 1], base[:, 2], obs_ghi, obs_cloud)
+
+        # 3. 기준선이 없거나 편차가 큰 발전소만 모델 재실행 (한 번의 배치로)
+        rerun_idx = np.flatnonzero(rerun)
+        if len(rerun_idx):
+            requests = [
+                (
+                    observation_inputs(now, *observations[i]),
+                    context_store.history(plants[i].id, now - timedelta(hours=1)),
+                )
+                for i in rerun_idx
+            ]
+            for i, preds in zip(rerun_idx, predict_batch(requests)):
+                powers[i] = preds["predicted_power"][0] if len(preds["ds"]) else np.nan
+
+        print(f"🧮 Nowcast: {n - len(rerun_idx)} corrected / {len(rerun_idx)} model reruns")
+        phases.mark("inference", model_reruns=len(rerun_idx))
+
+        # 4. 누적 발전량 계산 (핵심 로직)
+        #    오늘 마지막 누적값을 발전소 전체에 대해 한 번에 조회 (오늘 기록이 없으면 0부터 누적)
+        #    (같은 시각 행은 재실행 시 덮어쓰므로 그 이전 기록을 기준으로 누적)
+        saved = ~np.isnan(powers)
+        saved_plants = [p for p, ok in zip(plants, saved) if ok]
+        saved_obs = [o for o, ok in zip(observations, saved) if ok]
+        powers = powers[saved]
+
+        last_cum = crud.get_today_cumulative(db, [p.id for p in saved_plants], before=now)
+        cumulative = np.array([last_cum.get(p.id, 0.0) for p in saved_plants], dtype=np.float64) + powers
+
+        # 5. DB 저장 (청크마다 발전량/관측 날씨 각각 한 번의 다중 행 UPSERT 후 커밋)
+        gen_rows = [
+            {
+                "plant_id": plant.id,
+                "timestamp": now,
+                "predicted_power": float(power),
+                "cumulative_power": float(cum),
+                "model_version": "realtime-nhits-v1",
+            }
+            for plant, power, cum in zip(saved_plants, powers, cumulative)
+        ]
+        weather_rows = [
+            {
+                "plant_id": plant.id,
+                "timestamp": now,
+                "temperature": weather.get("temperature"),
+                "insolation": solar.get("ghi"),
+                "humidity": weather.get("humidity"),
+                "cloud_cover": weather.get("cloud"),
+            }
+            for plant, (weather, solar) in zip(saved_plants, saved_obs)
+        ]
+
+        for chunk in _chunks(len(saved_plants)):
+            crud.upsert_realtime_generations(db, gen_rows[chunk])
+            crud.upsert_weathers(db, weather_rows[chunk])
+            db.commit()
+
+            # 6. 컨텍스트 링 버퍼 갱신 (다음 추론의 입력 이력, 커밋된 청크만)
+            for plant, (weather, solar), power, cum in zip(
+                saved_plants[chunk], saved_obs[chunk], powers[chunk], cumulative[chunk]
+            ):
+                context_store.append(
+                    plant.id, now,
+                    y=float(power),
+                    insolation=solar.get("ghi"),
+                    temp=weather.get("temperature"),
+                    cloud=cloud_amount(weather.get("cloud")),
+                    humidity=weather.get("humidity"),
+                )
+                print(f"✅ Realtime Saved | Plant: {plant.id} | Time: {now.hour}h | Power: {power:.2f} | Cum: {cum:.2f}")
 
-            print(f"✅ Realtime Saved | Plant: {plant.id} | Time: {now.hour}h | Power: {predicted_power:.2f} | Cum: {cumulative_power:.2f}")
+            # 7. 커밋된 청크를 구독 중인 대시보드에 푸시
+            publish_realtime(now, [
+                (row["plant_id"], row["predicted_power"], row["cumulative_power"])
+                for row in gen_rows[chunk]
+            ])
 
-        db.commit()
+        phases.mark("store", rows=len(gen_rows))
 
     except Exception as e:
         print(f"❌ Realtime Job Failed: {e}")
+        mark_job_failed(e)
         db.rollback()
     finally:
         db.close()
@@ -84,105 +274,290 @@ def realtime_job():
 # ============================================================
 # 📅 3일 예측 Job (매일 00:00 실행)
 # ============================================================
+def store_forecast(db, plant, preds, model_version="nhits-v1"):
+    """
+    발전소 1곳의 72시간 예측 저장 (Forecast 교체 + DailyForecast 재구축).
+    밤 시간대를 0으로 확정한 예측을 반환
+    """
+    plant_id = plant.id
+
+    # 밤 시간대는 0으로 확정하고 저장하지 않음 (조회 API에서 0으로 채움)
+    daylight = daylight_mask(float(plant.latitude), float(plant.longitude), preds["ds"])
+    preds = {
+        "ds": preds["ds"],
+        "predicted_power": np.where(daylight, preds["predicted_power"], 0.0),
+    }
+
+    # 4. 예측 기간 설정 (시작 ~ 끝)
+    start_dt = pd.Timestamp(preds["ds"][0]).to_pydatetime()
+    end_dt = pd.Timestamp(preds["ds"][-1]).to_pydatetime() + timedelta(hours=1) # 닫힌 구간 처리를 위해 +1시간
+
+    # 5. 기존 예측 삭제 (중복 방지)
+    crud.delete_forecasts_by_date_range(
+        db=db,
+        plant_id=plant_id,
+        start_time=start_dt,
+        end_time=end_dt,
+        model_version=model_version,
+    )
+
+    # 6. 시간별 예측(Forecast) 일괄 저장 (낮 시간대만)
+    crud.bulk_insert_hourly_forecasts(
+        db=db,
+        plant_id=plant_id,
+        forecast_times=preds["ds"][daylight],
+        predicted_powers=preds["predicted_power"][daylight],
+        model_version=model_version,
+    )
+
+    # 7. 일별 트렌드(DailyForecast) 재구축
+    crud.rebuild_daily_forecast(
+        db=db,
+        plant_id=plant_id,
+        model_version=model_version,
+        start_date=start_dt.date(),
+        end_date=(end_dt - timedelta(hours=1)).date(),
+    )
+
+    print(f"✅ Forecast Updated | Plant: {plant_id} | Range: {start_dt} ~ {end_dt}")
+    return preds
+
+
+def _store_plant_forecast(db, plant, inputs, preds):
+    """3일 예측 저장 + 실시간 나우캐스트 기준선으로 보관"""
+    preds = store_forecast(db, plant, preds)
+    register_baseline(plant.id, inputs, preds)
+
+
+def _predict_regional(plants, plant_inputs):
+    """지역 입력으로 1회 추론 후 발전소별로 분배"""
+    stacked = align_inputs(plant_inputs)
+    if not len(stacked["ds"]):
+        return [None] * len(plants)
+
+    capacities = [p.capacity_mw for p in plants]
+    preds = predict_72h_power(regional_inputs(stacked, capacities))
+    if not len(preds["ds"]):
+        return [None] * len(plants)
+
+    # 예측 시각에 맞춰 발전소별 일사량을 골라 분배
+    # (모델 horizon 이 입력 기간보다 길면 입력이 없는 시각은 분배할 수 없으므로 제외)
+    idx = np.clip(np.searchsorted(stacked["ds"], preds["ds"]), 0, len(stacked["ds"]) - 1)
+    matched = stacked["ds"][idx] == preds["ds"]
+    if not matched.any():
+        return [None] * len(plants)
+
+    ds = preds["ds"][matched]
+    powers = disaggregate(preds["predicted_power"][matched], capacities, stacked["insolation"][:, idx[matched]])
+
+    return [{"ds": ds, "predicted_power": row} for row in powers]
+
+
+def _predict_per_plant(plants, plant_inputs):
+    """발전소별 입력/이력으로 예측 (한 번의 배치 호출)"""
+    requests = [
+        (inputs, context_store.history(plant.id, pd.Timestamp(inputs["ds"][0]) - timedelta(hours=1)))
+        for plant, inputs in zip(plants, plant_inputs)
+    ]
+    return predict_batch(requests)
+
+
+@traced_job("forecast_3day")
 def forecast_3day_job():
+    """
+    발전소 id 순으로 JOB_CHUNK_PLANTS 개씩 저장/커밋.
+    같은 날 다시 실행하면 마지막으로 커밋한 발전소 다음부터, 예보 조회/추론에 실패했던 발전소와 함께 처리.
+    실패한 발전소가 남으면 회차 상태는 partial (다시 실행하면 그 발전소만 재시도).
+    """
     print(f"🔥 [Forecast Job] Started at {datetime.now()}")
     db = SessionLocal()
+    archive = InputArchive()
+    phases = JobPhases("forecast_3day")
 
     try:
-        for plant in crud.get_all_plants(db):
-            # 1. 3일치 예보 데이터 가져오기
-            wf = get_weather_forecast_3days(float(plant.latitude), float(plant.longitude))
-            sf = get_3day_irradiance_forecast(float(plant.latitude), float(plant.longitude))
-
-            if "forecast" not in wf or "forecast" not in sf:
+        run_key = date.today().isoformat()
+        resume_after, retry = _resume_state(db, "forecast_3day", run_key)
+        failed = set()
+
+        plants, plant_inputs = [], []
+        all_plants = crud.get_all_plants(db)
+        for plant in all_plants:
+            pending = _is_pending(plant.id, resume_after, retry)
+            # 지역 모드는 전체 발전소 입력으로 추론해야 하므로 저장 단계에서 건너뜀
+            if not pending and PREDICTION_MODE != "region":
                 continue
 
-            # 2. 데이터 매핑
-            weather_fc, solar_fc = [], []
-            for w, s in zip(wf["forecast"], sf["forecast"]):
-                dt = datetime.fromisoformat(w["timestamp"]).replace(tzinfo=None)
-                weather_fc.append({
-                    "datetime": dt,
-                    "temperature": w["temperature"],
-                    "humidity": w["humidity"],
-                    "cloud_cover": w["cloud"],
-                })
-                solar_fc.append({"irradiance": s["ghi"]})
-
-            if not weather_fc:
+            # 1~2. 3일치 예보 조회 + 데이터 매핑 (시각 기준 조인, 컬럼 배열)
+            #      연결 오류/타임아웃 등은 이 발전소만 실패로 기록하고 다음 발전소 진행
+            inputs = None
+            try:
+                wf, sf = archive.forecast(float(plant.latitude), float(plant.longitude))
+                if "forecast" in wf and "forecast" in sf:
+                    inputs = build_forecast_inputs(wf["forecast"], sf["forecast"])
+            except Exception as e:
+                print(f"⚠️ API Error for plant {plant.id}: {e}")
+            if inputs is None:
+                if pending:
+                    failed.add(plant.id)
                 continue
 
-            # 3. 모델 예측
-            preds = predict_72h_power(weather_fc, solar_fc)
-            if not preds:
-                continue
+            plants.append(plant)
+            plant_inputs.append(inputs)
 
-            # 4. 예측 기간 설정 (시작 ~ 끝)
-            start_dt = preds[0]["datetime"]
-            end_dt = preds[-1]["datetime"] + timedelta(hours=1) # 닫힌 구간 처리를 위해 +1시간
-
-            # 5. 기존 예측 삭제 (중복 방지)
-            crud.delete_forecasts_by_date_range(
-                db=db,
-                plant_id=plant.id,
-                start_time=start_dt,
-                end_time=end_dt,
-                model_version="nhits-v1",
+        # 조회한 입력 원본은 추론 전에 먼저 저장
+        archive.flush(db)
+        db.commit()
+        phases.mark("fetch", plants=len(plants), api_calls=archive.calls)
+
+        all_preds = []
+        if plants:
+            # 3. 모델 예측 (지역 1회 추론 + 분배 / 발전소별 배치 추론)
+            if PREDICTION_MODE == "region":
+                all_preds = _predict_regional(plants, plant_inputs)
+            else:
+                all_preds = _predict_per_plant(plants, plant_inputs)
+            phases.mark("inference", mode=PREDICTION_MODE)
+
+        work = []
+        for plant, inputs, preds in zip(plants, plant_inputs, all_preds):
+            if not _is_pending(plant.id, resume_after, retry):
+                continue
+            if preds is None or not len(preds["ds"]):
+                failed.add(plant.id)
+                continue
+            work.append((plant, inputs, preds))
+
+        # 4. 청크 단위 저장 + 커밋 (앞 청크는 실패와 무관하게 유지)
+        #    재시도한 발전소는 이전 진행 위치보다 앞일 수 있으므로 진행 위치는 뒤로 돌리지 않음
+        committed = resume_after
+        for chunk in _chunks(len(work)):
+            for plant, inputs, preds in work[chunk]:
+                _store_plant_forecast(db, plant, inputs, preds)
+            committed = max(committed or 0, work[chunk][-1][0].id)
+            crud.save_job_checkpoint(db, "forecast_3day", run_key, committed, failed_plant_ids=failed)
+            db.commit()
+
+            ds = work[chunk][0][2]["ds"]
+            publish_forecast(
+                [plant.id for plant, _, _ in work[chunk]],
+                pd.Timestamp(ds[0]).to_pydatetime(),
+                pd.Timestamp(ds[-1]).to_pydatetime() + timedelta(hours=1),
             )
 
-            # 6. 시간별 예측(Forecast) 저장
-            for p in preds:
-                crud.insert_hourly_forecast(
-                    db=db,
-                    plant_id=plant.id,
-                    forecast_time=p["datetime"],
-                    predicted_power=p["predicted_power"],
-                    model_version="nhits-v1",
-                )
-            
-            # flush로 ID 생성 등 확정
-            db.flush()
-
-            # 7. 일별 트렌드(DailyForecast) 재구축
-            crud.rebuild_daily_forecast(
-                db=db,
-                plant_id=plant.id,
-                model_version="nhits-v1",
-                start_date=start_dt.date(),
-                end_date=(end_dt - timedelta(hours=1)).date(),
+        if all_plants:
+            crud.save_job_checkpoint(
+                db, "forecast_3day", run_key, max(committed or 0, all_plants[-1].id),
+                status="partial" if failed else "done", failed_plant_ids=failed,
             )
-
-            print(f"✅ Forecast Updated | Plant: {plant.id} | Range: {start_dt} ~ {end_dt}")
-
-        db.commit()
+            db.commit()
+        if failed:
+            print(f"⚠️ Forecast failed for plants {sorted(failed)} (rerun today to retry)")
+        phases.mark("store", plants=len(work))
 
     except Exception as e:
         print(f"❌ Forecast Job Failed: {e}")
+        mark_job_failed(e)
         db.rollback()
     finally:
         db.close()
 
 
 # ============================================================
-# 🔄 실시간 데이터 초기화 Job (매일 00:00 실행)
+# 🗄 실시간 기록 보관 정책 Job (매일 00:01 실행)
+#   - 시간별 기록: HOURLY_RETENTION_DAYS 일 보관 후 일별 집계로 이관
+#   - 일별 집계: DAILY_RETENTION_DAYS 일 보관 후 월별 집계로 이관
+#   - 작은 청크마다 상위 집계에 더하고 같은 행을 삭제한 뒤 커밋 (락은 청크 하나 동안만, 실행당 처리량 상한)
+#     → 중간에 멈춰도, 집계 후 늦게 들어온 행이 있어도 각 행은 정확히 한 번 집계
+#   - 그 밖의 파티션 테이블: PARTITION_RETENTION_DAYS 를 설정한 경우에만 기간이 지난 월 파티션 삭제
 # ============================================================
-def reset_daily_realtime_job():
-    print(f"🔥 [Reset Job] Started at {datetime.now()}")
+def partition_retention_cutoff(table: str) -> Optional[date]:
+    """보관 기간을 설정한 파티션 테이블의 삭제 기준일 (이 날 이전에 끝나는 월 파티션 삭제). 설정하지 않았으면 None"""
+    days = PARTITION_RETENTION_DAYS.get(table, 0)
+    return date.today() - timedelta(days=days) if days > 0 else None
+
+
+def _fold_in_chunks(db, model, merge, *criteria) -> int:
+    """조건에 맞는 행을 RETENTION_DELETE_CHUNK 건씩 merge 로 상위 집계에 더하고 삭제, 청크마다 커밋"""
+    total = 0
+    while True:
+        ids = crud.get_chunk_ids(db, model, *criteria, chunk_size=RETENTION_DELETE_CHUNK)
+        if not ids:
+            break
+        merge(db, ids)
+        total += crud.delete_by_ids(db, model, ids)
+        db.commit()
+    return total
+
+
+@traced_job("retention")
+def retention_job():
+    print(f"🔥 [Retention Job] Started at {datetime.now()}")
     db = SessionLocal()
-    
+
     try:
-        # 오늘 00:00 이전의 데이터는 모두 삭제 (어제 데이터 삭제)
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today = date.today()
+
+        # 1. 시간별 → 일별
+        partitioned = is_partitioned(engine, "REALTIME_GENERATION")
+        hourly_cutoff = today - timedelta(days=HOURLY_RETENTION_DAYS)
+        if partitioned:
+            # 파티션 테이블은 행을 월 파티션째 삭제 → 집계가 행 수와 맞지 않는 날(미집계, 늦게 들어온 행)을 다시 집계
+            for day in crud.get_unrolled_realtime_days(db, hourly_cutoff)[:RETENTION_MAX_DAYS_PER_RUN]:
+                plants = crud.rollup_realtime_day(db, day)
+                db.commit()
+                print(f"🗜 Rolled up {day} | plants: {plants}")
+
+            # 집계가 끝났고 보관 기간도 지난 달의 파티션만 삭제
+            remaining = crud.get_unrolled_realtime_days(db, hourly_cutoff)
+            drop_partitions_before(engine, "REALTIME_GENERATION", remaining[0] if remaining else hourly_cutoff)
+        else:
+            # 가장 오래된 행부터 RETENTION_MAX_DAYS_PER_RUN 일치
+            oldest = crud.get_oldest_realtime_timestamp(db)
+            if oldest is not None and oldest.date() < hourly_cutoff:
+                until = min(hourly_cutoff, oldest.date() + timedelta(days=RETENTION_MAX_DAYS_PER_RUN))
+                deleted = _fold_in_chunks(
+                    db, RealtimeGeneration, crud.merge_realtime_daily,
+                    RealtimeGeneration.timestamp < datetime.combine(until, datetime.min.time()),
+                )
+                print(f"🗜 Rolled up hourly rows before {until} | rows removed: {deleted}")
+
+        # 2. 일별 → 월별 (보관 기간을 완전히 넘긴 달만, 실행당 1개월)
+        daily_cutoff = today - timedelta(days=DAILY_RETENTION_DAYS)
+        oldest_day = crud.get_oldest_realtime_daily_date(db)
+        if oldest_day is not None:
+            month_start = oldest_day.replace(day=1)
+            next_month = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+            if next_month <= daily_cutoff:
+                deleted = _fold_in_chunks(
+                    db, RealtimeGenerationDaily, crud.merge_realtime_monthly,
+                    RealtimeGenerationDaily.date < next_month,
+                )
+                print(f"🗜 Rolled up {month_start:%Y-%m} | daily rows removed: {deleted}")
 
-        deleted_count = db.query(RealtimeGeneration).filter(
-            RealtimeGeneration.timestamp < today_start
-        ).delete()
+        # 3. 보관 기간을 설정한 파티션 테이블은 기간이 지난 월 파티션만 삭제
+        for table in PARTITION_RETENTION_DAYS:
+            cutoff = partition_retention_cutoff(table)
+            if cutoff is not None and is_partitioned(engine, table):
+                drop_partitions_before(engine, table, cutoff)
 
-        db.commit()
-        print(f"🧹 Deleted {deleted_count} old realtime records.")
-        
     except Exception as e:
-        print(f"❌ Reset Job Failed: {e}")
+        print(f"❌ Retention Job Failed: {e}")
+        mark_job_failed(e)
         db.rollback()
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# ============================================================
+# 🧱 파티션 유지 Job (매일 00:03 실행)
+# ============================================================
+@traced_job("partition_maintenance")
+def partition_maintenance_job():
+    if not PARTITIONING_ENABLED:
+        return
+    print(f"🔥 [Partition Job] Started at {datetime.now()}")
+    try:
+        ensure_partitions(engine)
+    except Exception as e:
+        print(f"❌ Partition Job Failed: {e}")
+        mark_job_failed(e)
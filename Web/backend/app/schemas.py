@@ -31,7 +31,7 @@ class WeatherBase(BaseModel):
 class GenerationBase(BaseModel):
     plant_id: int
     timestamp: datetime
-    actual_power_mwh: Optional[float] = None
+    actual_power: Optional[float] = None
 
 
 class ForecastBase(BaseModel):
@@ -83,3 +83,44 @@ class DailyForecast(DailyForecastBase):
 
     class Config(Config):
         pass
+
+
+# --- Generation 롤업 (일/주/월 집계) ---
+class GenerationAggregate(BaseModel):
+    bucket_start: date
+    total_power: Optional[float] = None
+    min_power: Optional[float] = None
+    max_power: Optional[float] = None
+    count: int
+
+    class Config(Config):
+        pass
+
+
+class GenerationAggregateResponse(BaseModel):
+    plant_id: int
+    bucket: str   # day | week | month
+    items: List[GenerationAggregate]
+
+
+# --- Prediction (온디맨드 예측) ---
+class PredictHour(BaseModel):
+    datetime: datetime
+    temperature: Optional[float] = None
+    humidity: Optional[float] = None
+    cloud_cover: Optional[float] = None
+    irradiance: Optional[float] = None
+
+
+class PredictRequest(BaseModel):
+    # weather를 주지 않으면 plant_id의 3일 예보를 받아 예측
+    plant_id: Optional[int] = None
+    weather: Optional[List[PredictHour]] = None
+
+
+class PredictResponse(BaseModel):
+    # 컬럼형 응답: datetime[i] 시각의 예측값 = predicted_power[i]
+    plant_id: Optional[int] = None
+    count: int
+    datetime: List[datetime]
+    predicted_power: List[float]
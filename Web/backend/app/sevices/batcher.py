@@ -0,0 +1,103 @@
+# app/services/batcher.py
+# ============================================================
+# 비동기 마이크로 배처
+#   - 짧은 시간(max_wait) 안에 들어온 요청을 모아서
+#   - 한 번의 배치 함수 호출(스레드풀)로 처리한 뒤 결과를 돌려줌
+#   - 루프 태스크가 죽으면 같은 큐로 다시 시작 (대기 중인 요청은 그대로 처리)
+# ============================================================
+import asyncio
+from typing import Any, Callable, List, Optional
+
+
+class AsyncMicroBatcher:
+    def __init__(self, handler: Callable[[List[Any]], List[Any]], max_batch: int = 16, max_wait_ms: float = 5):
+        """
+        handler: 요청 리스트를 받아 같은 순서의 결과 리스트를 반환하는 동기 함수
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _ensure_started(self):
+        # 이벤트 루프가 떠 있는 상태(첫 요청 시점)에서 큐와 루프 태스크 생성
+        if self._task is not None and not self._task.done():
+            return
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # 큐는 이벤트 루프에 묶이므로 루프가 바뀐 경우에만 새로 만듦
+            self._fail_queued(RuntimeError("batcher restarted on a new event loop"))
+            self._queue = asyncio.Queue()
+            self._loop = loop
+        self._task = loop.create_task(self._run())
+
+    def _fail_queued(self, error: Exception):
+        """큐에 남은 요청을 모두 실패 처리 (호출자가 무한 대기하지 않도록)"""
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            _fail(future, error)
+
+    async def submit(self, item: Any) -> Any:
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect_batch(self):
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        try:
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+        except BaseException as e:
+            # 모으던 중 태스크가 취소/중단되면 이미 꺼낸 요청은 실패로 돌려줌
+            for _, future in batch:
+                _fail(future, e if isinstance(e, Exception) else RuntimeError("batcher stopped"))
+            raise
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            items = [item for item, _ in batch]
+
+            # 추론은 블로킹이므로 스레드풀에서 실행 (처리 중에 다음 배치가 쌓임)
+            try:
+                results = await loop.run_in_executor(None, self.handler, items)
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    _fail(future, RuntimeError("batcher stopped"))
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    _fail(future, e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._fail_queued(RuntimeError("batcher closed"))
+
+
+def _fail(future: asyncio.Future, error: BaseException):
+    if future.done():
+        return
+    try:
+        future.set_exception(error)
+    except RuntimeError:  # 이미 닫힌 이벤트 루프의 future
+        pass
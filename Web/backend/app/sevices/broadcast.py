@@ -0,0 +1,154 @@
+# app/services/broadcast.py
+# ============================================================
+# 실시간 갱신 푸시 (Server-Sent Events)
+#   - 스케줄러 Job(백그라운드 스레드)이 커밋 후 publish → API 이벤트 루프의 구독자 큐로 전달
+#   - 토픽: "fleet"(전체 발전소) / "plant:{id}"(발전소별)
+#   - 이벤트는 한 번만 직렬화해서 같은 바이트를 모든 구독자에게 전달 (대시보드 수와 무관)
+#   - 느린 구독자는 큐가 차면 가장 오래된 이벤트부터 버림 (클라이언트는 이벤트를 받으면 재조회)
+#   - 프로세스 단위 브로드캐스터: 스케줄러가 도는 프로세스의 구독자에게만 전달
+# ============================================================
+import asyncio
+import itertools
+import json
+import threading
+from datetime import date, datetime
+from typing import Dict, Optional, Set
+
+SUBSCRIBER_QUEUE_SIZE = 32
+HEARTBEAT_SECONDS = 15.0
+
+FLEET_TOPIC = "fleet"
+
+
+def plant_topic(plant_id: int) -> str:
+    return f"plant:{plant_id}"
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "item"):  # numpy 스칼라
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class Broadcaster:
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._topics: Dict[str, Set[asyncio.Queue]] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def subscribers(self) -> int:
+        with self._lock:
+            return sum(len(queues) for queues in self._topics.values())
+
+    # --------------------------------------------------------
+    # 구독 (이벤트 루프 안에서 호출)
+    # --------------------------------------------------------
+    def subscribe(self, topic: str) -> asyncio.Queue:
+        # 첫 구독 시점의 실행 중인 루프로 전달 (publish 는 다른 스레드에서 호출됨)
+        self._loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._topics.setdefault(topic, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, topic: str, queue: asyncio.Queue):
+        with self._lock:
+            queues = self._topics.get(topic)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if not queues:
+                del self._topics[topic]
+
+    async def stream(self, topic: str, heartbeat: float = HEARTBEAT_SECONDS):
+        """SSE 본문 생성기 (연결이 끊기면 구독 해제)"""
+        queue = self.subscribe(topic)
+        try:
+            # 연결 직후 재연결 간격 안내
+            yield b"retry: 5000\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    # 프록시가 유휴 연결을 끊지 않도록 주석 줄 전송
+                    yield b": keep-alive\n\n"
+        finally:
+            self.unsubscribe(topic, queue)
+
+    # --------------------------------------------------------
+    # 발행 (어느 스레드에서나 호출 가능)
+    # --------------------------------------------------------
+    def publish(self, topic: str, event: str, data: dict):
+        loop = self._loop
+        with self._lock:
+            has_subscribers = bool(self._topics.get(topic))
+        if loop is None or loop.is_closed() or not has_subscribers:
+            return
+
+        payload = json.dumps(data, default=_json_default, separators=(",", ":"))
+        message = f"id: {next(self._ids)}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8")
+        self.published += 1
+        try:
+            loop.call_soon_threadsafe(self._fan_out, topic, message)
+        except RuntimeError:
+            # 종료 중인 루프
+            pass
+
+    def _fan_out(self, topic: str, message: bytes):
+        with self._lock:
+            queues = list(self._topics.get(topic, ()))
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(message)
+
+
+broadcaster = Broadcaster()
+
+
+# ============================================================
+# Job 에서 사용하는 발행 헬퍼 (커밋 직후 호출)
+# ============================================================
+def publish_realtime(timestamp: datetime, rows):
+    """
+    rows: [(plant_id, predicted_power, cumulative_power), ...]
+    발전소별 토픽에는 한 건씩, fleet 토픽에는 컬럼 배열로 한 번에 발행
+    """
+    rows = list(rows)
+    if not rows:
+        return
+    for plant_id, power, cumulative in rows:
+        broadcaster.publish(plant_topic(plant_id), "realtime", {
+            "plant_id": plant_id,
+            "timestamp": timestamp,
+            "predicted_power": power,
+            "cumulative_power": cumulative,
+        })
+    broadcaster.publish(FLEET_TOPIC, "realtime", {
+        "timestamp": timestamp,
+        "plant_id": [r[0] for r in rows],
+        "predicted_power": [r[1] for r in rows],
+        "cumulative_power": [r[2] for r in rows],
+    })
+
+
+def publish_forecast(plant_ids, start: datetime, end: datetime):
+    """3일 예측 갱신 알림 (값은 클라이언트가 조회 API 로 다시 읽음)"""
+    plant_ids = list(plant_ids)
+    if not plant_ids:
+        return
+    for plant_id in plant_ids:
+        broadcaster.publish(plant_topic(plant_id), "forecast", {
+            "plant_id": plant_id, "start": start, "end": end,
+        })
+    broadcaster.publish(FLEET_TOPIC, "forecast", {
+        "plant_id": plant_ids, "start": start, "end": end,
+    })
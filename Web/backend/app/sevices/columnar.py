@@ -0,0 +1,87 @@
+# app/services/columnar.py
+# ============================================================
+# 시계열 응답 고속 경로 (컬럼형 JSON)
+#   - 행 객체 목록 대신 {"timestamp": [...], "값": [...]} 평행 배열
+#   - DB 에서 컬럼 튜플로 바로 읽어 Pydantic 검증 없이 직렬화
+#   - orjson 이 설치되어 있으면 사용, 없으면 표준 json (선택 의존성)
+# ============================================================
+import json
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from fastapi.responses import Response
+
+from app.request_timing import phase
+from app.sevices.solar_position import hourly_daylight
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "item"):  # numpy 스칼라
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        content, default=_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        with phase("serialize"):
+            return dumps(content)
+
+
+def to_columns(rows: Sequence, names: List[str]) -> Dict[str, list]:
+    """컬럼 튜플 목록 → 이름별 리스트"""
+    if not rows:
+        return {name: [] for name in names}
+    return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+
+def fill_hourly(
+    rows: Sequence,
+    names: List[str],
+    start: datetime,
+    end: datetime,
+    latitude: Optional[float],
+    longitude: Optional[float],
+    carry_forward: Iterable[str] = (),
+) -> Dict[str, list]:
+    """
+    (시각, 값...) 튜플을 start ~ end(미포함) 시간별 컬럼으로 채움.
+    저장하지 않은 밤 시각은 0, carry_forward 컬럼(누적값 등)은 직전 값 유지.
+    낮인데 행이 없는 시각은 데이터 누락이므로 None.
+    """
+    carry_forward = set(carry_forward)
+    by_time = {r[0]: r[1:] for r in rows}
+    value_names = names[1:]
+    columns = {name: [] for name in names}
+    last = [0.0] * len(value_names)
+
+    ts = start
+    for is_day in hourly_daylight(latitude, longitude, start, end):
+        row = by_time.get(ts)
+        columns[names[0]].append(ts)
+        for i, name in enumerate(value_names):
+            if row is not None:
+                value = last[i] = row[i]
+            elif is_day:
+                value = None
+            else:
+                value = last[i] if name in carry_forward else 0.0
+            columns[name].append(value)
+        ts += timedelta(hours=1)
+    return columns
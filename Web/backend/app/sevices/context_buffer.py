@@ -0,0 +1,129 @@
+# app/services/context_buffer.py
+# ============================================================
+# 발전소별 최근 이력 링 버퍼 (모델 입력 컨텍스트)
+#   - 시간 단위 슬롯(epoch hour % capacity)에 발전량/날씨를 보관
+#   - 서버 시작 시 DB(REALTIME_GENERATION + WEATHER)에서 1회 로드
+#   - realtime_job 이 매시 append
+#   - 추론 시 DB 조회 없이 연속된 최근 이력을 배열로 꺼내 씀
+#   - 운량은 모델 학습 단위(기상청 단기예보 전운량 0~10)로 보관
+#     (실황/WEATHER.cloud_cover 는 % 이므로 cloud_amount 로 환산해서 넣음)
+# ============================================================
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import numpy as np
+
+# 모델 학습 시 input_size = 24 * 30
+MODEL_INPUT_SIZE = int(os.getenv("MODEL_INPUT_SIZE", str(24 * 30)))
+
+CONTEXT_COLUMNS = ["y", "insolation", "temp", "cloud", "humidity"]
+
+_HOUR = np.timedelta64(1, "h")
+
+
+def cloud_amount(percent: Optional[float]) -> Optional[float]:
+    """운량(%) → 모델 입력 단위 전운량(0~10). 미래 입력(단기예보)과 같은 단위로 맞춤"""
+    return None if percent is None else percent / 10.0
+
+
+def _to_hour(ts: datetime) -> np.datetime64:
+    return np.datetime64(ts.replace(minute=0, second=0, microsecond=0), "h")
+
+
+class ContextRingBuffer:
+    """한 발전소의 최근 capacity 시간 이력"""
+
+    __slots__ = ("capacity", "hours", "values")
+
+    def __init__(self, capacity: int = MODEL_INPUT_SIZE):
+        self.capacity = capacity
+        # 슬롯에 실제로 들어있는 시각 (비어 있으면 NaT)
+        self.hours = np.full(capacity, np.datetime64("NaT"), dtype="datetime64[h]")
+        self.values = np.zeros((capacity, len(CONTEXT_COLUMNS)), dtype=np.float32)
+
+    def append(self, ts: datetime, y: float, insolation: float, temp: float, cloud: float, humidity: float):
+        """같은 시각이 다시 들어오면 덮어씀 (시간당 upsert와 동일)"""
+        hour = _to_hour(ts)
+        slot = hour.astype(np.int64) % self.capacity
+        self.hours[slot] = hour
+        self.values[slot] = [
+            v if v is not None else np.nan
+            for v in (y, insolation, temp, cloud, humidity)
+        ]
+
+    def history(self, end: datetime) -> Optional[Dict[str, np.ndarray]]:
+        """
+        end 시각에서 끝나는 연속된 시간 격자의 이력을 오래된 순으로 반환.
+        비어 있는 시각(밤 시간대 미저장 등)은 발전량/일사량 0, 나머지 날씨는 직전 값으로 채움.
+        데이터가 하나도 없으면 None.
+        """
+        end_hour = _to_hour(end)
+        expected = end_hour - np.arange(self.capacity)[::-1] * _HOUR   # 과거 → 최신
+        slots = expected.astype(np.int64) % self.capacity
+        valid = self.hours[slots] == expected
+
+        filled = np.flatnonzero(valid)
+        if not len(filled):
+            return None
+
+        # 가장 오래된 실제 데이터부터 end 까지 사용
+        expected = expected[filled[0]:]
+        valid = valid[filled[0]:]
+        values = self.values[slots[filled[0]:]].copy()
+
+        # 빈 시각: 직전 유효 행 인덱스로 forward-fill 후 y/insolation 은 0
+        last_valid = np.maximum.accumulate(np.where(valid, np.arange(len(valid)), 0))
+        values = values[last_valid]
+        values[~valid, 0] = 0.0   # y
+        values[~valid, 1] = 0.0   # insolation
+        values = np.nan_to_num(values)
+
+        history = {"ds": expected.astype("datetime64[ns]")}
+        for i, col in enumerate(CONTEXT_COLUMNS):
+            history[col] = values[:, i]
+        return history
+
+
+class ContextStore:
+    """plant_id → ContextRingBuffer"""
+
+    def __init__(self, capacity: int = MODEL_INPUT_SIZE):
+        self.capacity = capacity
+        self._buffers: Dict[int, ContextRingBuffer] = {}
+        self._lock = threading.Lock()
+
+    def _buffer(self, plant_id: int) -> ContextRingBuffer:
+        buf = self._buffers.get(plant_id)
+        if buf is None:
+            buf = self._buffers[plant_id] = ContextRingBuffer(self.capacity)
+        return buf
+
+    def append(self, plant_id: int, ts: datetime, **values):
+        with self._lock:
+            self._buffer(plant_id).append(ts, **values)
+
+    def history(self, plant_id: int, end: datetime) -> Optional[Dict[str, np.ndarray]]:
+        with self._lock:
+            buf = self._buffers.get(plant_id)
+            return buf.history(end) if buf is not None else None
+
+    def load_from_db(self, db, now: Optional[datetime] = None):
+        """서버 시작 시 최근 capacity 시간의 이력을 한 번에 읽어 버퍼를 채움"""
+        from .. import crud
+
+        now = now or datetime.now()
+        since = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=self.capacity)
+
+        rows = crud.get_context_rows(db, since)
+        with self._lock:
+            for plant_id, ts, y, insolation, temp, cloud, humidity in rows:
+                self._buffer(plant_id).append(
+                    ts, y=y, insolation=insolation, temp=temp, cloud=cloud_amount(cloud), humidity=humidity
+                )
+        print(f"📚 Context buffers loaded: {len(self._buffers)} plants, {len(rows)} rows")
+
+
+# 프로세스 전역 저장소 (API + 스케줄러 공용)
+context_store = ContextStore()
@@ -0,0 +1,169 @@
+# app/services/downsample.py
+# ============================================================
+# 시계열 다운샘플링 (LTTB: Largest-Triangle-Three-Buckets)
+#   - 긴 기간 차트를 max_points 개 점으로 줄이되 피크/골 모양은 유지
+#   - 원본 행의 인덱스를 돌려주므로 선택된 행을 그대로 응답에 사용
+#   - DB 조회는 StreamingLTTB 로 청크 단위 2회 스트리밍 (전체 기간을 메모리에 올리지 않음)
+# ============================================================
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    x(시각, 오름차순 숫자), y(값) 에서 남길 점의 인덱스.
+    첫/마지막 점은 항상 포함. 점 수가 max_points 이하이면 전체 반환.
+    """
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    # 첫/마지막 점을 뺀 나머지를 max_points - 2 개 구간으로 나눔
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+
+    out = np.empty(max_points, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+
+        # 다음 구간의 평균점 (마지막 구간이면 마지막 점)
+        if i + 2 < len(edges):
+            nlo, nhi = edges[i + 1], edges[i + 2]
+            cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        else:
+            cx, cy = x[n - 1], y[n - 1]
+
+        # 직전 선택점 a, 후보점, 다음 구간 평균점이 이루는 삼각형 넓이가 최대인 점
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        out[i + 1] = a
+
+    return out
+
+
+def downsample_rows(rows: list, x_attr: str, y_attr: str, max_points: int) -> list:
+    """행 목록(시각순)을 LTTB 로 줄여 선택된 행만 반환"""
+    if len(rows) <= max_points:
+        return rows
+
+    x = np.array(
+        [getattr(r, x_attr) for r in rows], dtype="datetime64[s]"
+    ).astype(np.int64)
+    y = np.array(
+        [getattr(r, y_attr) for r in rows], dtype=np.float64
+    )
+    return [rows[i] for i in lttb_indices(x, y, max_points)]
+
+
+def _points(rows: list, x_attr: str, y_attr: str):
+    x = np.array([getattr(r, x_attr) for r in rows], dtype="datetime64[s]").astype(np.int64)
+    y = np.nan_to_num(np.array([getattr(r, y_attr) for r in rows], dtype=np.float64))
+    return x, y
+
+
+class StreamingLTTB:
+    """
+    행 수(n)를 먼저 알고 시각순 행을 청크 단위로 두 번 훑어 lttb_indices 와 같은 점을 고름.
+    메모리는 구간 평균 max_points 개 + 청크 하나 (n 과 무관)
+      1차 feed_means(chunk): 구간별 평균점
+      2차 feed_select(chunk): 구간별로 삼각형 넓이가 최대인 행 → finish() 가 선택된 행 반환
+    3 <= max_points < n 일 때 사용 (n 이 max_points 이하이면 전체를 그대로 반환)
+    """
+
+    def __init__(self, n: int, max_points: int, x_attr: str, y_attr: str):
+        self.n = n
+        self.x_attr, self.y_attr = x_attr, y_attr
+        # lttb_indices 와 같은 구간 경계: 첫/마지막 점을 뺀 나머지를 max_points - 2 개 구간으로
+        self.edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+        buckets = max_points - 2
+
+        self._sum = np.zeros((buckets, 2))
+        self._count = np.zeros(buckets)
+        self._x0 = None                   # 시각 기준점 (초 단위 큰 수의 합산 오차 방지)
+        self._last = None                 # 마지막 점 (마지막 구간의 '다음 평균점')
+        self._seen = 0
+
+        self._next = None                 # 구간별 다음 구간 평균점
+        self._selected = 0
+        self._a = None                    # 직전 선택점
+        self._bucket = -1                 # 선택 중인 구간
+        self._best = None                 # (넓이, 행, x, y)
+        self.rows: list = []
+
+    def _index(self, offset: int, size: int):
+        k = offset + np.arange(size)
+        inner = np.flatnonzero((k >= 1) & (k < self.n - 1))
+        return k, inner, np.searchsorted(self.edges, k[inner], side="right") - 1
+
+    def feed_means(self, chunk: list):
+        if not len(chunk):
+            return
+        x, y = _points(chunk, self.x_attr, self.y_attr)
+        if self._x0 is None:
+            self._x0 = x[0]
+        x = (x - self._x0).astype(np.float64)
+
+        k, inner, buckets = self._index(self._seen, len(chunk))
+        self._seen += len(chunk)
+        np.add.at(self._sum, buckets, np.column_stack([x[inner], y[inner]]))
+        np.add.at(self._count, buckets, 1)
+
+        last = np.flatnonzero(k == self.n - 1)
+        if len(last):
+            self._last = (x[last[0]], y[last[0]])
+
+    def _finish_bucket(self):
+        if self._best is not None:
+            _, row, bx, by = self._best
+            self.rows.append(row)
+            self._a = (bx, by)
+            self._best = None
+
+    def feed_select(self, chunk: list):
+        if not len(chunk):
+            return
+        if self._next is None:
+            means = self._sum / np.maximum(self._count, 1)[:, None]
+            self._next = np.vstack([means[1:], [self._last or means[-1]]])
+
+        x, y = _points(chunk, self.x_attr, self.y_attr)
+        if self._x0 is None:
+            self._x0 = x[0]
+        x = (x - self._x0).astype(np.float64)
+        k, inner, buckets = self._index(self._selected, len(chunk))
+        self._selected += len(chunk)
+
+        if k[0] == 0:
+            self.rows.append(chunk[0])
+            self._a = (x[0], y[0])
+
+        # 청크 안에서 같은 구간은 연속 → 구간별로 잘라 벡터 계산
+        for bucket in np.unique(buckets):
+            idx = inner[buckets == bucket]
+            if bucket != self._bucket:
+                self._finish_bucket()
+                self._bucket = bucket
+            (ax, ay), (cx, cy) = self._a, self._next[bucket]
+            area = np.abs((ax - cx) * (y[idx] - ay) - (ax - x[idx]) * (cy - ay))
+            j = int(np.argmax(area))
+            # 앞 청크의 같은 구간 후보와 넓이가 같으면 앞쪽 유지 (np.argmax 와 동일)
+            if self._best is None or area[j] > self._best[0]:
+                self._best = (area[j], chunk[idx[j]], x[idx[j]], y[idx[j]])
+
+        last = np.flatnonzero(k == self.n - 1)
+        if len(last):
+            self._finish_bucket()
+            self.rows.append(chunk[last[0]])
+
+    def finish(self) -> list:
+        """선택된 행 (두 조회 사이에 행 수가 줄었어도 마지막 구간까지 반영)"""
+        self._finish_bucket()
+        return self.rows
@@ -0,0 +1,190 @@
+# app/services/export.py
+# ============================================================
+# 대용량 내보내기 (CSV / NDJSON / Arrow IPC 스트림)
+#   - 서버측 커서(stream_results + yield_per)로 청크 단위 조회
+#   - 청크마다 바로 직렬화해 흘려보내므로 내보내기 크기와 무관하게 메모리 일정
+#   - Arrow 는 pyarrow 가 설치된 경우에만 사용 가능
+# ============================================================
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from typing import Iterator, List, Optional
+
+from sqlalchemy import Date, DateTime, Float, Integer, Numeric, select
+
+from app.models import DailyForecast, Forecast, Generation, RealtimeGeneration, Weather
+
+try:
+    import pyarrow as pa
+except ImportError:  # 선택 의존성
+    pa = None
+
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "5000"))
+
+# 내보내기 이름 -> (모델, 기간 필터 컬럼)
+EXPORT_TABLES = {
+    "generation": (Generation, "timestamp"),
+    "weather": (Weather, "timestamp"),
+    "forecast": (Forecast, "forecast_time"),
+    "daily_forecast": (DailyForecast, "forecast_date"),
+    "realtime_generation": (RealtimeGeneration, "timestamp"),
+}
+
+# 포맷 -> (media type, 파일 확장자)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+
+
+def arrow_available() -> bool:
+    return pa is not None
+
+
+# ============================================================
+# 조회: 서버측 커서로 청크 단위 Row 목록 생성
+# ============================================================
+def _iter_chunks(
+    session_factory,
+    table_name: str,
+    plant_ids: Optional[List[int]],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    chunk_rows: int,
+) -> Iterator[list]:
+    model, time_attr = EXPORT_TABLES[table_name]
+    table = model.__table__
+    time_col = table.c[time_attr]
+
+    # DATE 컬럼은 날짜로 비교
+    if isinstance(time_col.type, Date) and not isinstance(time_col.type, DateTime):
+        start = start.date() if start else None
+        end = end.date() if end else None
+
+    stmt = select(table)
+    if plant_ids:
+        stmt = stmt.where(table.c.plant_id.in_(plant_ids))
+    if start is not None:
+        stmt = stmt.where(time_col >= start)
+    if end is not None:
+        stmt = stmt.where(time_col <= end)
+    stmt = stmt.order_by(table.c.plant_id, time_col)
+
+    db = session_factory()
+    try:
+        result = db.execute(
+            stmt,
+            execution_options={"stream_results": True, "yield_per": chunk_rows},
+        )
+        for part in result.partitions():
+            yield part
+    finally:
+        db.close()
+
+
+# ============================================================
+# 직렬화
+# ============================================================
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_stream(columns: List[str], chunks) -> Iterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+    # 행이 없을 때도 헤더는 보냄
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+def _ndjson_stream(columns: List[str], chunks) -> Iterator[bytes]:
+    for rows in chunks:
+        lines = [
+            json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False)
+            for row in rows
+        ]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _arrow_type(col_type):
+    if isinstance(col_type, DateTime):
+        return pa.timestamp("s")
+    if isinstance(col_type, Date):
+        return pa.date32()
+    if isinstance(col_type, Integer):
+        return pa.int64()
+    if isinstance(col_type, (Float, Numeric)):
+        return pa.float64()
+    return pa.string()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Arrow 스트림 writer 가 쓴 바이트를 모아두었다가 청크마다 꺼내는 싱크"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _arrow_stream(table, chunks) -> Iterator[bytes]:
+    schema = pa.schema([(c.name, _arrow_type(c.type)) for c in table.columns])
+    sink = _ChunkSink()
+    writer = pa.ipc.new_stream(sink, schema)
+
+    for rows in chunks:
+        columns = list(zip(*rows))
+        writer.write_batch(pa.RecordBatch.from_arrays(
+            [pa.array(col, type=field.type) for col, field in zip(columns, schema)],
+            schema=schema,
+        ))
+        yield sink.drain()
+
+    writer.close()  # EOS 마커
+    yield sink.drain()
+
+
+def export_stream(
+    session_factory,
+    table_name: str,
+    fmt: str,
+    plant_ids: Optional[List[int]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """
+    StreamingResponse 용 바이트 제너레이터.
+    요청 세션과 별개로 session_factory 로 자체 세션을 열고, 스트림이 끝나면 닫음
+    """
+    model, _ = EXPORT_TABLES[table_name]
+    table = model.__table__
+    columns = [c.name for c in table.columns]
+    chunks = _iter_chunks(session_factory, table_name, plant_ids, start, end, chunk_rows)
+
+    if fmt == "csv":
+        return _csv_stream(columns, chunks)
+    if fmt == "ndjson":
+        return _ndjson_stream(columns, chunks)
+    return _arrow_stream(table, chunks)
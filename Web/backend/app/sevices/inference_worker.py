@@ -0,0 +1,184 @@
+# app/services/inference_worker.py
+# ============================================================
+# 로컬 추론 워커 (사이드카 프로세스)
+#   - 모델을 이 프로세스에 1회만 로드
+#   - API / 스케줄러는 로컬 소켓으로 예측 요청을 보냄
+#   - 동시에 들어온 요청은 마이크로 배치로 묶어 한 번에 추론
+#
+# 실행: (Web/backend 에서)
+#   python -m app.sevices.inference_worker
+# ============================================================
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import Listener, Client
+from typing import List, Dict, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+# 워커는 받은 메시지를 pickle 로 복원하므로 기본 키 없이 반드시 직접 지정 (워커/클라이언트 동일)
+WORKER_AUTHKEY = os.getenv("INFERENCE_WORKER_AUTHKEY")
+WORKER_MAX_BATCH = int(os.getenv("INFERENCE_WORKER_MAX_BATCH", "32"))
+WORKER_MAX_WAIT_MS = float(os.getenv("INFERENCE_WORKER_MAX_WAIT_MS", "10"))
+
+
+def require_authkey() -> bytes:
+    if not WORKER_AUTHKEY:
+        raise ValueError("INFERENCE_WORKER_AUTHKEY 환경 변수가 설정되어 있지 않습니다.")
+    return WORKER_AUTHKEY.encode()
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """'host:port' 문자열 → (host, port)"""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+# ============================================================
+# 🖥 워커 (서버 측)
+# ============================================================
+class _PendingRequest:
+    """배치 큐에 들어가는 단일 예측 요청"""
+
+    def __init__(self, item):
+        self.item = item
+        self.result = None
+        self.done = threading.Event()
+
+
+class InferenceWorker:
+    def __init__(self, address: Tuple[str, int], max_batch: int = WORKER_MAX_BATCH, max_wait_ms: float = WORKER_MAX_WAIT_MS):
+        self.address = address
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[_PendingRequest]" = queue.Queue()
+
+    def _collect_batch(self) -> List[_PendingRequest]:
+        """첫 요청을 기다린 뒤 max_wait 동안 들어온 요청을 max_batch까지 모음"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _batch_loop(self):
+        from .prediction import predict_batch_local, empty_result
+
+        while True:
+            batch = self._collect_batch()
+            try:
+                results = predict_batch_local([p.item for p in batch])
+            except Exception as e:
+                print(f"❌ [Inference Worker] Batch failed: {e}")
+                results = [empty_result() for _ in batch]
+
+            for pending, result in zip(batch, results):
+                pending.result = result
+                pending.done.set()
+
+    def _serve_connection(self, conn):
+        try:
+            while True:
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    break
+
+                pendings = [_PendingRequest(item) for item in message.get("items", [])]
+                for p in pendings:
+                    self._queue.put(p)
+                for p in pendings:
+                    p.done.wait()
+
+                conn.send({"ok": True, "results": [p.result for p in pendings]})
+        finally:
+            conn.close()
+
+    def serve_forever(self):
+        from .prediction import get_model
+
+        authkey = require_authkey()
+
+        # 요청을 받기 전에 모델을 미리 올려둠
+        get_model()
+
+        threading.Thread(target=self._batch_loop, daemon=True).start()
+
+        with Listener(self.address, authkey=authkey) as listener:
+            print(f"🚀 Inference worker listening on {self.address[0]}:{self.address[1]} "
+                  f"(max_batch={self.max_batch}, max_wait={self.max_wait * 1000:.0f}ms)")
+            while True:
+                conn = listener.accept()
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+
+# ============================================================
+# 📡 클라이언트 (API / 스케줄러 측)
+# ============================================================
+class InferenceClient:
+    """스레드마다 워커와의 연결을 하나씩 유지하는 클라이언트"""
+
+    def __init__(self, address: Tuple[str, int]):
+        self.address = address
+        self.authkey = require_authkey()
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = Client(self.address, authkey=self.authkey)
+            self._local.conn = conn
+        return conn
+
+    def _reset(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+        self._local.conn = None
+
+    def predict_batch(self, requests: List[Tuple]) -> List[Dict]:
+        message = {"op": "predict", "items": list(requests)}
+
+        # 워커 재시작 등으로 연결이 끊긴 경우 1회 재연결
+        for attempt in range(2):
+            try:
+                conn = self._connection()
+                conn.send(message)
+                reply = conn.recv()
+                return reply["results"]
+            except (EOFError, OSError) as e:
+                self._reset()
+                if attempt == 1:
+                    print(f"❌ Inference worker unavailable: {e}")
+
+        from .prediction import empty_result
+        return [empty_result() for _ in requests]
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> InferenceClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from .prediction import INFERENCE_WORKER_ADDRESS
+                _client = InferenceClient(parse_address(INFERENCE_WORKER_ADDRESS))
+    return _client
+
+
+if __name__ == "__main__":
+    address = os.getenv("INFERENCE_WORKER_ADDRESS", "127.0.0.1:6010")
+    InferenceWorker(parse_address(address)).serve_forever()
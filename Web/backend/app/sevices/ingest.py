@@ -0,0 +1,242 @@
+# app/services/ingest.py
+# ============================================================
+# 실측 발전량(SCADA/계량기) 대량 수집
+#   - CSV(헤더 필수) / NDJSON 을 줄 단위로 받아 검증
+#   - 청크 안에서 (plant_id, timestamp) 중복 제거 (나중 값 우선)
+#   - 청크마다 발전소 잠금 → 다중 행 UPSERT → 건드린 일/주/월 롤업 구간을 원본에서 재계산 → 커밋
+#     (같은 발전소를 올리는 동시 업로드는 청크 단위로 순서대로 반영, 재계산이라 중복 집계 없음)
+#   - 청크마다 커밋하므로 중간 청크가 실패하면 앞 청크는 남음 → UPSERT 라 같은 파일을 다시 올리면 됨
+#
+# API:  POST /ingest/generation?format=csv|ndjson
+# CLI:  python -m app.sevices.ingest data.csv [more.ndjson ...]
+# ============================================================
+import csv
+import json
+import math
+import os
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.orm import Session
+
+from app import crud
+
+INGEST_CHUNK_ROWS = int(os.getenv("INGEST_CHUNK_ROWS", "5000"))
+MAX_ERROR_SAMPLES = 20
+REQUIRED_FIELDS = ("plant_id", "timestamp", "actual_power")
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+class GenerationIngestor:
+    """
+    한 번의 업로드(또는 파일)를 처리하는 상태 객체.
+    feed_lines 로 줄을 계속 넣고 마지막에 finish 호출.
+    """
+
+    def __init__(self, db: Session, fmt: str = "csv", chunk_rows: int = INGEST_CHUNK_ROWS):
+        if fmt not in ("csv", "ndjson"):
+            raise ValueError(f"Unsupported format: {fmt}")
+
+        self.db = db
+        self.fmt = fmt
+        self.chunk_rows = chunk_rows
+        self.plant_ids = {p.id for p in crud.get_all_plants(db)}
+
+        self._header: Optional[List[str]] = None
+        self._line_no = 0
+        self._pending: Dict[Tuple[int, datetime], float] = {}
+
+        self.received = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.errors: List[str] = []
+
+    # --------------------------------------------------------
+    # 파싱 / 검증
+    # --------------------------------------------------------
+    def _reject(self, message: str):
+        self.rejected += 1
+        if len(self.errors) < MAX_ERROR_SAMPLES:
+            self.errors.append(f"line {self._line_no}: {message}")
+
+    def _parse(self, line: str) -> Optional[dict]:
+        if self.fmt == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                self._reject(f"invalid json ({e})")
+                return None
+            if not isinstance(record, dict):
+                self._reject("not an object")
+                return None
+            return record
+
+        values = next(csv.reader([line]))
+        if len(values) != len(self._header):
+            self._reject(f"expected {len(self._header)} columns, got {len(values)}")
+            return None
+        return dict(zip(self._header, values))
+
+    def _validate(self, record: dict) -> Optional[Tuple[int, datetime, float]]:
+        try:
+            plant_id = int(record["plant_id"])
+            ts = record["timestamp"]
+            ts = ts if isinstance(ts, datetime) else datetime.fromisoformat(str(ts).strip())
+            power = float(record["actual_power"])
+        except KeyError as e:
+            self._reject(f"missing field {e}")
+            return None
+        except (TypeError, ValueError) as e:
+            self._reject(str(e))
+            return None
+
+        if plant_id not in self.plant_ids:
+            self._reject(f"unknown plant_id {plant_id}")
+            return None
+        if not math.isfinite(power) or power < 0:
+            self._reject(f"invalid actual_power {power}")
+            return None
+
+        # DB 는 KST naive 로 저장
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(KST).replace(tzinfo=None)
+
+        return plant_id, ts, power
+
+    def feed_lines(self, lines: Iterable[str]):
+        for line in lines:
+            self._line_no += 1
+            line = line.strip()
+            if not line:
+                continue
+
+            if self.fmt == "csv" and self._header is None:
+                self._header = [h.strip() for h in next(csv.reader([line]))]
+                missing = [f for f in REQUIRED_FIELDS if f not in self._header]
+                if missing:
+                    raise ValueError(f"CSV header missing columns: {', '.join(missing)}")
+                continue
+
+            self.received += 1
+            record = self._parse(line)
+            if record is None:
+                continue
+
+            row = self._validate(record)
+            if row is None:
+                continue
+
+            plant_id, ts, power = row
+            if (plant_id, ts) in self._pending:
+                self.duplicates += 1
+            self._pending[(plant_id, ts)] = power
+
+            if len(self._pending) >= self.chunk_rows:
+                self.flush()
+
+    # --------------------------------------------------------
+    # 저장
+    # --------------------------------------------------------
+    def flush(self):
+        """대기 중인 행을 UPSERT 하고 건드린 롤업 구간을 재계산한 뒤 커밋 (실패 시 이 청크만 롤백)"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        try:
+            # 같은 발전소를 쓰는 다른 업로드의 청크가 끝날 때까지 대기 → 읽기/UPSERT/재계산이 한 단위
+            crud.lock_plants(self.db, {plant_id for plant_id, _ in pending})
+            existing = crud.get_generation_values(self.db, pending.keys(), locked=True)
+
+            inserted = updated = unchanged = 0
+            days: Dict[int, List[datetime]] = {}
+            upserts = []
+            for (plant_id, ts), power in pending.items():
+                if (plant_id, ts) not in existing:
+                    inserted += 1
+                elif existing[(plant_id, ts)] != power:
+                    updated += 1
+                else:
+                    unchanged += 1
+                    continue
+                days.setdefault(plant_id, []).append(ts)
+                upserts.append({"plant_id": plant_id, "timestamp": ts, "actual_power": power})
+
+            crud.upsert_generations(self.db, upserts)
+
+            # 증분 누적 대신 건드린 구간을 원본에서 재계산 (기간이 같은 발전소는 한 번에)
+            ranges: Dict[Tuple, List[int]] = {}
+            for plant_id, times in days.items():
+                ranges.setdefault((min(times).date(), max(times).date()), []).append(plant_id)
+            for (first, last), plant_ids in ranges.items():
+                crud.rebuild_generation_rollups(self.db, plant_ids, first, last)
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self.inserted += inserted
+        self.updated += updated
+        self.unchanged += unchanged
+
+    def finish(self) -> dict:
+        self.flush()
+        return {
+            "received": self.received,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "duplicates": self.duplicates,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+def _guess_format(path: str) -> str:
+    return "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from app.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="실측 발전량 CSV/NDJSON 수집")
+    parser.add_argument("files", nargs="+", help="입력 파일 ('-' 이면 표준입력)")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="생략 시 확장자로 판단")
+    parser.add_argument("--chunk-rows", type=int, default=INGEST_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        for path in args.files:
+            fmt = args.format or _guess_format(path)
+            started = time.perf_counter()
+            ingestor = GenerationIngestor(db, fmt, args.chunk_rows)
+
+            if path == "-":
+                ingestor.feed_lines(sys.stdin)
+            else:
+                with open(path, encoding="utf-8-sig", newline="") as f:
+                    ingestor.feed_lines(f)
+            result = ingestor.finish()
+
+            elapsed = time.perf_counter() - started
+            rate = result["received"] / elapsed if elapsed > 0 else 0
+            print(
+                f"✅ {path}: {result['inserted']} inserted, {result['updated']} updated, "
+                f"{result['unchanged']} unchanged, {result['rejected']} rejected "
+                f"({elapsed:.1f}s, {rate:,.0f} rows/s)"
+            )
+            for err in result["errors"]:
+                print(f"   ⚠️ {err}")
+    finally:
+        db.close()
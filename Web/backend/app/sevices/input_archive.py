@@ -0,0 +1,189 @@
+# app/services/input_archive.py
+# ============================================================
+# 외부 API 입력 보관 (WEATHER_INPUT)
+#   - Job 1회 실행 동안 격자별로 한 번만 조회 (같은 격자의 발전소는 결과 공유)
+#   - 조회한 관측/예보 원본을 모아 두었다가 Job 커밋 직전에 한 번에 UPSERT
+#   - 백필/재학습/재현은 외부 API 대신 이 테이블을 읽음
+#     (기상청은 과거 발표 시각의 예보를 제공하지 않음)
+#   - 보관 입력 → 모델 입력 변환은 백필과 나우캐스트 기준선 복원이 함께 사용
+# ============================================================
+import bisect
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app import crud
+from app.weather_service import convert_to_grid, get_current_weather, get_weather_forecast_3days
+from app.solar_service import get_current_irradiance, get_3day_irradiance_forecast
+from app.sevices.prediction import build_forecast_inputs
+
+# Open-Meteo 는 자체 격자로 보간하므로 소수 둘째 자리(~1km)로 묶어도 결과가 같음
+OPEN_METEO_GRID_DECIMALS = 2
+
+# 3일 예보 입력 기간
+FORECAST_HORIZON_HOURS = 72
+
+
+def kma_grid(lat: float, lon: float) -> str:
+    nx, ny = convert_to_grid(lat, lon)
+    return f"{nx},{ny}"
+
+
+def open_meteo_coords(lat: float, lon: float) -> Tuple[float, float]:
+    return round(lat, OPEN_METEO_GRID_DECIMALS), round(lon, OPEN_METEO_GRID_DECIMALS)
+
+
+def open_meteo_grid(lat: float, lon: float) -> str:
+    lat, lon = open_meteo_coords(lat, lon)
+    return f"{lat:.{OPEN_METEO_GRID_DECIMALS}f},{lon:.{OPEN_METEO_GRID_DECIMALS}f}"
+
+
+def _kma_base_time(result: Dict) -> datetime:
+    return datetime.strptime(result["base_date"] + result["base_time"], "%Y%m%d%H%M")
+
+
+def _local(ts: str) -> datetime:
+    """ISO 문자열 → KST naive (시간대 포함 시 제거)"""
+    return pd.Timestamp(ts).tz_localize(None).to_pydatetime()
+
+
+class InputArchive:
+    """Job 1회 실행용 격자 단위 조회 캐시 + 보관 행 버퍼"""
+
+    def __init__(self):
+        self.fetched_at = datetime.now().replace(minute=0, second=0, microsecond=0)
+        self._cache: Dict[Tuple[str, str], Dict] = {}
+        self._rows: Dict[Tuple, Dict] = {}
+        self.calls = 0
+
+    def _fetch(self, kind: str, grid: str, fn, *args) -> Dict:
+        key = (kind, grid)
+        if key not in self._cache:
+            self.calls += 1
+            self._cache[key] = fn(*args)
+        return self._cache[key]
+
+    def _record(self, source: str, grid: str, base_time: datetime, forecast_time: datetime, **values):
+        self._rows[(source, grid, base_time, forecast_time)] = {
+            "source": source,
+            "grid": grid,
+            "base_time": base_time,
+            "forecast_time": forecast_time,
+            "temperature": values.get("temperature"),
+            "humidity": values.get("humidity"),
+            "cloud": values.get("cloud"),
+            "insolation": values.get("insolation"),
+        }
+
+    # --------------------------------------------------------
+    # 실시간: 초단기실황(실패 시 초단기예보) + 현재 일사량
+    # --------------------------------------------------------
+    def current(self, lat: float, lon: float) -> Tuple[Dict, Dict]:
+        kgrid = kma_grid(lat, lon)
+        first = ("obs", kgrid) not in self._cache
+        weather = self._fetch("obs", kgrid, get_current_weather, lat, lon)
+        if first and not weather.get("error"):
+            base = _kma_base_time(weather)
+            if weather.get("data_source") == "ultra_short_forecast":
+                target = base.replace(hour=int(weather["forecast_time"][:2]), minute=0)
+                if target < base:
+                    target += timedelta(days=1)
+                source = "kma_ufcst"
+            else:
+                target, source = base, "kma_obs"
+            self._record(
+                source, kgrid, base, target,
+                temperature=weather.get("temperature"),
+                humidity=weather.get("humidity"),
+                cloud=weather.get("cloud"),
+            )
+
+        ogrid = open_meteo_grid(lat, lon)
+        first = ("irr", ogrid) not in self._cache
+        solar = self._fetch("irr", ogrid, get_current_irradiance, *open_meteo_coords(lat, lon))
+        if first and solar.get("ghi") is not None:
+            # 3일 예보(openmeteo)와 섞이지 않도록 별도 source 로 보관
+            self._record(
+                "openmeteo_now", ogrid, self.fetched_at, self.fetched_at,
+                insolation=solar["ghi"],
+            )
+
+        return weather, solar
+
+    # --------------------------------------------------------
+    # 3일 예보: 기상청 단기예보 + Open-Meteo 일사량 예보
+    # --------------------------------------------------------
+    def forecast(self, lat: float, lon: float) -> Tuple[Dict, Dict]:
+        kgrid = kma_grid(lat, lon)
+        first = ("fcst", kgrid) not in self._cache
+        wf = self._fetch("fcst", kgrid, get_weather_forecast_3days, lat, lon)
+        if first and "forecast" in wf:
+            base = _kma_base_time(wf)
+            for row in wf["forecast"]:
+                self._record(
+                    "kma_fcst", kgrid, base, _local(row["timestamp"]),
+                    temperature=row.get("temperature"),
+                    humidity=row.get("humidity"),
+                    cloud=row.get("cloud"),
+                )
+
+        ogrid = open_meteo_grid(lat, lon)
+        first = ("irr_fcst", ogrid) not in self._cache
+        sf = self._fetch("irr_fcst", ogrid, get_3day_irradiance_forecast, *open_meteo_coords(lat, lon))
+        if first and "forecast" in sf:
+            for row in sf["forecast"]:
+                self._record(
+                    "openmeteo", ogrid, self.fetched_at, _local(row["time"]),
+                    insolation=row.get("ghi"),
+                )
+
+        return wf, sf
+
+    def flush(self, db) -> int:
+        """모은 행을 한 번에 UPSERT (커밋은 호출한 Job 이 함께 수행)"""
+        rows = list(self._rows.values())
+        self._rows.clear()
+        saved = crud.upsert_weather_inputs(db, rows)
+        if saved:
+            print(f"🗃 Archived {saved} input rows ({self.calls} API calls)")
+        return saved
+
+
+# ============================================================
+# 보관 입력 → 모델 입력 (백필 / 나우캐스트 기준선 복원)
+# ============================================================
+def group_by_grid(rows) -> Dict[str, Dict[datetime, list]]:
+    """get_weather_inputs_between 결과 → grid -> base_time -> 행 목록"""
+    grouped: Dict[str, Dict[datetime, list]] = {}
+    for row in rows:
+        grouped.setdefault(row.grid, {}).setdefault(row.base_time, []).append(row)
+    return grouped
+
+
+def latest_issue(issues: Dict[datetime, list], at: datetime) -> Optional[list]:
+    """at 시점까지 발표된 가장 최근 예보"""
+    if not issues:
+        return None
+    times = sorted(issues)
+    i = bisect.bisect_right(times, at)
+    return issues[times[i - 1]] if i else None
+
+
+def archived_forecast_inputs(kma_rows: List, irr_rows: List, issue: datetime):
+    """issue 시점부터 72시간 입력 (3일 예측 Job 과 같은 build_forecast_inputs 경로)"""
+    end = issue + timedelta(hours=FORECAST_HORIZON_HOURS)
+    weather_rows = [
+        {
+            "timestamp": r.forecast_time.isoformat(),
+            "temperature": r.temperature,
+            "humidity": r.humidity,
+            "cloud": r.cloud,
+        }
+        for r in kma_rows if issue <= r.forecast_time <= end
+    ]
+    solar_rows = [
+        {"time": r.forecast_time.isoformat(), "ghi": r.insolation}
+        for r in irr_rows if issue <= r.forecast_time <= end
+    ]
+    return build_forecast_inputs(weather_rows, solar_rows)
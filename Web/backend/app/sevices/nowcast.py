@@ -0,0 +1,86 @@
+# app/services/nowcast.py
+# ============================================================
+# 실시간 나우캐스트
+#   - forecast_3day_job 이 만든 시간별 예측값(기준선)을 재사용
+#   - 현재 관측(일사량/운량)과 기준선 입력의 비율로 값을 보정
+#   - 입력이 기준선에서 크게 벗어난 발전소만 모델을 다시 돌림
+# ============================================================
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+GHI_FLOOR = 10.0  # W/m², 이 값 미만이면 비율 보정이 의미 없음
+RATIO_MAX = float(os.getenv("NOWCAST_RATIO_MAX", "2.0"))
+GHI_THRESHOLD = float(os.getenv("NOWCAST_GHI_THRESHOLD", "0.5"))       # 상대 편차
+CLOUD_THRESHOLD = float(os.getenv("NOWCAST_CLOUD_THRESHOLD", "30"))    # %p 편차
+
+# plant_id -> (시각, 예측 발전량, 예보 일사량, 예보 운량%) 시각순 정렬 배열
+_baselines: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+_lock = threading.Lock()
+
+
+def register_baseline(plant_id: int, inputs: Dict[str, np.ndarray], preds: Dict[str, np.ndarray]):
+    """3일 예측 결과와 그 입력을 기준선으로 보관 (forecast_3day_job 에서 호출)"""
+    ds = preds["ds"]
+    if not len(ds):
+        return
+
+    # 예측 시각에 해당하는 입력 행을 찾음 (둘 다 시각순 정렬)
+    idx = np.clip(np.searchsorted(inputs["ds"], ds), 0, len(inputs["ds"]) - 1)
+    matched = inputs["ds"][idx] == ds
+
+    ghi = np.where(matched, inputs["insolation"][idx], np.nan)
+    # 단기예보의 cloud 는 0~10 전운량이므로 실황(%)과 비교하기 위해 %로 환산
+    cloud = np.where(matched, inputs["cloud"][idx] * 10, np.nan)
+
+    with _lock:
+        _baselines[plant_id] = (ds, preds["predicted_power"], ghi, cloud)
+
+
+def lookup_baselines(plant_ids: List[int], ts: datetime) -> np.ndarray:
+    """발전소별 ts 시각의 (예측 발전량, 예보 일사량, 예보 운량%) — 없으면 NaN"""
+    target = np.datetime64(ts, "ns")
+    out = np.full((len(plant_ids), 3), np.nan)
+    with _lock:
+        for i, plant_id in enumerate(plant_ids):
+            baseline = _baselines.get(plant_id)
+            if baseline is None:
+                continue
+            ds, power, ghi, cloud = baseline
+            j = np.searchsorted(ds, target)
+            if j < len(ds) and ds[j] == target:
+                out[i] = (power[j], ghi[j], cloud[j])
+    return out
+
+
+def nowcast(
+    base_power: np.ndarray,
+    base_ghi: np.ndarray,
+    base_cloud: np.ndarray,
+    obs_ghi: np.ndarray,
+    obs_cloud: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    발전소 배열 단위 보정.
+    반환: (보정된 발전량, 모델 재실행 필요 여부 마스크)
+    """
+    base_ghi_safe = np.maximum(base_ghi, GHI_FLOOR)
+
+    ratio = np.where(base_ghi >= GHI_FLOOR, obs_ghi / base_ghi_safe, 1.0)
+    corrected = np.maximum(base_power * np.clip(ratio, 0.0, RATIO_MAX), 0.0)
+
+    ghi_dev = np.abs(obs_ghi - base_ghi) / base_ghi_safe
+    cloud_dev = np.abs(obs_cloud - base_cloud)
+
+    rerun = (
+        (ghi_dev > GHI_THRESHOLD)
+        | (cloud_dev > CLOUD_THRESHOLD)
+        # 기준선은 밤인데 관측은 해가 뜬 경우 → 비율 보정 불가
+        | ((base_ghi < GHI_FLOOR) & (obs_ghi >= GHI_FLOOR))
+        | np.isnan(corrected)
+    )
+
+    return corrected, rerun
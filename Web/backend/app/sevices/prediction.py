@@ -1,65 +1,101 @@
 # app/services/prediction.py
-from neuralforecast import NeuralForecast
+import numpy as np
 import pandas as pd
 import pickle, json
+import os
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta, date
+from dotenv import load_dotenv
+from .context_buffer import CONTEXT_COLUMNS, cloud_amount
+from app.metrics import INFERENCE_BATCH, INFERENCE_SECONDS
 
-MODELS_DIR = Path("../../Model/Models")
+load_dotenv()
+MODELS_DIR = Path(os.getenv("MODELS_DIR", "../../Model/Models"))
 
-# 서버 시작 시 1회 로드
-nf = NeuralForecast.load(path=str(MODELS_DIR))
+# 추론 워커 주소 (예: 127.0.0.1:6010). 설정되면 모델을 이 프로세스에 올리지 않고 워커에 위임
+INFERENCE_WORKER_ADDRESS = os.getenv("INFERENCE_WORKER_ADDRESS")
+if INFERENCE_WORKER_ADDRESS and not os.getenv("INFERENCE_WORKER_AUTHKEY"):
+    raise ValueError("INFERENCE_WORKER_ADDRESS 를 쓰려면 INFERENCE_WORKER_AUTHKEY 도 설정해야 합니다.")
 
-with open(MODELS_DIR / "best_model_info.json") as f:
-    best_info = json.load(f)
+def load_model_info(models_dir: Path) -> Dict:
+    """모델 폴더의 best_model_info.json (features, 선택적으로 model_version)"""
+    with open(Path(models_dir) / "best_model_info.json") as f:
+        return json.load(f)
+
+
+best_info = load_model_info(MODELS_DIR)
 
 FEATURES = best_info["features"]   # ['insolation','temp','cloud','humidity']
+# 저장 시 붙이는 모델 버전 (정보 파일에 없으면 기존 이름)
+MODEL_VERSION = best_info.get("model_version", "nhits-v1")
 
+# 모델 입력/출력은 컬럼형 배열(dict of np.ndarray)로 주고받음
+#   입력: {"ds", "insolation", "temp", "cloud", "humidity"}
+#   출력: {"ds", "predicted_power"}
+# (inputs, history) — history는 링 버퍼 이력 또는 None
+PredictRequest = Tuple[Dict[str, np.ndarray], Optional[Dict]]
 
-def predict_72h_power(
-    weather_forecast: List[Dict], 
-    solar_forecast: List[Dict],   
-    current_weather: Dict = None, 
-):
+# 모델은 실제로 로컬 추론이 필요할 때 폴더별 1회 로드 (워커 모드에서는 API 프로세스에 올라가지 않음)
+_models: Dict[str, object] = {}
+_nf_lock = threading.Lock()
+
+
+def get_model(models_dir: Optional[Path] = None):
+    """NeuralForecast 모델을 최초 호출 시 1회 로드하여 반환 (기본: MODELS_DIR, 백필은 다른 폴더 지정 가능)"""
+    path = str(models_dir or MODELS_DIR)
+    if path not in _models:
+        with _nf_lock:
+            if path not in _models:
+                from neuralforecast import NeuralForecast
+                _models[path] = NeuralForecast.load(path=path)
+    return _models[path]
+
+
+def _build_frames(
+    unique_id: str,
+    inputs: Dict[str, np.ndarray],
+    history: Optional[Dict] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, datetime]:
     # ==========================================
     # 1️⃣ [미래 방] 3일치 미래 날씨 데이터 준비
     # ==========================================
-    future_rows = []
-    for w, s in zip(weather_forecast, solar_forecast):
-        future_rows.append({
-            "unique_id": "plant_1",
-            "ds": w["datetime"],        
-            "insolation": s["irradiance"],
-            "temp": w["temperature"],
-            "cloud": w["cloud_cover"],
-            "humidity": w["humidity"],
-            "y": 0.0 # 형식 맞추기용 (실제로는 무시됨)
-        })
-    futr_exog_df = pd.DataFrame(future_rows)
+    futr_df = pd.DataFrame({col: inputs[col] for col in ["ds", *FEATURES]})
+    futr_df.insert(0, "unique_id", unique_id)
+    futr_df["y"] = 0.0 # 형식 맞추기용 (실제로는 무시됨)
 
     # ==========================================
     # 2️⃣ [현재 방] 예측 시작 기준점 (Anchor)
     # ==========================================
-    start_time = weather_forecast[0]["datetime"]
+    start_time = pd.Timestamp(inputs["ds"][0])
     anchor_time = start_time - timedelta(hours=1)
 
-    input_rows = [{
-        "unique_id": "plant_1",
+    # 링 버퍼 이력이 anchor 까지 이어져 있으면 실제 이력을 컨텍스트로 사용
+    if history is not None and len(history["ds"]) and pd.Timestamp(history["ds"][-1]) == anchor_time:
+        input_df = pd.DataFrame({col: history[col] for col in ["ds", *CONTEXT_COLUMNS]})
+        input_df.insert(0, "unique_id", unique_id)
+        return input_df, futr_df, anchor_time
+
+    # 이력이 없으면 더미 기준점 1행
+    input_df = pd.DataFrame([{
+        "unique_id": unique_id,
         "ds": anchor_time,
-        "y": 0.0,  
-        "insolation": 0.0, 
-        "temp": 0.0,      
+        "y": 0.0,
+        "insolation": 0.0,
+        "temp": 0.0,
         "cloud": 0.0,
         "humidity": 0.0,
-    }]
-    input_df = pd.DataFrame(input_rows)
+    }])
 
-    # ==========================================
-    # 3️⃣ 모델 예측 실행 (시점 밀림 방지 로직)
-    # ==========================================
+    return input_df, futr_df, anchor_time
+
+
+def _run_model(input_df: pd.DataFrame, futr_exog_df: pd.DataFrame, models_dir: Optional[Path] = None):
+    """모델 예측 실행 (시점 밀림 방지 로직)"""
+    nf = get_model(models_dir)
     forecast_df = None
-    
+
     # [시도 1] 최신 버전 표준 방식 (futr_exog_df)
     try:
         forecast_df = nf.predict(df=input_df, futr_exog_df=futr_exog_df)
@@ -79,28 +115,151 @@ def predict_72h_power(
     # 날씨 반영은 안 되지만, 최소한 "오늘 날짜"로 예측값은 나옵니다.
     if forecast_df is None:
         print("⚠️ [Warning] 미래 날씨 데이터를 적용할 수 없는 라이브러리 버전입니다. 패턴 예측만 수행합니다.")
-        try:
-            forecast_df = nf.predict(df=input_df)
-        except Exception as e:
-            print(f"❌ Prediction Failed: {e}")
-            return []
+        forecast_df = nf.predict(df=input_df)
+
+    return forecast_df
+
+
+def empty_result() -> Dict[str, np.ndarray]:
+    return {
+        "ds": np.array([], dtype="datetime64[ns]"),
+        "predicted_power": np.array([], dtype=np.float64),
+    }
+
+
+def _predict_items(
+    items: List[Tuple[int, Dict[str, np.ndarray], Optional[Dict]]],
+    models_dir: Optional[Path] = None,
+) -> Dict[int, Dict[str, np.ndarray]]:
+    """(요청 번호, inputs, history) 목록을 한 번의 nf.predict 로 추론 → {요청 번호: 결과} (실패 시 예외)"""
+    input_dfs, futr_dfs, anchors = [], [], {}
+    for i, inputs, history in items:
+        uid = f"req_{i}"
+        df_in, df_fut, anchor_time = _build_frames(uid, inputs, history)
+        input_dfs.append(df_in)
+        futr_dfs.append(df_fut)
+        anchors[uid] = anchor_time
+
+    forecast_df = _run_model(
+        pd.concat(input_dfs, ignore_index=True),
+        pd.concat(futr_dfs, ignore_index=True),
+        models_dir,
+    )
 
     # ==========================================
     # 4️⃣ 결과 정리
     # ==========================================
-    results = []
-    
+    if "unique_id" not in forecast_df.columns:
+        forecast_df = forecast_df.reset_index()
+
     # 예측값 컬럼 찾기
     target_col = [c for c in forecast_df.columns if "NHITS" in c]
     target_col = target_col[0] if target_col else "NHITS"
 
-    for _, row in forecast_df.iterrows():
-        # anchor_time(기준점) 이후의 데이터만 가져옴 -> 즉, 오늘 00시부터 3일간
-        if row["ds"] > anchor_time:
-            val = float(row[target_col])
-            results.append({
-                "datetime": row["ds"],
-                "predicted_power": max(0.0, val) 
-            })
+    # anchor_time(기준점) 이후의 데이터만 가져옴 -> 즉, 오늘 00시부터 3일간
+    anchor_s = forecast_df["unique_id"].map(anchors)
+    forecast_df = forecast_df[forecast_df["ds"] > anchor_s]
+
+    results = {}
+    for uid, group in forecast_df.groupby("unique_id", sort=False):
+        results[int(uid[len("req_"):])] = {
+            "ds": group["ds"].to_numpy(dtype="datetime64[ns]"),
+            "predicted_power": np.maximum(group[target_col].to_numpy(dtype=np.float64), 0.0),
+        }
+    return results
+
+
+def predict_batch_local(
+    requests: List[PredictRequest],
+    models_dir: Optional[Path] = None,
+) -> List[Dict[str, np.ndarray]]:
+    """
+    여러 예측 요청을 unique_id로 구분해 한 번의 nf.predict 호출로 처리.
+    requests: [(inputs, history), ...]  (history는 None 가능)
+    models_dir: 지정 시 해당 폴더의 모델로 추론 (기본 MODELS_DIR)
+    반환: 요청 순서대로 {"ds", "predicted_power"} 컬럼형 결과
+    배치 추론이 실패하면 요청별로 다시 추론해 실패한 요청만 빈 결과로 돌려줌
+    """
+    if not requests:
+        return []
+
+    items = [
+        (i, inputs, history)
+        for i, (inputs, history) in enumerate(requests)
+        if inputs is not None and len(inputs["ds"])
+    ]
+
+    results = {}
+    if items:
+        try:
+            results = _predict_items(items, models_dir)
+        except Exception as e:
+            print(f"❌ Prediction Failed: {e}")
+            if len(items) > 1:
+                print(f"⚠️ 요청 {len(items)}건을 하나씩 다시 추론합니다.")
+                for item in items:
+                    try:
+                        results.update(_predict_items([item], models_dir))
+                    except Exception as item_error:
+                        print(f"❌ Prediction Failed (req_{item[0]}): {item_error}")
+
+    return [results.get(i, empty_result()) for i in range(len(requests))]
+
 
-    return results
\ No newline at end of file
+def predict_batch(requests: List[PredictRequest]) -> List[Dict[str, np.ndarray]]:
+    """추론 워커가 설정되어 있으면 워커로, 아니면 현재 프로세스에서 배치 예측"""
+    backend = "worker" if INFERENCE_WORKER_ADDRESS else "local"
+    INFERENCE_BATCH.observe(len(requests), backend=backend)
+    with INFERENCE_SECONDS.time(backend=backend):
+        if INFERENCE_WORKER_ADDRESS:
+            from .inference_worker import get_client
+            return get_client().predict_batch(requests)
+        return predict_batch_local(requests)
+
+
+def build_forecast_inputs(weather_rows: List[Dict], solar_rows: List[Dict]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    기상청 3일 예보 + Open-Meteo 일사량 예보 → 모델 입력 컬럼 배열.
+    두 소스는 시작 시각이 달라 인덱스로 맞추면 어긋나므로 시각(KST) 기준으로 조인합니다.
+    """
+    if not weather_rows or not solar_rows:
+        return None
+
+    weather = pd.DataFrame(weather_rows, columns=["timestamp", "temperature", "humidity", "cloud"])
+    solar = pd.DataFrame(solar_rows, columns=["time", "ghi"])
+
+    # 기상청: "+09:00" 포함 ISO → KST 로컬 시각 / Open-Meteo: timezone=Asia/Seoul 로컬 시각
+    weather["ds"] = pd.to_datetime(weather["timestamp"]).dt.tz_localize(None)
+    solar["ds"] = pd.to_datetime(solar["time"])
+
+    merged = weather.merge(solar[["ds", "ghi"]], on="ds", how="inner").sort_values("ds")
+    if merged.empty:
+        return None
+
+    return {
+        "ds": merged["ds"].to_numpy(dtype="datetime64[ns]"),
+        "insolation": merged["ghi"].to_numpy(dtype=np.float64),
+        "temp": merged["temperature"].to_numpy(dtype=np.float64),
+        "cloud": merged["cloud"].to_numpy(dtype=np.float64),
+        "humidity": merged["humidity"].to_numpy(dtype=np.float64),
+    }
+
+
+def observation_inputs(ts: datetime, weather: Dict, solar: Dict) -> Dict[str, np.ndarray]:
+    """현재 관측(실황 날씨 + 일사량) 1시간치 → 모델 입력 컬럼 배열 (운량 % → 0~10)"""
+    return {
+        "ds": np.array([ts], dtype="datetime64[ns]"),
+        "insolation": np.array([solar.get("ghi") or 0.0], dtype=np.float64),
+        "temp": np.array([weather.get("temperature") or 0.0], dtype=np.float64),
+        "cloud": np.array([cloud_amount(weather.get("cloud")) or 0.0], dtype=np.float64),
+        "humidity": np.array([weather.get("humidity") or 0.0], dtype=np.float64),
+    }
+
+
+def predict_72h_power(
+    inputs: Dict[str, np.ndarray],
+    history: Optional[Dict] = None,
+) -> Dict[str, np.ndarray]:
+    if inputs is None or not len(inputs["ds"]):
+        return empty_result()
+    return predict_batch([(inputs, history)])[0]
@@ -0,0 +1,72 @@
+# app/services/regional.py
+# ============================================================
+# 지역 단위 추론 + 발전소별 분배
+#   - 모델은 제주 전체 태양광 발전량(설비 ~263MW)으로 학습됨
+#   - 발전소 입력을 설비용량 가중 평균해 지역 입력을 만들고 1회만 추론
+#   - 결과를 설비용량 비율 × 발전소별 일사량 비율로 분배
+# ============================================================
+import os
+from typing import Dict, List
+
+import numpy as np
+
+# 학습 데이터(제주 전체)의 설비용량. 발전소 몫 = 지역 예측 × (발전소 용량 / 지역 용량)
+REGION_CAPACITY_MW = float(os.getenv("REGION_CAPACITY_MW", "263"))
+
+FEATURE_COLUMNS = ["insolation", "temp", "cloud", "humidity"]
+
+
+def _fill_capacities(capacities: List) -> np.ndarray:
+    """용량 정보가 없는 발전소는 나머지 발전소의 평균 용량으로 간주"""
+    caps = np.array([np.nan if c is None else float(c) for c in capacities], dtype=np.float64)
+    known = caps[~np.isnan(caps)]
+    return np.where(np.isnan(caps), known.mean() if len(known) else 1.0, caps)
+
+
+def align_inputs(plant_inputs: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    발전소별 입력을 모든 발전소에 공통으로 존재하는 시각으로 맞춰
+    {"ds": (T,), feature: (P, T)} 형태로 쌓음
+    """
+    ds = plant_inputs[0]["ds"]
+    for inputs in plant_inputs[1:]:
+        ds = np.intersect1d(ds, inputs["ds"])
+
+    stacked = {"ds": ds}
+    idx = [np.searchsorted(inputs["ds"], ds) for inputs in plant_inputs]
+    for col in FEATURE_COLUMNS:
+        stacked[col] = np.vstack([inputs[col][i] for inputs, i in zip(plant_inputs, idx)])
+    return stacked
+
+
+def regional_inputs(stacked: Dict[str, np.ndarray], capacities: List) -> Dict[str, np.ndarray]:
+    """설비용량 가중 평균으로 지역 대표 입력 생성"""
+    weights = _fill_capacities(capacities)
+    weights = weights / weights.sum()
+
+    regional = {"ds": stacked["ds"]}
+    for col in FEATURE_COLUMNS:
+        regional[col] = weights @ np.nan_to_num(stacked[col])
+    return regional
+
+
+def disaggregate(regional_power: np.ndarray, capacities: List, irradiance: np.ndarray) -> np.ndarray:
+    """
+    지역 예측(T,)을 발전소별(P, T)로 분배.
+    - 용량 비율: 발전소 용량 / REGION_CAPACITY_MW
+    - 일사량 비율: 발전소 일사량 / (용량 가중) 평균 일사량  (평균 0이면 1)
+    일사량 비율은 용량 가중 평균이 1이 되므로 발전소 합계는 용량 비율 합만큼 보존됨
+    """
+    caps = _fill_capacities(capacities)
+    weights = caps / caps.sum()
+
+    irradiance = np.nan_to_num(irradiance)
+    mean_irr = weights @ irradiance                      # (T,)
+    ratio = np.divide(
+        irradiance, mean_irr,
+        out=np.ones_like(irradiance),
+        where=mean_irr > 0,
+    )
+
+    share = (caps / REGION_CAPACITY_MW)[:, None]         # (P, 1)
+    return np.maximum(regional_power[None, :] * share * ratio, 0.0)
@@ -0,0 +1,81 @@
+# app/services/solar_position.py
+# ============================================================
+# 태양 고도 계산 (NOAA 근사식, 벡터 연산)
+#   - 발전소 위경도 + 시각(KST) → 태양 고도각(도)
+#   - 밤 시간대(발전량 0)를 추론/저장 대상에서 빼기 위한 마스크
+# ============================================================
+import os
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+# 이 고도 이하로 앞뒤 1시간 내내 머물면 밤으로 간주 (대기 굴절/여명 여유)
+NIGHT_ELEVATION_DEG = float(os.getenv("NIGHT_ELEVATION_DEG", "-2"))
+
+KST_OFFSET = np.timedelta64(9, "h")
+_HOUR = np.timedelta64(1, "h")
+
+
+def solar_elevation(lat: float, lon: float, ds_kst: np.ndarray) -> np.ndarray:
+    """KST 로컬 시각 배열(datetime64) → 태양 고도각(도) 배열"""
+    utc = np.asarray(ds_kst, dtype="datetime64[s]") - KST_OFFSET
+
+    day_start = utc.astype("datetime64[D]")
+    doy = (day_start - utc.astype("datetime64[Y]")).astype(np.int64) + 1
+    hours = (utc - day_start).astype(np.int64) / 3600.0
+
+    # 연중 각도(라디안)
+    gamma = 2 * np.pi / 365 * (doy - 1 + (hours - 12) / 24)
+
+    # 균시차(분), 적위(라디안)
+    eqtime = 229.18 * (
+        0.000075 + 0.001868 * np.cos(gamma) - 0.032077 * np.sin(gamma)
+        - 0.014615 * np.cos(2 * gamma) - 0.040849 * np.sin(2 * gamma)
+    )
+    decl = (
+        0.006918 - 0.399912 * np.cos(gamma) + 0.070257 * np.sin(gamma)
+        - 0.006758 * np.cos(2 * gamma) + 0.000907 * np.sin(2 * gamma)
+        - 0.002697 * np.cos(3 * gamma) + 0.00148 * np.sin(3 * gamma)
+    )
+
+    # 진태양시 → 시간각
+    true_solar_minutes = hours * 60 + eqtime + 4 * lon
+    hour_angle = np.radians(true_solar_minutes / 4 - 180)
+
+    lat_rad = np.radians(lat)
+    cos_zenith = (
+        np.sin(lat_rad) * np.sin(decl)
+        + np.cos(lat_rad) * np.cos(decl) * np.cos(hour_angle)
+    )
+    return 90 - np.degrees(np.arccos(np.clip(cos_zenith, -1, 1)))
+
+
+def daylight_mask(lat: float, lon: float, ds_kst: np.ndarray) -> np.ndarray:
+    """
+    시간별 데이터가 발전 가능한 시간대인지 여부.
+    시간 단위 값은 앞뒤 구간에 걸쳐 있으므로 t-1h, t, t+1h 중 한 번이라도 해가 떠 있으면 낮으로 봄
+    """
+    ds = np.asarray(ds_kst, dtype="datetime64[s]")
+    elevation = np.maximum.reduce([
+        solar_elevation(lat, lon, ds - _HOUR),
+        solar_elevation(lat, lon, ds),
+        solar_elevation(lat, lon, ds + _HOUR),
+    ])
+    return elevation > NIGHT_ELEVATION_DEG
+
+
+def hourly_daylight(lat: Optional[float], lon: Optional[float], start: datetime, end: datetime) -> np.ndarray:
+    """
+    start ~ end(미포함) 시간별 낮 여부.
+    좌표가 없으면 밤인지 판단할 수 없으므로 모두 낮으로 봄 (0으로 채우지 않음)
+    """
+    n = max(int((end - start).total_seconds() // 3600), 0)
+    if lat is None or lon is None:
+        return np.ones(n, dtype=bool)
+    ds = np.datetime64(start, "s") + np.arange(n) * np.timedelta64(3600, "s")
+    return daylight_mask(float(lat), float(lon), ds)
+
+
+def is_daylight(lat: float, lon: float, ts) -> bool:
+    return bool(daylight_mask(lat, lon, np.array([ts], dtype="datetime64[s]"))[0])
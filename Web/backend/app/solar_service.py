@@ -1,6 +1,7 @@
-import requests
 from datetime import datetime, timedelta
 
+from app import upstream
+
 
 def fetch_open_meteo(lat: float, lon: float):
     url = "https://api.open-meteo.com/v1/forecast"
@@ -16,7 +17,7 @@ def fetch_open_meteo(lat: float, lon: float):
         "timezone": "Asia/Seoul"
     }
 
-    res = requests.get(url, params=params)
+    res = upstream.get("open_meteo", url, params=params)
     data = res.json()
 
     return data["hourly"]
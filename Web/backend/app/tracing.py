@@ -0,0 +1,131 @@
+# ============================================================
+# tracing.py - Job 추적 스팬 (JSON Lines 내보내기)
+#   - TRACE_EXPORT_PATH 가 설정된 경우에만 기록 (한 줄에 스팬 하나)
+#   - 로컬 수집기(OpenTelemetry Collector filelog, Vector 등)가 파일을 읽어 전송
+#   - 스팬 필드: trace_id, span_id, parent_id, name, start/end(UNIX 초), duration_ms, status, attributes
+#   - traced_job / JobPhases 는 스팬과 함께 /metrics 의 Job 메트릭도 기록
+# ============================================================
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from .metrics import JOB_PHASE_SECONDS, JOB_RUNS, JOB_SECONDS
+from .profiling import Profile, should_profile_job
+
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH")
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+_write_lock = threading.Lock()
+
+
+class Span:
+    def __init__(self, name: str, parent: Optional["Span"] = None, start: Optional[float] = None, **attributes):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.start = start if start is not None else time.time()
+        self.status = "ok"
+        self.attributes: Dict = dict(attributes)
+
+    def fail(self, error: BaseException):
+        self.status = "error"
+        self.attributes["error"] = f"{type(error).__name__}: {error}"
+
+    def end(self, end: Optional[float] = None):
+        end = end if end is not None else time.time()
+        _export({
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start, 6),
+            "end": round(end, 6),
+            "duration_ms": round((end - self.start) * 1000, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        })
+
+
+def _export(record: Dict):
+    if not TRACE_EXPORT_PATH:
+        return
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    with _write_lock:
+        with open(TRACE_EXPORT_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """현재 스팬의 자식 스팬 (없으면 새 trace 시작)"""
+    s = Span(name, parent=_current.get(), **attributes)
+    token = _current.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.fail(e)
+        raise
+    finally:
+        _current.reset(token)
+        s.end()
+
+
+# ============================================================
+# 스케줄러 Job 계측
+# ============================================================
+def traced_job(job: str):
+    """
+    Job 함수 데코레이터: 루트 스팬 + 실행 시간/결과 메트릭 (+ PROFILE_JOBS 지정 시 프로파일 저장).
+    Job 은 예외를 직접 잡아 로그만 남기므로, except 블록에서 mark_job_failed(e) 로 실패를 알림
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profile = Profile() if should_profile_job(job) else None
+            if profile:
+                profile.start()
+            started = time.perf_counter()
+            with span(f"job.{job}") as root:
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    JOB_SECONDS.observe(time.perf_counter() - started, job=job)
+                    JOB_RUNS.inc(job=job, status=root.status)
+                    if profile:
+                        print(f"🔬 Profile saved: {profile.stop(f'job_{job}')}")
+        return wrapper
+    return decorator
+
+
+def mark_job_failed(error: BaseException):
+    s = _current.get()
+    if s is not None:
+        s.fail(error)
+
+
+class JobPhases:
+    """
+    Job 안의 연속된 단계 시간 측정. 단계가 끝날 때마다 mark(이름) 호출
+    → 직전 mark 이후 시간을 단계 메트릭/자식 스팬으로 기록
+    """
+
+    def __init__(self, job: str):
+        self.job = job
+        self._last = time.time()
+
+    def mark(self, phase: str, **attributes):
+        now = time.time()
+        JOB_PHASE_SECONDS.observe(now - self._last, job=self.job, phase=phase)
+        Span(f"job.{self.job}.{phase}", parent=_current.get(), start=self._last, **attributes).end(now)
+        self._last = now
@@ -0,0 +1,47 @@
+# ============================================================
+# upstream.py - 외부 API(기상청 / Open-Meteo) HTTP 호출 공통 경로
+#   - 호출별 지연 시간과 실패(타임아웃/연결/HTTP 상태/응답 오류)를 /metrics 로 집계
+#   - 요청 처리 중 호출이면 Server-Timing 의 upstream 단계에도 합산
+#   - upstream 이름: kma_vilage_fcst | kma_ultra_srt_ncst | kma_ultra_srt_fcst | open_meteo
+#   - UPSTREAM_MODE=live(기본) | record | replay (오프라인 재생은 upstream_replay 참고)
+# ============================================================
+import os
+import time
+
+import requests
+
+from . import request_timing, upstream_replay
+from .metrics import UPSTREAM_ERRORS, UPSTREAM_SECONDS
+
+UPSTREAM_MODE = os.getenv("UPSTREAM_MODE", "live").lower()
+
+
+def get(upstream: str, url: str, **kwargs) -> requests.Response:
+    """requests.get 과 같은 인자. 예외는 그대로 전달 (호출한 서비스의 기존 처리 유지)"""
+    started = time.perf_counter()
+    try:
+        if UPSTREAM_MODE == "replay":
+            res = upstream_replay.replay(upstream, kwargs.get("params") or {}, kwargs.get("timeout"))
+        else:
+            res = requests.get(url, **kwargs)
+    except requests.Timeout:
+        record_error(upstream, "timeout")
+        raise
+    except requests.RequestException:
+        record_error(upstream, "connection")
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        UPSTREAM_SECONDS.observe(elapsed, upstream=upstream)
+        request_timing.record("upstream", elapsed)
+
+    if res.status_code != 200:
+        record_error(upstream, f"http_{res.status_code}")
+    elif UPSTREAM_MODE == "record":
+        upstream_replay.save(upstream, kwargs.get("params") or {}, res)
+    return res
+
+
+def record_error(upstream: str, reason: str):
+    """HTTP 는 성공했지만 응답 내용이 오류인 경우 등 서비스에서 직접 기록"""
+    UPSTREAM_ERRORS.inc(upstream=upstream, reason=reason)
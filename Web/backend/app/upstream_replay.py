@@ -0,0 +1,175 @@
+# ============================================================
+# upstream_replay.py - 외부 API 녹화 / 재생 (오프라인 부하 테스트용)
+#   - UPSTREAM_MODE=record : 실제 호출 응답(200)을 UPSTREAM_FIXTURE_DIR 에 저장
+#   - UPSTREAM_MODE=replay : 네트워크 없이 저장한 응답을 돌려줌 (upstream.get 에서 분기)
+#   - 파일 위치: {UPSTREAM_FIXTURE_DIR}/{upstream}/{격자키}.json
+#     · 기상청: nx_ny  /  Open-Meteo: 위도_경도 (소수 둘째 자리)
+#     · 인증키 등 요청 파라미터는 저장하지 않고 응답 본문만 저장
+#   - 재생 조건 (환경변수)
+#     · UPSTREAM_REPLAY_LATENCY_MS / _JITTER_MS : 호출당 지연 (평균 ± 지터)
+#     · UPSTREAM_REPLAY_ERROR_RATE : 실패 비율 (타임아웃 / HTTP 503 / 기상청 resultCode 22)
+#     · UPSTREAM_REPLAY_COVERAGE   : 데이터가 있는 격자 비율 (나머지는 NO_DATA)
+#     · UPSTREAM_REPLAY_SEED       : 지연/실패 난수 시드 (재현 가능한 실행)
+#   - 녹화된 격자가 아니어도 커버리지 안이면 같은 upstream 의 다른 녹화 파일로 응답
+#   - 발표/예보 시각은 요청 시점 기준으로 옮겨서 돌려줌 (녹화 날짜와 무관하게 Job 이 동작)
+# ============================================================
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import requests
+
+UPSTREAM_FIXTURE_DIR = os.getenv("UPSTREAM_FIXTURE_DIR", "fixtures/upstream")
+REPLAY_LATENCY_MS = float(os.getenv("UPSTREAM_REPLAY_LATENCY_MS", "0"))
+REPLAY_JITTER_MS = float(os.getenv("UPSTREAM_REPLAY_JITTER_MS", "0"))
+REPLAY_ERROR_RATE = float(os.getenv("UPSTREAM_REPLAY_ERROR_RATE", "0"))
+REPLAY_COVERAGE = float(os.getenv("UPSTREAM_REPLAY_COVERAGE", "1"))
+REPLAY_SEED = os.getenv("UPSTREAM_REPLAY_SEED")
+
+KMA_BASE_FORMAT = "%Y%m%d%H%M"
+OPEN_METEO_TIME_FORMAT = "%Y-%m-%dT%H:%M"
+
+_rng = random.Random(REPLAY_SEED)
+_rng_lock = threading.Lock()
+_cache: Dict[str, str] = {}
+_cache_lock = threading.Lock()
+
+
+# ============================================================
+# 격자키 / 파일 경로
+# ============================================================
+def fixture_key(params: dict) -> str:
+    if "nx" in params and "ny" in params:
+        return f"{params['nx']}_{params['ny']}"
+    return f"{float(params['latitude']):.2f}_{float(params['longitude']):.2f}"
+
+
+def _fixture_path(upstream: str, key: str) -> str:
+    return os.path.join(UPSTREAM_FIXTURE_DIR, upstream, f"{key}.json")
+
+
+def save(upstream: str, params: dict, res: requests.Response):
+    """record 모드: 정상 응답 본문 저장 (기상청 resultCode 오류 응답은 제외)"""
+    try:
+        data = res.json()
+    except ValueError:
+        return
+    if upstream.startswith("kma_") and data.get("response", {}).get("header", {}).get("resultCode") != "00":
+        return
+
+    path = _fixture_path(upstream, fixture_key(params))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    with _cache_lock:
+        _cache.pop(path, None)
+
+
+def _load(path: str) -> Optional[str]:
+    with _cache_lock:
+        if path not in _cache:
+            if not os.path.exists(path):
+                return None
+            with open(path, encoding="utf-8") as f:
+                _cache[path] = f.read()
+        return _cache[path]
+
+
+def _fallback_path(upstream: str) -> str:
+    directory = os.path.join(UPSTREAM_FIXTURE_DIR, upstream)
+    files = sorted(f for f in os.listdir(directory) if f.endswith(".json")) if os.path.isdir(directory) else []
+    if not files:
+        raise FileNotFoundError(f"No recorded fixtures for {upstream} in {directory} (run with UPSTREAM_MODE=record first)")
+    return os.path.join(directory, files[0])
+
+
+def _covered(key: str) -> bool:
+    # 격자키 해시로 결정 → 같은 설정이면 매 실행 같은 격자가 빠짐
+    return zlib.crc32(key.encode()) / 2**32 < REPLAY_COVERAGE
+
+
+# ============================================================
+# 재생
+# ============================================================
+def replay(upstream: str, params: dict, timeout: Optional[float] = None) -> requests.Response:
+    with _rng_lock:
+        delay_ms = max(0.0, REPLAY_LATENCY_MS + _rng.uniform(-REPLAY_JITTER_MS, REPLAY_JITTER_MS))
+        failure = _rng.choice(_failure_kinds(upstream)) if _rng.random() < REPLAY_ERROR_RATE else None
+
+    if failure == "timeout":
+        # 실제 타임아웃처럼 제한 시간까지 기다린 뒤 실패 (제한이 없으면 지연만큼)
+        time.sleep(timeout if timeout is not None else delay_ms / 1000)
+        raise requests.Timeout(f"replayed timeout ({upstream})")
+    time.sleep(delay_ms / 1000)
+
+    if failure == "http_503":
+        return _response(503, {"error": True, "reason": "replayed service unavailable"})
+    if failure == "result_code":
+        return _response(200, _kma_error("22", "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR"))
+
+    key = fixture_key(params)
+    if not _covered(key):
+        if upstream.startswith("kma_"):
+            return _response(200, _kma_error("03", "NO_DATA"))
+        return _response(400, {"error": True, "reason": f"No data for {key}"})
+
+    text = _load(_fixture_path(upstream, key)) or _load(_fallback_path(upstream))
+    data = json.loads(text)
+    if upstream.startswith("kma_"):
+        _rebase_kma(data, params)
+    else:
+        _rebase_open_meteo(data)
+    return _response(200, data)
+
+
+def _failure_kinds(upstream: str):
+    if upstream.startswith("kma_"):
+        return ("timeout", "http_503", "result_code")
+    return ("timeout", "http_503")
+
+
+def _kma_error(code: str, message: str) -> dict:
+    return {"response": {"header": {"resultCode": code, "resultMsg": message}}}
+
+
+def _response(status: int, data: dict) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status
+    res._content = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    res.encoding = "utf-8"
+    res.headers["Content-Type"] = "application/json;charset=UTF-8"
+    return res
+
+
+# ============================================================
+# 시각 이동 (녹화 시점 → 요청 시점)
+# ============================================================
+def _rebase_kma(data: dict, params: dict):
+    items = data["response"]["body"]["items"]["item"]
+    if not items:
+        return
+    recorded = datetime.strptime(items[0]["baseDate"] + items[0]["baseTime"], KMA_BASE_FORMAT)
+    requested = datetime.strptime(f"{params['base_date']}{params['base_time']}", KMA_BASE_FORMAT)
+    delta = requested - recorded
+
+    for item in items:
+        item["baseDate"], item["baseTime"] = params["base_date"], params["base_time"]
+        if "fcstDate" in item:
+            fcst = datetime.strptime(item["fcstDate"] + item["fcstTime"], KMA_BASE_FORMAT) + delta
+            item["fcstDate"], item["fcstTime"] = fcst.strftime("%Y%m%d"), fcst.strftime("%H%M")
+
+
+def _rebase_open_meteo(data: dict):
+    times = data.get("hourly", {}).get("time") or []
+    if not times:
+        return
+    # Open-Meteo 는 요청일 0시부터 내려주므로 날짜 단위로 이동
+    delta = timedelta(days=(datetime.now().date() - datetime.strptime(times[0], OPEN_METEO_TIME_FORMAT).date()).days)
+    data["hourly"]["time"] = [
+        (datetime.strptime(t, OPEN_METEO_TIME_FORMAT) + delta).strftime(OPEN_METEO_TIME_FORMAT) for t in times
+    ]
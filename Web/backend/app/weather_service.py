@@ -1,7 +1,6 @@
 # ============================================================
 # weather_service.py - 기상청 API 서비스 (최종 안정화 버전)
 # ============================================================
-import requests
 import os
 import math
 from datetime import datetime, timedelta
@@ -10,6 +9,8 @@ import logging
 from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
+from app import upstream
+
 load_dotenv()
 KMA_API_KEY = os.getenv("KMA_API_KEY")
 logger = logging.getLogger(__name__)
@@ -118,13 +119,14 @@ def get_ultra_short_forecast(lat: float, lon: float, retry_count=2):
     for attempt in range(retry_count + 1):
         try:
             timeout_value = 15 + (attempt * 5)
-            response = requests.get(
-                url, params=params, headers=COMMON_HEADERS, timeout=timeout_value
+            response = upstream.get(
+                "kma_ultra_srt_fcst", url, params=params, headers=COMMON_HEADERS, timeout=timeout_value
             )
             data = response.json()
 
             if data["response"]["header"]["resultCode"] != "00":
                 last_error = data["response"]["header"]["resultMsg"]
+                upstream.record_error("kma_ultra_srt_fcst", "result_code")
                 continue
 
             items = data["response"]["body"]["items"]["item"]
@@ -213,7 +215,7 @@ def get_current_weather(lat: float, lon: float):
     }
 
     try:
-        res = requests.get(url, params=params, headers=COMMON_HEADERS, timeout=8)
+        res = upstream.get("kma_ultra_srt_ncst", url, params=params, headers=COMMON_HEADERS, timeout=8)
 
         # ✅ JSON 안전 체크
         if res.status_code != 200 or not res.text.strip().startswith("{"):
@@ -221,6 +223,7 @@ def get_current_weather(lat: float, lon: float):
 
         data = res.json()
         if data["response"]["header"]["resultCode"] != "00":
+            upstream.record_error("kma_ultra_srt_ncst", "result_code")
             raise ValueError("Ultra short observation error")
 
         items = data["response"]["body"]["items"]["item"]
@@ -321,10 +324,11 @@ def get_weather_forecast_3days(lat: float, lon: float):
     }
 
     try:
-        res = requests.get(url, params=params, headers=COMMON_HEADERS, timeout=15)
+        res = upstream.get("kma_vilage_fcst", url, params=params, headers=COMMON_HEADERS, timeout=15)
         data = res.json()
 
         if data["response"]["header"]["resultCode"] != "00":
+            upstream.record_error("kma_vilage_fcst", "result_code")
             return {"error": True, "message": data["response"]["header"]["resultMsg"]}
 
         items = data["response"]["body"]["items"]["item"]
@@ -361,6 +365,8 @@ def get_weather_forecast_3days(lat: float, lon: float):
             "type": "3day_forecast",
             "count": len(result_rows),
             "forecast": result_rows,
+            "base_date": base_date,
+            "base_time": base_time,
             "location": {"lat": lat, "lon": lon, "nx": nx, "ny": ny},
             "data_source": "short_term_forecast"
         }
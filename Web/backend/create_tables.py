@@ -1,11 +1,50 @@
 # create_tables.py
-from app.database import engine
-from app.models import Base
+import argparse
+
+from sqlalchemy import func
+
+from app.database import engine, SessionLocal
+from app import crud
+from app.models import Base, Generation
+from app.partitioning import PARTITIONED_TABLES, convert_to_partitioned, list_partitions
 
 def create_db_tables():
     print("MySQL 테이블 생성을 시작합니다...")
     Base.metadata.create_all(bind=engine)
     print("✅ 데이터베이스 테이블 생성이 완료되었습니다.")
 
+def partition_tables():
+    """시계열 테이블을 월 단위 RANGE 파티션으로 변환 (이미 변환된 테이블은 건너뜀)"""
+    for table in PARTITIONED_TABLES:
+        if list_partitions(engine, table):
+            print(f"⏭ {table} 는 이미 파티션 테이블입니다.")
+            continue
+        convert_to_partitioned(engine, table)
+    print("✅ 파티션 변환이 완료되었습니다. (.env 에 PARTITIONING_ENABLED=1 설정)")
+
+def rebuild_rollups():
+    """기존 GENERATION 데이터로 일/주/월 롤업 테이블을 처음부터 다시 계산"""
+    db = SessionLocal()
+    try:
+        first, last = db.query(func.min(Generation.timestamp), func.max(Generation.timestamp)).one()
+        if first is None:
+            print("⏭ GENERATION 데이터가 없습니다.")
+            return
+        plant_ids = [p.id for p in crud.get_all_plants(db)]
+        touched = crud.rebuild_generation_rollups(db, plant_ids, first.date(), last.date())
+        db.commit()
+        print(f"✅ 발전량 롤업 재계산 완료 ({touched} rows)")
+    finally:
+        db.close()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--partition", action="store_true", help="시계열 테이블을 월 파티션으로 변환")
+    parser.add_argument("--rebuild-rollups", action="store_true", help="GENERATION 일/주/월 롤업 재계산")
+    args = parser.parse_args()
+
     create_db_tables()
+    if args.partition:
+        partition_tables()
+    if args.rebuild_rollups:
+        rebuild_rollups()
@@ -0,0 +1,33 @@
+# ============================================================
+# 테스트 공통 설정
+#   - app 모듈을 import 하기 전에 임시 SQLite DB / 모델 경로를 지정
+#     (.env 의 운영 DB 설정은 load_dotenv 가 덮어쓰지 않음)
+#   - db 픽스처: 테이블 생성 후 세션 제공, 끝나면 테이블 삭제
+# ============================================================
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'test.db'}"
+os.environ.setdefault("MODELS_DIR", str(BACKEND_DIR.parent.parent / "Model" / "Models"))
+os.environ.pop("INFERENCE_WORKER_ADDRESS", None)
+
+
+@pytest.fixture
+def db():
+    from app import models  # noqa: F401  (테이블 등록)
+    from app.database import Base, SessionLocal, engine
+
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
@@ -0,0 +1,68 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.scheduler import backfill
+from app.sevices.prediction import FEATURES, MODEL_VERSION
+
+
+def _models_dir(tmp_path, **info):
+    (tmp_path / "best_model_info.json").write_text(json.dumps({"features": FEATURES, **info}))
+    return str(tmp_path)
+
+
+def test_default_models_dir_uses_its_own_version():
+    assert backfill.resolve_model_version(None, None) == MODEL_VERSION
+    assert backfill.resolve_model_version(MODEL_VERSION, None) == MODEL_VERSION
+
+
+def test_new_version_label_without_models_dir_is_rejected():
+    with pytest.raises(ValueError):
+        backfill.resolve_model_version("nhits-v2", None)
+
+
+def test_models_dir_version_must_match_label(tmp_path):
+    models_dir = _models_dir(tmp_path, model_version="nhits-v2")
+    assert backfill.resolve_model_version(None, models_dir) == "nhits-v2"
+    assert backfill.resolve_model_version("nhits-v2", models_dir) == "nhits-v2"
+    with pytest.raises(ValueError):
+        backfill.resolve_model_version("nhits-v3", models_dir)
+
+
+def test_models_dir_without_version_requires_label(tmp_path):
+    models_dir = _models_dir(tmp_path)
+    with pytest.raises(ValueError):
+        backfill.resolve_model_version(None, models_dir)
+    assert backfill.resolve_model_version("nhits-v2", models_dir) == "nhits-v2"
+
+
+def test_models_dir_with_other_features_is_rejected(tmp_path):
+    (tmp_path / "best_model_info.json").write_text(json.dumps({"features": ["insolation"], "model_version": "x"}))
+    with pytest.raises(ValueError):
+        backfill.resolve_model_version(None, str(tmp_path))
+
+
+def test_checkpoint_is_tied_to_models_dir(tmp_path):
+    path = str(tmp_path / "ckpt.json")
+    params = {"model_version": "nhits-v2", "models_dir": "/models/v2"}
+    backfill._save_checkpoint(path, params, date(2024, 1, 3))
+
+    assert backfill._load_checkpoint(path, params) == date(2024, 1, 3)
+    assert backfill._load_checkpoint(path, {**params, "models_dir": "/models/v3"}) is None
+
+
+def test_start_older_than_forecast_retention_is_rejected(monkeypatch):
+    from app import partitioning
+    from app.scheduler import jobs
+
+    monkeypatch.setattr(partitioning, "PARTITIONING_ENABLED", True)
+    monkeypatch.setattr(backfill, "is_partitioned", lambda engine, table: True)
+    old = date.today().replace(day=1) - timedelta(days=400)
+
+    backfill.check_retention(old)  # 보관 기간 미설정: 삭제하지 않으므로 허용
+
+    monkeypatch.setitem(jobs.PARTITION_RETENTION_DAYS, "FORECAST", 90)
+    with pytest.raises(ValueError, match="FORECAST_RETENTION_DAYS"):
+        backfill.check_retention(old)
+    backfill.check_retention(date.today() - timedelta(days=30))
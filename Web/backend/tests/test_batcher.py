@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.sevices.batcher import AsyncMicroBatcher
+
+
+def _double(items):
+    return [i * 2 for i in items]
+
+
+def test_batches_concurrent_requests_in_order():
+    calls = []
+
+    def handler(items):
+        calls.append(list(items))
+        return _double(items)
+
+    async def main():
+        batcher = AsyncMicroBatcher(handler, max_batch=4, max_wait_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(6)))
+        await batcher.close()
+        return results
+
+    assert asyncio.run(main()) == [0, 2, 4, 6, 8, 10]
+    assert [len(c) for c in calls] == [4, 2]
+
+
+def test_handler_error_fails_only_that_batch():
+    def handler(items):
+        if 1 in items:
+            raise ValueError("boom")
+        return _double(items)
+
+    async def main():
+        batcher = AsyncMicroBatcher(handler, max_batch=1, max_wait_ms=1)
+        with pytest.raises(ValueError):
+            await batcher.submit(1)
+        result = await batcher.submit(2)
+        await batcher.close()
+        return result
+
+    assert asyncio.run(main()) == 4
+
+
+def test_restart_keeps_queued_requests():
+    async def main():
+        batcher = AsyncMicroBatcher(_double, max_batch=4, max_wait_ms=1)
+        assert await batcher.submit(1) == 2
+
+        # 루프 태스크가 죽은 뒤 큐에 남아 있던 요청도 재시작 후 처리되어야 함
+        batcher._task.cancel()
+        await asyncio.sleep(0)
+        queue = batcher._queue
+        stranded = asyncio.get_running_loop().create_future()
+        queue.put_nowait((5, stranded))
+
+        fresh = await asyncio.wait_for(batcher.submit(7), timeout=1)
+        stranded_result = await asyncio.wait_for(stranded, timeout=1)
+        await batcher.close()
+        return fresh, stranded_result, batcher._queue is queue
+
+    assert asyncio.run(main()) == (14, 10, True)
+
+
+def test_close_fails_pending_requests():
+    async def main():
+        batcher = AsyncMicroBatcher(_double)
+        batcher._ensure_started()
+        await batcher.close()
+        pending = asyncio.get_running_loop().create_future()
+        batcher._queue.put_nowait((1, pending))
+        await batcher.close()
+        with pytest.raises(RuntimeError):
+            await pending
+
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.models import Plant, RealtimeGeneration, Weather
+from app.scheduler import jobs
+from app.sevices.context_buffer import ContextStore
+from app.sevices.prediction import build_forecast_inputs
+from app.weather_service import sky_to_cloud_percent
+
+
+class _ObservationArchive:
+    """실황 운량 70% 를 돌려주는 InputArchive 대역"""
+    calls = 0
+
+    def current(self, lat, lon):
+        return {"temperature": 20.0, "humidity": 50.0, "cloud": 70.0}, {"ghi": 400.0}
+
+    def flush(self, db):
+        return 0
+
+
+def _forecast_cloud():
+    """3일 예보 입력의 운량 (단기예보 SKY=구름많음)"""
+    ts = "2025-06-21T12:00:00+09:00"
+    inputs = build_forecast_inputs(
+        [{"timestamp": ts, "temperature": 20.0, "humidity": 50.0, "cloud": sky_to_cloud_percent(3)}],
+        [{"time": "2025-06-21T12:00", "ghi": 400.0}],
+    )
+    return inputs["cloud"][0]
+
+
+def test_realtime_history_and_future_cloud_share_the_forecast_scale(db, monkeypatch):
+    db.add(Plant(id=1, name="p1", capacity_mw=10.0, latitude=33.5, longitude=126.5))
+    db.commit()
+
+    store = ContextStore(capacity=48)
+    requests = []
+
+    def fake_predict_batch(batch):
+        requests.extend(batch)
+        return [{"ds": inputs["ds"], "predicted_power": np.array([5.0])} for inputs, _ in batch]
+
+    monkeypatch.setattr(jobs, "REALTIME_MODE", "model")
+    monkeypatch.setattr(jobs, "InputArchive", _ObservationArchive)
+    monkeypatch.setattr(jobs, "is_daylight", lambda lat, lon, ts: True)
+    monkeypatch.setattr(jobs, "predict_batch", fake_predict_batch)
+    monkeypatch.setattr(jobs, "context_store", store)
+    jobs.realtime_job()
+
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    future_cloud = requests[0][0]["cloud"][0]
+    history_cloud = store.history(1, now)["cloud"][-1]
+
+    assert future_cloud == history_cloud == _forecast_cloud() == 7.0
+    # DB(WEATHER) 에는 조회한 % 그대로 저장
+    assert db.query(Weather).one().cloud_cover == 70.0
+
+
+def test_history_loaded_from_db_uses_forecast_scale(db):
+    db.add(Plant(id=1, name="p1", capacity_mw=10.0, latitude=33.5, longitude=126.5))
+    ts = datetime(2025, 6, 21, 11)
+    db.add(RealtimeGeneration(plant_id=1, timestamp=ts, predicted_power=5.0, cumulative_power=5.0,
+                              model_version="realtime-nhits-v1"))
+    db.add(Weather(plant_id=1, timestamp=ts, temperature=20.0, insolation=400.0, humidity=50.0, cloud_cover=70.0))
+    db.commit()
+
+    store = ContextStore(capacity=48)
+    store.load_from_db(db, now=ts + timedelta(hours=1))
+
+    assert store.history(1, ts)["cloud"][-1] == _forecast_cloud()
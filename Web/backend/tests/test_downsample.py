@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.sevices.downsample import StreamingLTTB, downsample_rows, lttb_indices
+
+
+def test_short_series_is_returned_whole():
+    x = np.arange(10)
+    assert lttb_indices(x, x, 10).tolist() == list(range(10))
+    assert lttb_indices(x, x, 2).tolist() == list(range(10))
+
+
+def test_keeps_endpoints_and_peak():
+    x = np.arange(1000)
+    y = np.zeros(1000)
+    y[437] = 100.0
+    idx = lttb_indices(x, y, 50)
+
+    assert len(idx) == 50
+    assert idx[0] == 0 and idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+    assert 437 in idx
+
+
+def test_nan_values_do_not_break_selection():
+    x = np.arange(200)
+    y = np.sin(x / 10.0)
+    y[50:60] = np.nan
+    idx = lttb_indices(x, y, 20)
+    assert len(idx) == 20 and idx[-1] == 199
+
+
+def test_downsample_rows_returns_original_rows():
+    start = datetime(2025, 6, 1)
+    rows = [SimpleNamespace(timestamp=start + timedelta(hours=h), power=float(h % 24)) for h in range(24 * 30)]
+    out = downsample_rows(rows, "timestamp", "power", 100)
+
+    assert len(out) == 100
+    assert out[0] is rows[0] and out[-1] is rows[-1]
+    assert all(r in rows for r in out)
+
+
+def test_streaming_matches_in_memory_selection():
+    rng = np.random.default_rng(0)
+    start = datetime(2025, 6, 1)
+    rows = [SimpleNamespace(timestamp=start + timedelta(minutes=15 * i), power=float(v))
+            for i, v in enumerate(rng.normal(size=5000).cumsum())]
+    rows[777].power = None
+
+    lttb = StreamingLTTB(len(rows), 120, "timestamp", "power")
+    for chunk_pass in (lttb.feed_means, lttb.feed_select):
+        for i in range(0, len(rows), 333):
+            chunk_pass(rows[i:i + 333])
+
+    assert lttb.finish() == downsample_rows(rows, "timestamp", "power", 120)
+
+
+def test_history_endpoint_streams_downsampling_and_keeps_full_range_by_default(db, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app import crud_async, main
+    from app.models import Generation, Plant
+
+    start = datetime(2025, 6, 1)
+    db.add(Plant(id=1, name="p1", latitude=33.5, longitude=126.5))
+    db.add_all([Generation(plant_id=1, timestamp=start + timedelta(hours=h), actual_power=float(h % 24))
+                for h in range(1500)])
+    db.commit()
+    monkeypatch.setattr(crud_async, "STREAM_CHUNK_ROWS", 100)
+    client = TestClient(main.app)
+    params = {"start": start.isoformat(), "end": (start + timedelta(hours=1499)).isoformat()}
+
+    full = client.get("/generation/history/1", params=params)
+    assert len(full.json()) == 1500 and "X-Next-Cursor" not in full.headers
+
+    page = client.get("/generation/history/1", params={**params, "limit": 1000})
+    assert len(page.json()) == 1000 and page.headers["X-Next-Cursor"]
+
+    sampled = client.get("/generation/history/1", params={**params, "max_points": 100}).json()
+    rows = db.query(Generation.timestamp, Generation.actual_power).order_by(Generation.timestamp).all()
+    expected = downsample_rows(rows, "timestamp", "actual_power", 100)
+    assert [r["timestamp"] for r in sampled] == [r.timestamp.isoformat() for r in expected]
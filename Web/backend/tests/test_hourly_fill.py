@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+from app import crud
+from app.sevices.columnar import fill_hourly
+from app.sevices.solar_position import daylight_mask, hourly_daylight, is_daylight
+
+# 제주 (KST 기준 6월 일출 ~05:30, 일몰 ~19:40)
+LAT, LON = 33.5, 126.5
+DAY = datetime(2025, 6, 21)
+
+
+def _at(hour):
+    return DAY + timedelta(hours=hour)
+
+
+def _realtime(hour, power, cumulative):
+    return SimpleNamespace(
+        id=hour, timestamp=_at(hour), predicted_power=power,
+        cumulative_power=cumulative, model_version="realtime-nhits-v1",
+    )
+
+
+def test_daylight_mask_marks_night_and_noon():
+    ds = np.array([_at(0), _at(12), _at(23)], dtype="datetime64[s]")
+    assert daylight_mask(LAT, LON, ds).tolist() == [False, True, False]
+    assert is_daylight(LAT, LON, _at(12))
+
+
+def test_hourly_daylight_without_coordinates_is_all_day():
+    assert hourly_daylight(None, None, _at(0), _at(3)).tolist() == [True, True, True]
+
+
+def test_realtime_fill_zeroes_night_and_nulls_daytime_gaps():
+    # 10시 실행 실패 → 낮 누락
+    rows = [_realtime(9, 5.0, 10.0), _realtime(11, 6.0, 22.0)]
+    filled = crud.fill_realtime_generations(rows, 1, _at(0), _at(12), LAT, LON)
+
+    by_hour = {r["timestamp"].hour: r for r in filled}
+    assert len(filled) == 12
+    assert by_hour[2]["predicted_power"] == 0.0 and by_hour[2]["cumulative_power"] == 0.0
+    assert by_hour[9]["predicted_power"] == 5.0
+    assert by_hour[10]["predicted_power"] is None and by_hour[10]["cumulative_power"] is None
+    assert by_hour[11]["cumulative_power"] == 22.0
+    # 해 뜬 뒤 첫 기록 전(서버 늦게 시작)도 누락
+    assert by_hour[7]["predicted_power"] is None
+
+
+def test_forecast_fill_keeps_daytime_gap_as_null():
+    # 예측이 정오부터 시작된 경우
+    rows = [SimpleNamespace(id=1, forecast_time=_at(12), predicted_power=30.0)]
+    filled = crud.fill_hourly_forecasts(rows, 1, _at(0), _at(24), "nhits-v1", LAT, LON)
+
+    values = [r["predicted_power"] for r in filled]
+    assert values[0] == 0.0 and values[23] == 0.0
+    assert values[10] is None
+    assert values[12] == 30.0
+    assert values[14] is None
+
+
+def test_columnar_fill_matches_row_fill():
+    rows = [(_at(9), 5.0, 10.0), (_at(20), 0.5, 50.0)]
+    columns = fill_hourly(
+        rows, ["timestamp", "predicted_power", "cumulative_power"],
+        _at(0), _at(24), LAT, LON, carry_forward=["cumulative_power"],
+    )
+
+    assert columns["predicted_power"][1] == 0.0
+    assert columns["predicted_power"][9] == 5.0
+    assert columns["predicted_power"][13] is None
+    assert columns["cumulative_power"][13] is None
+    # 밤 시각은 직전 누적값 유지
+    assert columns["cumulative_power"][23] == 50.0
@@ -0,0 +1,20 @@
+import pytest
+
+from app.sevices import inference_worker
+
+
+def test_client_requires_authkey(monkeypatch):
+    monkeypatch.setattr(inference_worker, "WORKER_AUTHKEY", None)
+    with pytest.raises(ValueError):
+        inference_worker.InferenceClient(("127.0.0.1", 6010))
+
+
+def test_client_uses_configured_authkey(monkeypatch):
+    monkeypatch.setattr(inference_worker, "WORKER_AUTHKEY", "secret")
+    client = inference_worker.InferenceClient(("127.0.0.1", 6010))
+    assert client.authkey == b"secret"
+
+
+def test_parse_address():
+    assert inference_worker.parse_address("10.0.0.1:7000") == ("10.0.0.1", 7000)
+    assert inference_worker.parse_address(":7000") == ("127.0.0.1", 7000)
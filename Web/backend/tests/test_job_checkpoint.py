@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import requests
+
+from app import crud
+from app.models import JobCheckpoint, Plant
+from app.scheduler import jobs
+
+HOURS = 72
+
+
+class _Archive:
+    """failing 에 든 발전소는 예보 조회 실패 응답을 돌려주는 InputArchive 대역"""
+    failing = set()
+    raising = set()
+    calls = 0
+
+    def forecast(self, lat, lon):
+        plant_id = int(round((lat - 33.0) * 100))
+        if plant_id in self.raising:
+            raise requests.Timeout(f"timed out for {plant_id}")
+        if plant_id in self.failing:
+            return {"error": True, "message": "NO_DATA"}, {}
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        hours = [start + timedelta(hours=h) for h in range(HOURS)]
+        wf = {"forecast": [
+            {"timestamp": f"{ts.isoformat()}+09:00", "temperature": 20.0, "humidity": 60.0, "cloud": 3.0}
+            for ts in hours
+        ]}
+        sf = {"forecast": [{"time": ts.strftime("%Y-%m-%dT%H:%M"), "ghi": 500.0} for ts in hours]}
+        return wf, sf
+
+    def flush(self, db):
+        return 0
+
+
+def _fake_predict_batch(requests):
+    return [{"ds": inputs["ds"], "predicted_power": np.full(len(inputs["ds"]), 10.0)} for inputs, _ in requests]
+
+
+@pytest.fixture
+def forecast_env(db, monkeypatch):
+    """발전소 5곳, 청크 2곳, 저장된 발전소 순서를 기록"""
+    db.add_all([
+        Plant(id=i, name=f"p{i}", capacity_mw=10.0, latitude=33.0 + i / 100, longitude=126.5)
+        for i in range(1, 6)
+    ])
+    db.commit()
+
+    chunks = jobs._chunks
+    stored = []
+    store = jobs._store_plant_forecast
+
+    def record_store(db_, plant, inputs, preds):
+        if plant.id in record_store.failing:
+            raise RuntimeError(f"store failed for {plant.id}")
+        stored.append(plant.id)
+        store(db_, plant, inputs, preds)
+    record_store.failing = set()
+
+    _Archive.failing = set()
+    _Archive.raising = set()
+    monkeypatch.setattr(jobs, "PREDICTION_MODE", "plant")
+    monkeypatch.setattr(jobs, "InputArchive", _Archive)
+    monkeypatch.setattr(jobs, "predict_batch", _fake_predict_batch)
+    monkeypatch.setattr(jobs, "_chunks", lambda n, size=2: chunks(n, 2))
+    monkeypatch.setattr(jobs, "_store_plant_forecast", record_store)
+    return stored, record_store
+
+
+def _checkpoint(db):
+    db.expire_all()
+    return db.query(JobCheckpoint).one()
+
+
+def test_resume_retries_failed_fetches_and_uncommitted_plants(db, forecast_env):
+    stored, store = forecast_env
+
+    # 1회차: 2번 예보 조회 실패, 4번 저장 중 중단 → [1, 3] 청크만 커밋
+    _Archive.failing = {2}
+    store.failing = {4}
+    jobs.forecast_3day_job()
+
+    checkpoint = _checkpoint(db)
+    assert stored == [1, 3]
+    assert checkpoint.status == "running"
+    assert checkpoint.last_plant_id == 3
+    assert crud.checkpoint_failed_ids(checkpoint) == {2}
+
+    # 2회차: 커밋된 1, 3 은 건너뛰고 실패한 2 와 남은 4, 5 를 처리
+    _Archive.failing = set()
+    store.failing = set()
+    stored.clear()
+    jobs.forecast_3day_job()
+
+    checkpoint = _checkpoint(db)
+    assert stored == [2, 4, 5]
+    assert checkpoint.status == "done"
+    assert checkpoint.last_plant_id == 5
+    assert checkpoint.failed_plant_ids is None
+
+
+def test_partial_run_retries_only_failed_plants(db, forecast_env):
+    stored, _ = forecast_env
+
+    _Archive.failing = {4}
+    jobs.forecast_3day_job()
+    checkpoint = _checkpoint(db)
+    assert stored == [1, 2, 3, 5]
+    assert checkpoint.status == "partial"
+    assert crud.checkpoint_failed_ids(checkpoint) == {4}
+
+    _Archive.failing = set()
+    stored.clear()
+    jobs.forecast_3day_job()
+    assert stored == [4]
+    assert _checkpoint(db).status == "done"
+
+
+def test_done_run_is_recomputed_from_scratch(db, forecast_env):
+    stored, _ = forecast_env
+
+    jobs.forecast_3day_job()
+    stored.clear()
+    jobs.forecast_3day_job()
+    assert stored == [1, 2, 3, 4, 5]
+
+
+def test_fetch_exception_fails_only_that_plant(db, forecast_env):
+    stored, _ = forecast_env
+
+    _Archive.raising = {2}
+    jobs.forecast_3day_job()
+
+    checkpoint = _checkpoint(db)
+    assert stored == [1, 3, 4, 5]
+    assert checkpoint.status == "partial"
+    assert crud.checkpoint_failed_ids(checkpoint) == {2}
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+import numpy as np
+
+from app.sevices import nowcast
+
+
+def _hours(start, n):
+    return np.array([np.datetime64(start, "ns") + np.timedelta64(h, "h") for h in range(n)])
+
+
+def test_register_baseline_masks_hours_missing_from_inputs():
+    # 입력은 3시간, 예측은 5시간 → 입력 범위 밖 시각은 NaN
+    inputs = {
+        "ds": _hours(datetime(2025, 6, 1, 10), 3),
+        "insolation": np.array([300.0, 400.0, 500.0]),
+        "cloud": np.array([2.0, 3.0, 4.0]),
+    }
+    preds = {"ds": _hours(datetime(2025, 6, 1, 10), 5), "predicted_power": np.arange(5, dtype=float)}
+    nowcast.register_baseline(9001, inputs, preds)
+
+    hit = nowcast.lookup_baselines([9001], datetime(2025, 6, 1, 11))
+    assert hit.tolist() == [[1.0, 400.0, 30.0]]
+
+    beyond = nowcast.lookup_baselines([9001], datetime(2025, 6, 1, 14))
+    assert beyond[0, 0] == 4.0 and np.isnan(beyond[0, 1:]).all()
+
+    missing = nowcast.lookup_baselines([9001, 9002], datetime(2025, 6, 2, 0))
+    assert np.isnan(missing).all()
+
+
+def test_nowcast_scales_by_ghi_ratio_within_threshold():
+    corrected, rerun = nowcast.nowcast(
+        base_power=np.array([10.0]), base_ghi=np.array([500.0]), base_cloud=np.array([30.0]),
+        obs_ghi=np.array([600.0]), obs_cloud=np.array([40.0]),
+    )
+    assert corrected.tolist() == [12.0]
+    assert rerun.tolist() == [False]
+
+
+def test_nowcast_flags_large_deviations_for_rerun():
+    corrected, rerun = nowcast.nowcast(
+        base_power=np.array([10.0, 10.0, 0.0, np.nan]),
+        base_ghi=np.array([500.0, 500.0, 0.0, 500.0]),
+        base_cloud=np.array([30.0, 30.0, 100.0, 30.0]),
+        obs_ghi=np.array([100.0, 500.0, 200.0, 500.0]),   # 일사량 급감 / 그대로 / 밤→낮 / 기준선 없음
+        obs_cloud=np.array([30.0, 90.0, 20.0, 30.0]),     # 운량 급증은 두 번째
+    )
+    assert rerun.tolist() == [True, True, True, True]
+    assert corrected[2] == 0.0
+
+
+def test_seed_baselines_from_stored_forecast_and_archived_inputs(db, monkeypatch):
+    from datetime import timedelta
+
+    from app import crud
+    from app.models import Plant
+    from app.scheduler import jobs
+    from app.sevices.input_archive import kma_grid, open_meteo_grid
+
+    # 프로세스가 재시작되어 메모리 기준선이 비어 있는 상황
+    monkeypatch.setattr(nowcast, "_baselines", {})
+    db.add_all([
+        Plant(id=1, name="p1", capacity_mw=10.0, latitude=33.5, longitude=126.5),
+        Plant(id=2, name="p2", capacity_mw=10.0, latitude=33.5, longitude=126.5),   # 저장된 예측 없음
+    ])
+    day = datetime(2025, 6, 21)
+    hours = [day + timedelta(hours=h) for h in range(72)]
+    crud.upsert_weather_inputs(db, [
+        {"source": "kma_fcst", "grid": kma_grid(33.5, 126.5), "base_time": day - timedelta(hours=1),
+         "forecast_time": ts, "temperature": 25.0, "humidity": 60.0, "cloud": 3.0, "insolation": None}
+        for ts in hours
+    ] + [
+        {"source": "openmeteo", "grid": open_meteo_grid(33.5, 126.5), "base_time": day,
+         "forecast_time": ts, "temperature": None, "humidity": None, "cloud": None, "insolation": 400.0}
+        for ts in hours
+    ])
+    # 낮 시간대만 저장 (14시는 저장 누락)
+    crud.bulk_insert_hourly_forecasts(
+        db, plant_id=1,
+        forecast_times=np.array([np.datetime64(day.replace(hour=h), "ns") for h in range(7, 19) if h != 14]),
+        predicted_powers=np.full(11, 5.0),
+        model_version="nhits-v1",
+    )
+    db.commit()
+
+    plants = db.query(Plant).order_by(Plant.id).all()
+    jobs._seed_baselines(db, plants, day.replace(hour=12))
+
+    assert nowcast.lookup_baselines([1], day.replace(hour=12)).tolist() == [[5.0, 400.0, 30.0]]
+    assert nowcast.lookup_baselines([1], day.replace(hour=23))[0, 0] == 0.0        # 밤
+    assert np.isnan(nowcast.lookup_baselines([1], day.replace(hour=14))[0, 0])     # 저장 누락 → 재실행
+    assert np.isnan(nowcast.lookup_baselines([2], day.replace(hour=12))).all()
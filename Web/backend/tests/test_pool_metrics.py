@@ -0,0 +1,42 @@
+from sqlalchemy import create_engine, text
+
+from app.pool_metrics import InstrumentedQueuePool, PoolMetrics
+
+
+def _engine(tmp_path, **kwargs):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+        pool_size=2, max_overflow=1, **kwargs,
+    )
+
+
+def test_checkout_and_saturation(tmp_path):
+    engine = _engine(tmp_path)
+    metrics = PoolMetrics("test")
+    metrics.attach(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        snap = metrics.snapshot()
+        assert snap["checked_out"] == 1
+        assert snap["saturation"] == round(1 / 3, 3)
+
+    snap = metrics.snapshot()
+    assert snap["checked_out"] == 0
+    assert snap["checkouts"] == 1
+    assert snap["connects"] == 1
+
+
+def test_metrics_follow_recreated_pool(tmp_path):
+    engine = _engine(tmp_path)
+    metrics = PoolMetrics("test")
+    metrics.attach(engine)
+    old_pool = engine.pool
+
+    engine.dispose()  # 새 풀로 교체
+
+    assert engine.pool is not old_pool
+    assert metrics.pool is engine.pool
+    assert engine.pool.metrics is metrics
+    with engine.connect():
+        assert metrics.snapshot()["checked_out"] == 1
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+import requests
+from fastapi.testclient import TestClient
+
+from app import main
+from app.models import Plant
+
+
+class _EchoBatcher:
+    """추론 대신 입력 시각을 그대로 돌려주는 배처"""
+
+    def __init__(self):
+        self.items = []
+
+    async def submit(self, item):
+        inputs, _ = item
+        self.items.append(item)
+        return {"ds": inputs["ds"], "predicted_power": np.zeros(len(inputs["ds"]))}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "predict_batcher", _EchoBatcher())
+    # with 블록 없이 사용 → 시작 이벤트(스케줄러)는 실행하지 않음
+    return TestClient(main.app)
+
+
+def test_weather_timestamps_are_converted_to_kst(client):
+    res = client.post("/predict", json={"weather": [
+        {"datetime": "2025-06-01T03:00:00Z", "irradiance": 500},
+        {"datetime": "2025-06-01T13:00:00+09:00", "irradiance": 400},
+        {"datetime": "2025-06-01T14:00:00", "irradiance": 300},
+    ]})
+
+    assert res.status_code == 200
+    assert res.json()["datetime"] == [
+        "2025-06-01T12:00:00",
+        "2025-06-01T13:00:00",
+        "2025-06-01T14:00:00",
+    ]
+
+
+def test_upstream_connection_error_returns_503(client, db, monkeypatch):
+    db.add(Plant(id=1, name="p1", latitude=33.5, longitude=126.5))
+    db.commit()
+
+    def unreachable(lat, lon):
+        raise requests.ConnectionError("open-meteo down")
+
+    monkeypatch.setattr(main, "get_weather_forecast_3days", lambda lat, lon: {"forecast": []})
+    monkeypatch.setattr(main, "get_3day_irradiance_forecast", unreachable)
+
+    res = client.post("/predict", json={"plant_id": 1})
+    assert res.status_code == 503
+
+
+def test_upstream_timeout_returns_503(client, db, monkeypatch):
+    db.add(Plant(id=1, name="p1", latitude=33.5, longitude=126.5))
+    db.commit()
+
+    def slow(lat, lon):
+        raise requests.Timeout("kma timeout")
+
+    monkeypatch.setattr(main, "get_weather_forecast_3days", slow)
+    monkeypatch.setattr(main, "get_3day_irradiance_forecast", lambda lat, lon: {"forecast": []})
+
+    res = client.post("/predict", json={"plant_id": 1})
+    assert res.status_code == 503
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from app.sevices import prediction
+
+
+def _inputs(start, hours, insolation=500.0):
+    ds = np.array([np.datetime64(start, "ns") + np.timedelta64(h, "h") for h in range(hours)])
+    values = np.full(hours, insolation)
+    return {"ds": ds, "insolation": values, "temp": values, "cloud": values, "humidity": values}
+
+
+def _fake_run_model(calls):
+    """insolation 에 NaN 이 있는 요청이 섞이면 배치 전체가 실패하는 모델 대역"""
+    def run(input_df, futr_df, models_dir=None):
+        calls.append(futr_df["unique_id"].nunique())
+        if futr_df["insolation"].isna().any():
+            raise ValueError("NaN in exogenous input")
+        return pd.DataFrame({"unique_id": futr_df["unique_id"], "ds": futr_df["ds"], "NHITS": 1.0})
+    return run
+
+
+def test_failing_request_does_not_empty_the_batch(monkeypatch):
+    calls = []
+    monkeypatch.setattr(prediction, "_run_model", _fake_run_model(calls))
+
+    start = datetime(2025, 6, 1)
+    requests = [
+        (_inputs(start, 3), None),
+        (_inputs(start, 3, insolation=np.nan), None),
+        (None, None),
+        (_inputs(start, 2), None),
+    ]
+    results = prediction.predict_batch_local(requests)
+
+    assert calls == [3, 1, 1, 1]   # 배치 1회 실패 후 요청별 재시도
+    assert [len(r["ds"]) for r in results] == [3, 0, 0, 2]
+    assert results[0]["predicted_power"].tolist() == [1.0, 1.0, 1.0]
+
+
+def test_healthy_batch_runs_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(prediction, "_run_model", _fake_run_model(calls))
+
+    start = datetime(2025, 6, 1)
+    results = prediction.predict_batch_local([(_inputs(start, 3), None), (_inputs(start, 4), None)])
+
+    assert calls == [2]
+    assert [len(r["ds"]) for r in results] == [3, 4]
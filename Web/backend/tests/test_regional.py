@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.models import Forecast, JobCheckpoint, Plant
+from app.scheduler import jobs
+from app.sevices.regional import REGION_CAPACITY_MW, align_inputs, disaggregate, regional_inputs
+
+INPUT_HOURS = 72
+MODEL_HORIZON = 720
+
+
+def _inputs(start, hours, insolation=500.0):
+    ds = np.array([start + timedelta(hours=h) for h in range(hours)], dtype="datetime64[ns]")
+    return {
+        "ds": ds,
+        "insolation": np.full(hours, insolation),
+        "temp": np.full(hours, 20.0),
+        "cloud": np.full(hours, 3.0),
+        "humidity": np.full(hours, 60.0),
+    }
+
+
+def _long_horizon_model(inputs, history=None):
+    """입력 기간보다 훨씬 긴 horizon(h=720)을 내는 모델 대역"""
+    ds = inputs["ds"][0] + np.arange(MODEL_HORIZON).astype("timedelta64[h]")
+    return {"ds": ds.astype("datetime64[ns]"), "predicted_power": np.full(MODEL_HORIZON, 100.0)}
+
+
+def test_disaggregate_preserves_capacity_share():
+    irradiance = np.array([[100.0, 0.0], [300.0, 0.0]])
+    powers = disaggregate(np.array([263.0, 50.0]), [10.0, 30.0], irradiance)
+
+    # 용량 가중 평균 일사량 대비 비율로 나누므로 합계는 용량 비율 합만큼 보존
+    assert powers[:, 0].sum() == pytest.approx(263.0 * 40.0 / REGION_CAPACITY_MW)
+    # 일사량이 모두 0이면 비율 1 (용량 비율만 적용)
+    assert powers[:, 1] == pytest.approx(50.0 * np.array([10.0, 30.0]) / REGION_CAPACITY_MW)
+
+
+def test_align_inputs_uses_common_hours():
+    start = datetime(2025, 6, 1)
+    stacked = align_inputs([_inputs(start, 5), _inputs(start + timedelta(hours=2), 5)])
+
+    assert len(stacked["ds"]) == 3
+    assert stacked["insolation"].shape == (2, 3)
+    assert regional_inputs(stacked, [1.0, None])["temp"] == pytest.approx([20.0] * 3)
+
+
+def test_predict_regional_trims_horizon_to_input_window(monkeypatch):
+    monkeypatch.setattr(jobs, "predict_72h_power", _long_horizon_model)
+    start = datetime(2025, 6, 1)
+    plants = [Plant(id=1, capacity_mw=10.0), Plant(id=2, capacity_mw=20.0)]
+
+    preds = jobs._predict_regional(plants, [_inputs(start, INPUT_HOURS), _inputs(start, INPUT_HOURS, 250.0)])
+
+    assert len(preds) == 2
+    for p in preds:
+        assert len(p["ds"]) == INPUT_HOURS
+        assert p["predicted_power"].shape == (INPUT_HOURS,)
+    assert preds[0]["predicted_power"][0] > preds[1]["predicted_power"][0] / 2
+
+
+class _FakeArchive:
+    """3일(72시간) 예보 입력만 돌려주는 InputArchive 대역"""
+    calls = 0
+
+    def __init__(self):
+        self.start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def forecast(self, lat, lon):
+        hours = [self.start + timedelta(hours=h) for h in range(INPUT_HOURS)]
+        wf = {"forecast": [
+            {"timestamp": f"{ts.isoformat()}+09:00", "temperature": 20.0, "humidity": 60.0, "cloud": 3.0}
+            for ts in hours
+        ]}
+        sf = {"forecast": [{"time": ts.strftime("%Y-%m-%dT%H:%M"), "ghi": 500.0} for ts in hours]}
+        return wf, sf
+
+    def flush(self, db):
+        return 0
+
+
+def test_forecast_job_region_mode_with_long_horizon(db, monkeypatch):
+    monkeypatch.setattr(jobs, "PREDICTION_MODE", "region")
+    monkeypatch.setattr(jobs, "InputArchive", _FakeArchive)
+    monkeypatch.setattr(jobs, "predict_72h_power", _long_horizon_model)
+    db.add_all([
+        Plant(id=1, name="p1", capacity_mw=10.0, latitude=33.5, longitude=126.5),
+        Plant(id=2, name="p2", capacity_mw=20.0, latitude=33.4, longitude=126.8),
+    ])
+    db.commit()
+
+    jobs.forecast_3day_job()
+
+    for plant_id in (1, 2):
+        rows = db.query(Forecast).filter(Forecast.plant_id == plant_id).all()
+        assert rows, f"no forecast stored for plant {plant_id}"
+        assert max(r.forecast_time for r in rows) < _FakeArchive().start + timedelta(hours=INPUT_HOURS)
+    assert db.query(JobCheckpoint).one().status == "done"
@@ -0,0 +1,162 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+
+from app import crud
+from app.models import Plant, RealtimeGeneration, RealtimeGenerationDaily
+
+# 보관 기간(HOURLY_RETENTION_DAYS)이 지난 날
+DAY = datetime.combine(date.today() - timedelta(days=60), datetime.min.time())
+
+
+def _seed_realtime(db, hours=6, day=DAY, plant=True):
+    if plant:
+        db.add(Plant(id=1, name="p1", latitude=33.5, longitude=126.5))
+    db.add_all([
+        RealtimeGeneration(
+            plant_id=1, timestamp=day + timedelta(hours=h),
+            predicted_power=float(h + 1), cumulative_power=0.0, model_version="realtime-nhits-v1",
+        )
+        for h in range(hours)
+    ])
+    db.commit()
+
+
+def test_crud_deletes_leave_commit_to_the_caller(db):
+    _seed_realtime(db, hours=3)
+
+    ids = crud.get_chunk_ids(db, RealtimeGeneration, RealtimeGeneration.timestamp >= DAY, chunk_size=2)
+    crud.merge_realtime_daily(db, ids)
+    assert crud.delete_by_ids(db, RealtimeGeneration, ids) == 2
+    db.rollback()
+
+    assert db.query(RealtimeGeneration).count() == 3
+    assert db.query(RealtimeGenerationDaily).count() == 0
+
+
+def test_retention_job_folds_and_commits_each_chunk(db, monkeypatch):
+    from app.scheduler import jobs
+
+    _seed_realtime(db, hours=5)
+    monkeypatch.setattr(jobs, "RETENTION_DELETE_CHUNK", 2)
+    commits = []
+    monkeypatch.setattr(jobs, "SessionLocal", lambda: db)
+    monkeypatch.setattr(db, "close", lambda: None)
+    event.listen(db, "after_commit", lambda session: commits.append(session))
+
+    jobs.retention_job()
+
+    daily = db.query(RealtimeGenerationDaily).one()
+    assert (daily.date, daily.total_power, daily.peak_power, daily.hours) == (DAY.date(), 15.0, 5.0, 5)
+    assert db.query(RealtimeGeneration).count() == 0
+    assert len(commits) == 3
+
+
+def test_late_rows_for_a_rolled_up_day_are_added_once(db):
+    from app.scheduler import jobs
+
+    _seed_realtime(db, hours=3)
+    jobs.retention_job()
+
+    # 집계 후 같은 날 행이 늦게 들어옴 (또는 중단된 삭제의 나머지가 아닌 새 행)
+    db.add(RealtimeGeneration(plant_id=1, timestamp=DAY + timedelta(hours=12), predicted_power=10.0,
+                              cumulative_power=0.0, model_version="realtime-nhits-v1"))
+    db.commit()
+    jobs.retention_job()
+    jobs.retention_job()
+
+    db.expire_all()
+    daily = db.query(RealtimeGenerationDaily).one()
+    assert (daily.total_power, daily.peak_power, daily.hours) == (16.0, 10.0, 4)
+    assert db.query(RealtimeGeneration).count() == 0
+
+
+def test_partitioned_rollup_picks_up_late_rows(db, monkeypatch):
+    from sqlalchemy import text
+
+    from app import partitioning
+    from app.database import engine
+    from app.scheduler import jobs
+
+    recent = datetime.combine(date.today() - timedelta(days=1), datetime.min.time())
+    _seed_realtime(db, hours=3)
+    _seed_realtime(db, hours=1, day=recent, plant=False)
+
+    monkeypatch.setattr(partitioning, "PARTITIONING_ENABLED", True)
+    monkeypatch.setattr(jobs, "drop_partitions_before", lambda *args: None)
+    partitioning.convert_to_partitioned(engine, "REALTIME_GENERATION")
+    try:
+        jobs.retention_job()
+        db.add(RealtimeGeneration(plant_id=1, timestamp=DAY + timedelta(hours=12), predicted_power=10.0,
+                                  cumulative_power=0.0, model_version="realtime-nhits-v1"))
+        db.commit()
+        jobs.retention_job()
+
+        db.expire_all()
+        daily = db.query(RealtimeGenerationDaily).one()
+        assert (daily.date, daily.total_power, daily.hours) == (DAY.date(), 16.0, 4)
+        assert crud.get_unrolled_realtime_days(db, date.today()) == [recent.date()]
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS _PARTITIONS"))
+
+
+def _seed_partitioned_history(db, monkeypatch):
+    from app import partitioning
+    from app.database import engine
+    from app.models import Forecast, Generation
+
+    now = datetime.now().replace(minute=0, second=0, microsecond=0)
+    forecasts, generations = [now - timedelta(days=200), now - timedelta(days=1)], [now - timedelta(days=800), now - timedelta(days=100)]
+
+    db.add(Plant(id=1, name="p1", latitude=33.5, longitude=126.5))
+    db.add_all([Forecast(plant_id=1, forecast_time=t, predicted_power=1.0, model_version="nhits-v1") for t in forecasts])
+    db.add_all([Generation(plant_id=1, timestamp=t, actual_power=1.0) for t in generations])
+    db.commit()
+
+    monkeypatch.setattr(partitioning, "PARTITIONING_ENABLED", True)
+    partitioning.convert_to_partitioned(engine, "FORECAST")
+    partitioning.convert_to_partitioned(engine, "GENERATION")
+    return forecasts, generations
+
+
+def _drop_registry():
+    from sqlalchemy import text
+
+    from app.database import engine
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS _PARTITIONS"))
+
+
+def test_retention_job_keeps_forecast_and_generation_partitions_by_default(db, monkeypatch):
+    from app.models import Forecast, Generation
+    from app.scheduler import jobs
+
+    forecasts, generations = _seed_partitioned_history(db, monkeypatch)
+    try:
+        jobs.retention_job()
+
+        assert sorted(f.forecast_time for f in db.query(Forecast).all()) == forecasts
+        assert sorted(g.timestamp for g in db.query(Generation).all()) == generations
+    finally:
+        _drop_registry()
+
+
+def test_retention_job_drops_expired_forecast_and_generation_partitions(db, monkeypatch):
+    from app import partitioning
+    from app.database import engine
+    from app.models import Forecast, Generation
+    from app.scheduler import jobs
+
+    monkeypatch.setitem(jobs.PARTITION_RETENTION_DAYS, "FORECAST", 90)
+    monkeypatch.setitem(jobs.PARTITION_RETENTION_DAYS, "GENERATION", 730)
+    (old_forecast, new_forecast), (old_generation, new_generation) = _seed_partitioned_history(db, monkeypatch)
+    try:
+        jobs.retention_job()
+
+        assert [f.forecast_time for f in db.query(Forecast).all()] == [new_forecast]
+        assert [g.timestamp for g in db.query(Generation).all()] == [new_generation]
+        assert min(partitioning.list_partitions(engine, "FORECAST")) > old_forecast.date()
+    finally:
+        _drop_registry()
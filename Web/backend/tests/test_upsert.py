@@ -0,0 +1,71 @@
+from datetime import datetime
+
+from app import crud
+from app.models import Plant, RealtimeGeneration, Weather
+
+
+def _plant(db):
+    db.add(Plant(id=1, name="p1", capacity_mw=10.0, latitude=33.5, longitude=126.5))
+    db.commit()
+
+
+def test_upsert_realtime_generations_overwrites_on_rerun(db):
+    _plant(db)
+    ts = datetime(2025, 6, 1, 12)
+    crud.upsert_realtime_generations(db, [
+        {"plant_id": 1, "timestamp": ts, "predicted_power": 5.0, "cumulative_power": 20.0, "model_version": "v1"},
+    ])
+    crud.upsert_realtime_generations(db, [
+        {"plant_id": 1, "timestamp": ts, "predicted_power": 7.0, "cumulative_power": 22.0, "model_version": "v1"},
+        {"plant_id": 1, "timestamp": ts, "predicted_power": 1.0, "cumulative_power": 1.0, "model_version": "v2"},
+    ])
+    db.commit()
+
+    rows = {r.model_version: r for r in db.query(RealtimeGeneration).all()}
+    assert len(rows) == 2
+    assert (rows["v1"].predicted_power, rows["v1"].cumulative_power) == (7.0, 22.0)
+
+
+def test_upsert_weathers_updates_values(db):
+    _plant(db)
+    ts = datetime(2025, 6, 1, 12)
+    row = {"plant_id": 1, "timestamp": ts, "temperature": 20.0, "insolation": 500.0, "humidity": 60.0, "cloud_cover": 30.0}
+    crud.upsert_weathers(db, [row])
+    crud.upsert_weathers(db, [{**row, "temperature": 25.0, "cloud_cover": 80.0}])
+    db.commit()
+
+    weather = db.query(Weather).one()
+    assert (weather.temperature, weather.cloud_cover, weather.insolation) == (25.0, 80.0, 500.0)
+
+
+def test_get_today_cumulative_uses_latest_row_before_cutoff(db):
+    _plant(db)
+    crud.upsert_realtime_generations(db, [
+        {"plant_id": 1, "timestamp": datetime(2025, 5, 31, 23), "predicted_power": 0.0, "cumulative_power": 99.0, "model_version": "realtime-nhits-v1"},
+        {"plant_id": 1, "timestamp": datetime(2025, 6, 1, 10), "predicted_power": 3.0, "cumulative_power": 3.0, "model_version": "realtime-nhits-v1"},
+        {"plant_id": 1, "timestamp": datetime(2025, 6, 1, 11), "predicted_power": 4.0, "cumulative_power": 7.0, "model_version": "realtime-nhits-v1"},
+        {"plant_id": 1, "timestamp": datetime(2025, 6, 1, 12), "predicted_power": 5.0, "cumulative_power": 12.0, "model_version": "realtime-nhits-v1"},
+    ])
+    db.commit()
+
+    assert crud.get_today_cumulative(db, [1, 2], datetime(2025, 6, 1, 12)) == {1: 7.0}
+    assert crud.get_today_cumulative(db, [1], datetime(2025, 6, 1, 0)) == {}
+
+
+def test_overlapping_ingests_keep_rollups_equal_to_source(db):
+    from app.models import Generation, GenerationDaily
+    from app.sevices.ingest import GenerationIngestor
+
+    _plant(db)
+    first = "plant_id,timestamp,actual_power\n" + "".join(f"1,2025-06-01T{h:02d}:00:00,{h}\n" for h in range(10))
+    second = "plant_id,timestamp,actual_power\n" + "".join(f"1,2025-06-01T{h:02d}:00:00,1\n" for h in range(5, 15))
+
+    for body in (first, second, second):
+        ingestor = GenerationIngestor(db, "csv", chunk_rows=4)
+        ingestor.feed_lines(body.splitlines())
+        result = ingestor.finish()
+    assert (result["inserted"], result["updated"], result["unchanged"]) == (0, 0, 10)
+
+    day = db.query(GenerationDaily).one()
+    powers = [g.actual_power for g in db.query(Generation).all()]
+    assert (day.total_power, day.min_power, day.max_power, day.count) == (sum(powers), 0.0, 4.0, 15)